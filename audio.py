@@ -0,0 +1,231 @@
+"""
+File: audio.py
+
+Description:
+    Loads the game's audio assets on a background worker so the interface is
+    usable before any sound has been decoded. Sounds are delivered back to
+    the Kivy main thread one by one as they finish loading, and long looping
+    tracks are opened with a streaming backend when one is available instead
+    of being decoded into memory up front. Short sound effects are played
+    through a mixer with a fixed pool of pre-decoded voices per effect.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+import os
+import queue
+import threading
+from functools import partial
+from typing import Callable, Dict
+
+from kivy.clock import Clock
+from kivy.core.audio import SoundLoader
+from kivy.logger import Logger
+
+# Backends that play from the file instead of decoding it fully, in order of preference
+STREAMING_BACKENDS = ("SoundFFPy", "SoundGstplayer", "MusicSDL2")
+
+# Backends that can only stream a single track at a time
+SINGLE_STREAM_BACKENDS = ("MusicSDL2",)
+
+
+class AudioLoader:
+    """
+    Background loader for Kivy sounds.
+
+    Requests are processed in the order they are made by a single daemon
+    worker thread. Each finished sound is handed to its callback on the main
+    thread through the Kivy clock, so callers can use it directly.
+
+    Attributes:
+        pending (int): Number of requests not yet delivered.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize the loader and start its worker thread.
+        """
+        self.pending: int = 0
+        self._queue: "queue.Queue" = queue.Queue()
+        self._single_stream_used = False
+        self._worker = threading.Thread(target=self._run, name="audio-loader", daemon=True)
+        self._worker.start()
+
+    def request(self, path: str, callback: Callable, *, loop: bool = False,
+                vol: float = 1.0, stream: bool = False) -> None:
+        """
+        Queue a sound for loading.
+
+        Args:
+            path (str): Path of the audio file.
+            callback (Callable): Called on the main thread with the loaded sound,
+                or None if it could not be loaded.
+            loop (bool): Whether the sound loops.
+            vol (float): Initial volume, also stored as the sound's `_orig_vol`.
+            stream (bool): Prefer a streaming backend for this sound.
+        """
+        self.pending += 1
+        self._queue.put((path, callback, loop, vol, stream))
+
+    def _run(self) -> None:
+        """
+        Worker loop: load queued sounds and hand them to the main thread.
+        """
+        while True:
+            path, callback, loop, vol, stream = self._queue.get()
+            snd = None
+            try:
+                snd = self._load_streamed(path) if stream else None
+                if snd is None:
+                    snd = SoundLoader.load(path)
+            except Exception as e:
+                Logger.warning(f"AudioLoader: unable to load {path}: {e}")
+            if snd:
+                snd.loop = loop
+                snd.volume = vol
+                snd._orig_vol = vol
+            Clock.schedule_once(lambda dt, c=callback, s=snd: self._deliver(c, s), 0)
+
+    def _deliver(self, callback: Callable, snd) -> None:
+        """
+        Hand a loaded sound to its callback on the main thread.
+        """
+        self.pending -= 1
+        callback(snd)
+
+    def _load_streamed(self, path: str):
+        """
+        Open a sound with a streaming backend, if one supports the file type.
+
+        Args:
+            path (str): Path of the audio file.
+
+        Returns:
+            Sound: The streamed sound, or None if no streaming backend applies.
+        """
+        ext = os.path.splitext(path)[1][1:].lower()
+        backends = {cls.__name__: cls for cls in SoundLoader._classes}
+        for name in STREAMING_BACKENDS:
+            cls = backends.get(name)
+            if cls is None or ext not in cls.extensions():
+                continue
+            if name in SINGLE_STREAM_BACKENDS:
+                if self._single_stream_used:
+                    continue
+                self._single_stream_used = True
+            return cls(source=path)
+        return None
+
+
+class EffectMixer:
+    """
+    Fixed pools of pre-decoded voices for short sound effects.
+
+    Every effect is loaded several times as independent, fully decoded sounds.
+    Triggering an effect plays an idle voice, so overlapping triggers (rapid
+    clicks, repeated whips) sound at once instead of cutting each other off;
+    when every voice is busy the one triggered longest ago is restarted.
+
+    Attributes:
+        muted (bool): Whether effects are currently muted.
+    """
+
+    def __init__(self, loader: AudioLoader) -> None:
+        """
+        Initialize an empty mixer.
+
+        Args:
+            loader (AudioLoader): Loader used to decode the voices in the background.
+        """
+        self.muted: bool = False
+        self._loader = loader
+        self._voices: dict = {}
+        self._next: dict = {}
+
+    def add(self, name: str, path: str, vol: float = 1.0, voices: int = 2) -> None:
+        """
+        Register an effect and queue its voices for loading.
+
+        Args:
+            name (str): Name used to trigger the effect.
+            path (str): Path of the audio file.
+            vol (float): Playback volume of every voice.
+            voices (int): Number of voices that can play simultaneously.
+        """
+        self._voices[name] = []
+        self._next[name] = 0
+        for _ in range(voices):
+            self._loader.request(path, partial(self._on_voice_loaded, name), vol=vol)
+
+    def loaded(self, name: str) -> bool:
+        """
+        Check whether at least one voice of an effect is ready.
+
+        Args:
+            name (str): Effect name.
+
+        Returns:
+            bool: True if the effect can be played.
+        """
+        return bool(self._voices.get(name))
+
+    def play(self, name: str) -> None:
+        """
+        Play an effect on an idle voice, unless effects are muted.
+
+        Args:
+            name (str): Effect name.
+        """
+        voices = self._voices.get(name)
+        if self.muted or not voices:
+            return
+        count = len(voices)
+        start = self._next[name]
+        voice = None
+        for i in range(count):
+            candidate = voices[(start + i) % count]
+            if candidate.state != "play":
+                voice = candidate
+                start = (start + i) % count
+                break
+        if voice is None:
+            # All voices busy: restart the one triggered longest ago
+            voice = voices[start]
+            voice.stop()
+        self._next[name] = (start + 1) % count
+        voice.play()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Summarize the loaded voices for diagnostics.
+
+        Returns:
+            Dict[str, int]: Number of effects and of voices loaded across them.
+        """
+        return {
+            "effects": len(self._voices),
+            "voices": sum(len(v) for v in self._voices.values()),
+        }
+
+    def set_muted(self, muted: bool) -> None:
+        """
+        Mute or unmute every effect, restoring each voice's original volume.
+
+        Args:
+            muted (bool): True to mute effects.
+        """
+        self.muted = muted
+        for voices in self._voices.values():
+            for voice in voices:
+                voice.volume = 0 if muted else voice._orig_vol
+
+    def _on_voice_loaded(self, name: str, snd) -> None:
+        """
+        Add a voice delivered by the loader to its effect's pool.
+        """
+        if not snd:
+            return
+        if self.muted:
+            snd.volume = 0
+        self._voices[name].append(snd)
@@ -0,0 +1,311 @@
+"""
+File: checkpoint.py
+
+Description:
+    Checkpoints the running race every few ticks into a small fixed-layout
+    binary file, so that after a crash or power cut the app resumes the race
+    exactly where it stopped. The file is memory-mapped and holds two slots
+    that are written alternately; each checkpoint is packed straight into
+    the mapping with a precompiled struct and sealed with a CRC, so a
+    checkpoint torn by a crash is detected and the previous slot is used.
+    A background thread flushes the mapping to disk a few times per second.
+
+    Instead of the generator's full internal state, a checkpoint stores the
+    race's seed: the model draws a fixed number of values per tick, so the
+    generator is restored by reseeding it and skipping the draws of the
+    ticks already run. The worker process resumes its races the same way.
+
+    Slot layout (little-endian):
+        crc           uint32     CRC-32 of the rest of the slot
+        seq           uint64     checkpoint number; the highest valid one wins
+        phase         uint8      IDLE, RUNNING or DECIDED
+        bet horse     uint8      0 without a bet
+        winner        uint8      0 while undecided
+        leader        uint8      0 before the first tick
+        order         uint8[n]   finishing order so far, 0 padded
+        balance       float64
+        bet amount    float64
+        cash-out      float64    NaN unless the bet was cashed out
+        finish x      float64
+        race ticks    uint32
+        winning tick  uint32
+        race seed     uint64
+        positions     float64[n]
+        speeds        float64[n]
+        start speeds  float64[n]
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+import math
+import mmap
+import os
+import struct
+import threading
+import zlib
+from typing import NamedTuple, Optional, Tuple
+
+from kivy.logger import Logger
+
+from events import CashedOut, PositionsTick, RaceSettled, RaceStarted, WinnerDecided
+from model import Bet, GameState
+
+# Race phases stored in a checkpoint
+IDLE, RUNNING, DECIDED = 0, 1, 2
+
+_CRC = struct.Struct("<I")
+
+
+class CheckpointState(NamedTuple):
+    """
+    Race state read back from a checkpoint.
+
+    Attributes:
+        phase (int): RUNNING or DECIDED.
+        bet (Optional[Tuple[int, float, Optional[float]]]): Horse, amount and
+            cash-out value of the bet, if any.
+        winner (Optional[int]): The winner, once decided.
+        leader (Optional[int]): The leading horse.
+        finish_order (Tuple[int, ...]): Horses that have finished, in order.
+        balance (float): Balance at the checkpoint.
+        finish_x (float): Finish line of the race.
+        race_ticks (int): Ticks the race had run.
+        winning_tick (int): Tick the winner finished on.
+        race_seed (int): Seed of the race's generator.
+        positions (Tuple[float, ...]): Horse positions.
+        speeds (Tuple[float, ...]): Horse speeds.
+        start_speeds (Tuple[float, ...]): Speeds assigned at the start.
+    """
+    phase: int
+    bet: Optional[Tuple[int, float, Optional[float]]]
+    winner: Optional[int]
+    leader: Optional[int]
+    finish_order: Tuple[int, ...]
+    balance: float
+    finish_x: float
+    race_ticks: int
+    winning_tick: int
+    race_seed: int
+    positions: Tuple[float, ...]
+    speeds: Tuple[float, ...]
+    start_speeds: Tuple[float, ...]
+
+    def apply(self, model: GameState) -> None:
+        """
+        Restore the race into a game state.
+
+        Args:
+            model (GameState): The game state; its balance is left alone, as
+                the ledger is authoritative for money.
+        """
+        if self.bet is not None:
+            horse, amount, cash_out = self.bet
+            model.bet = Bet(horse, amount)
+            model.bet.cash_out = cash_out
+        model.winner = self.winner
+        model.leader = self.leader
+        model.finish_order = list(self.finish_order)
+        model.finish_x = self.finish_x
+        model.race_ticks = self.race_ticks
+        model.winning_tick = self.winning_tick
+        model.start_speeds = list(self.start_speeds)
+        model.positions[:] = self.positions
+        model.speeds[:] = self.speeds
+        model.resume_race(self.race_seed, self.race_ticks)
+
+
+class Checkpoint:
+    """
+    Double-buffered, memory-mapped race checkpoint.
+
+    Attributes:
+        path (str): The checkpoint file.
+        every (int): Ticks between checkpoints of a running race.
+    """
+
+    def __init__(self, path: str, num_horses: int = 6, every: int = 6,
+                 sync_interval: float = 0.2) -> None:
+        """
+        Open or create the checkpoint file and start the flusher.
+
+        Args:
+            path (str): The checkpoint file; its directory is created if missing.
+            num_horses (int): Number of horses per race.
+            every (int): Ticks between checkpoints of a running race.
+            sync_interval (float): Seconds between flushes to disk.
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path: str = path
+        self.every: int = every
+        self._n = num_horses
+        self._struct = struct.Struct(f"<IQBBBB{num_horses}BddddIIQ{3 * num_horses}d")
+        self._size = self._struct.size
+        self._padding = (0,) * num_horses
+
+        with open(path, "a+b") as f:
+            if os.path.getsize(path) != 2 * self._size:
+                f.truncate(0)
+                f.write(bytes(2 * self._size))
+                f.flush()
+            self._mm = mmap.mmap(f.fileno(), 2 * self._size)
+        view = memoryview(self._mm)
+        # Slot bodies are sliced once so sealing a checkpoint allocates no view
+        self._bodies = [view[i * self._size + 4:(i + 1) * self._size] for i in (0, 1)]
+        view.release()
+
+        self._model: Optional[GameState] = None
+        self._last_tick = 0
+        self._seq = 0
+        latest = self._latest()
+        if latest is not None:
+            self._seq = latest[1]
+
+        self._dirty = threading.Event()
+        self._closed = threading.Event()
+        self._sync_interval = sync_interval
+        self._flusher = threading.Thread(target=self._run, name="checkpoint", daemon=True)
+        self._flusher.start()
+
+    def load(self) -> Optional[CheckpointState]:
+        """
+        Read the latest intact checkpoint of an unfinished race.
+
+        Returns:
+            Optional[CheckpointState]: The race, or None if no race was in progress.
+        """
+        fields = self._latest()
+        if fields is None:
+            return None
+        n = self._n
+        phase = fields[2]
+        if phase == IDLE:
+            return None
+        bet_horse, winner, leader = fields[3], fields[4], fields[5]
+        order = tuple(h for h in fields[6:6 + n] if h)
+        balance, amount, cash_out, finish_x, ticks, winning_tick, seed = fields[6 + n:13 + n]
+        floats = fields[13 + n:]
+        return CheckpointState(
+            phase=phase,
+            bet=(bet_horse, amount, None if math.isnan(cash_out) else cash_out) if bet_horse else None,
+            winner=winner or None,
+            leader=leader or None,
+            finish_order=order,
+            balance=balance,
+            finish_x=finish_x,
+            race_ticks=ticks,
+            winning_tick=winning_tick,
+            race_seed=seed,
+            positions=floats[:n],
+            speeds=floats[n:2 * n],
+            start_speeds=floats[2 * n:],
+        )
+
+    def attach(self, model: GameState) -> None:
+        """
+        Checkpoint a game state's races from its events.
+
+        Args:
+            model (GameState): The game state to checkpoint.
+        """
+        self._model = model
+        events = model.events
+        events.subscribe(RaceStarted, self._on_race_started)
+        events.subscribe(PositionsTick, self._on_positions)
+        events.subscribe(WinnerDecided, self._on_winner)
+        events.subscribe(CashedOut, lambda event: self.write(self._phase()))
+        events.subscribe(RaceSettled, lambda event: self.write(IDLE))
+
+    def write(self, phase: int) -> None:
+        """
+        Checkpoint the attached game state into the older slot.
+
+        Args:
+            phase (int): IDLE, RUNNING or DECIDED.
+        """
+        if self._closed.is_set():
+            return
+        m = self._model
+        bet = m.bet
+        order = m.finish_order
+        self._seq += 1
+        slot = self._seq & 1
+        offset = slot * self._size
+        self._struct.pack_into(
+            self._mm, offset, 0, self._seq, phase,
+            bet.horse_number if bet else 0, m.winner or 0, m.leader or 0,
+            *order, *self._padding[len(order):],
+            m.balance, bet.amount if bet else 0.0,
+            bet.cash_out if bet and bet.cash_out is not None else math.nan,
+            m.finish_x, m.race_ticks, m.winning_tick, m.race_seed,
+            *m.positions, *m.speeds,
+            *(m.start_speeds or self._padding),
+        )
+        _CRC.pack_into(self._mm, offset, zlib.crc32(self._bodies[slot]))
+        self._last_tick = m.race_ticks
+        self._dirty.set()
+
+    def clear(self) -> None:
+        """
+        Record that no race is in progress.
+        """
+        if self._model is not None:
+            self.write(IDLE)
+
+    def close(self) -> None:
+        """
+        Flush the checkpoint to disk and unmap it.
+        """
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._dirty.set()
+        self._flusher.join()
+        for body in self._bodies:
+            body.release()
+        self._mm.close()
+
+    def _phase(self) -> int:
+        return RUNNING if self._model.winner is None else DECIDED
+
+    def _on_race_started(self, event: RaceStarted) -> None:
+        self._last_tick = 0
+        self.write(RUNNING)
+
+    def _on_winner(self, event: WinnerDecided) -> None:
+        # A race without a bet has nothing left to settle
+        self.write(DECIDED if self._model.bet is not None else IDLE)
+
+    def _on_positions(self, event: PositionsTick) -> None:
+        if self._model.race_ticks - self._last_tick >= self.every and self._model.winner is None:
+            self.write(RUNNING)
+
+    def _latest(self) -> Optional[tuple]:
+        """
+        Unpack the intact slot with the highest checkpoint number.
+        """
+        best = None
+        for slot in (0, 1):
+            fields = self._struct.unpack_from(self._mm, slot * self._size)
+            if fields[1] == 0 or fields[0] != zlib.crc32(self._bodies[slot]):
+                continue
+            if best is None or fields[1] > best[1]:
+                best = fields
+        return best
+
+    def _run(self) -> None:
+        """
+        Flusher thread: write dirty pages of the mapping to disk periodically.
+        """
+        while not self._closed.is_set():
+            self._dirty.wait()
+            self._dirty.clear()
+            try:
+                self._mm.flush()
+            except (OSError, ValueError) as e:
+                Logger.error(f"Checkpoint: unable to flush {self.path}: {e}")
+            self._closed.wait(self._sync_interval)
+        try:
+            self._mm.flush()
+        except (OSError, ValueError):
+            pass
@@ -10,8 +10,16 @@ Version: 1.0
 Author: Robbe de Guytenaer, Bernardo José Willis Lozano
 """
 
+import time
+from typing import Optional, Tuple
+
 from kivy.clock import Clock
+from events import (
+    BalanceChanged, LeaderChanged, OddsUpdated, PositionsTick, SettingChanged, WinnerDecided
+)
 from model import GameState
+from odds import OddsQuoter, win_probabilities
+from simulation import SimulationProcess
 
 
 class GameController:
@@ -20,7 +28,8 @@ class GameController:
     Manages interactions between the game state (model) and the user interface (view).
     """
 
-    def __init__(self, model: GameState, view) -> None:
+    def __init__(self, model: GameState, view,
+                 simulation: Optional[SimulationProcess] = None) -> None:
         """
         Initialize the controller with a model and view, bind controller to view,
         and display the initial balance.
@@ -28,33 +37,65 @@ class GameController:
         Args:
             model (GameState): The game state instance.
             view: The GameView instance.
+            simulation (Optional[SimulationProcess]): Worker process running the
+                race simulation; if omitted, races are simulated in-process.
         """
         self.model = model
         self.view = view
+        self.simulation = simulation
         self.view.controller = self
 
+        # Let the view follow the model's changes
+        events = self.model.events
+        events.subscribe(PositionsTick, self.view.on_positions)
+        events.subscribe(LeaderChanged, self.view.on_leader_changed)
+        events.subscribe(BalanceChanged, lambda event: self.view.update_balance(event.balance))
+        events.subscribe(WinnerDecided, self._on_winner)
+        events.subscribe(OddsUpdated, self.view.on_odds)
+
+        # Live odds and cash-out quotes while a race is running
+        self.odds = OddsQuoter(self.model)
+
+        # Set by a RaceScheduler when races run back to back
+        self.scheduler = None
+        self.next_odds: Optional[Tuple[float, ...]] = None
+
+        # Set to a metrics ring to record how long settling each race takes
+        self.settlement_times = None
+
         # Display starting balance
         self.view.update_balance(self.model.balance)
 
     def place_bet(self, horse_number: int, amount: float) -> None:
         """
-        Handle user placing a bet: validate and store the bet in the model, capture
-        horses' starting positions, hide betting controls, initialize race speeds,
-        and start the race animation.
+        Handle user placing a bet: validate and store the bet in the model and,
+        unless races are scheduled, start the race right away.
 
         Args:
             horse_number (int): Number of the horse being bet on.
             amount (float): Amount of money wagered.
 
         Raises:
-            ValueError: If the bet is invalid (e.g., insufficient balance).
+            ValueError: If the bet is invalid (e.g., insufficient balance) or
+                betting on the scheduled race has closed.
         """
         try:
+            if self.scheduler is not None and self.scheduler.phase != "betting":
+                raise ValueError("Betting is closed")
             self.model.place_bet(horse_number, amount)
         except ValueError as e:
             self.view.show_bet_error(str(e))
             raise
 
+        # In timed mode the scheduler starts the race when betting closes
+        if self.scheduler is None:
+            self.start_race()
+
+    def start_race(self) -> None:
+        """
+        Capture the horses' starting positions, hide betting controls,
+        initialize race speeds, and start the race animation.
+        """
         # Record each horse widget's x-coordinate as its starting position
         for horse_widget in self.view.track.horses:
             horse_model = self.model.horses[horse_widget.number - 1]
@@ -64,53 +105,163 @@ class GameController:
         self.view.control_panel.opacity = 0
         self.view.control_panel.disabled = True
 
-        # Assign new random speeds without resetting positions
-        self.model.setup_race_speeds()
+        # Assign new random speeds without resetting positions; the finish
+        # line is recorded with the race's start so it can be replayed
+        finish_x = self.view.track.width * 0.9
+        self.model.setup_race_speeds(finish_x)
+
+        if self.simulation is not None:
+            self.simulation.start(
+                self.model.horses, finish_x, self.model.start_speeds, self.model.race_seed
+            )
 
         # Launch the race animation to 90% of track width
         self.view.start_race_animation(
             None,
-            finish_x=self.view.track.width * 0.9
+            finish_x=finish_x
         )
 
-    def update_speeds_and_positions(self) -> None:
+        # Render the possible result texts over the next frames
+        bet = self.model.bet
+        self.view.prepare_result_texts(
+            len(self.model.horses), None if bet is None else bet.amount
+        )
+
+    def resume_race(self) -> None:
         """
-        Called repeatedly during the race animation loop. Updates horse speeds,
-        advances positions, detects the winner, and schedules race completion.
+        Continue a race restored into the model from a checkpoint: restart
+        the animation from the restored positions, or show the result of a
+        race that had already been decided.
         """
-        self.model.update_speeds()
-        finish_x = self.view.track.width * 0.9
+        model = self.model
+        self.view.control_panel.opacity = 0
+        self.view.control_panel.disabled = True
+        if model.bet is not None:
+            self.view.show_selected_horse(model.bet.horse_number)
+        self.view.on_positions(PositionsTick(
+            tuple(model.positions), tuple(model.speeds)
+        ))
+
+        if model.winner is not None:
+            self.view.start_race_animation(None, finish_x=model.finish_x)
+            self._on_winner(WinnerDecided(model.winner))
+            return
+
+        if self.simulation is not None:
+            self.simulation.start(
+                model.horses, model.finish_x, model.start_speeds,
+                model.race_seed, model.race_ticks
+            )
+        self.view.start_race_animation(None, finish_x=model.finish_x)
+
+    def prepare_next_race(self) -> None:
+        """
+        Draw the next race's speeds and quote its opening odds ahead of time.
+        Called while the current race is running, so opening the next betting
+        window does not have to do this work.
+        """
+        speeds = self.model.prepare_race_speeds()
+        track = self.view.track
+        # Every horse starts the same distance from the finish line, which
+        # longer races cover at a fraction of the speed
+        distance = (track.width * 0.9 - track.width * 0.1) * self.model.physics.distance
+        self.next_odds = tuple(win_probabilities(
+            [distance] * len(speeds), speeds, physics=self.model.physics, start_speeds=speeds
+        ))
+
+    def show_next_race(self) -> None:
+        """
+        Show the prepared opening odds of the next race.
+        """
+        if self.next_odds is not None:
+            self.view.show_opening_odds(self.next_odds)
+
+    def advance_race(self, ticks: int) -> None:
+        """
+        Called from the race animation loop when the simulation runs in-process.
+        Advances the model; the winner is handled through the model's events.
 
-        for horse in self.model.horses:
-            horse.position += horse.speed
+        Args:
+            ticks (int): Number of simulation ticks elapsed since the last frame.
+        """
+        self.model.advance(self.view.finish_x, ticks)
 
-            if horse.position >= finish_x and self.model.winner is None:
-                # First horse to cross finish line is the winner
-                self.model.winner = horse.number
+    def sync_simulation(self) -> None:
+        """
+        Called each frame of the race animation when the simulation runs in a
+        worker process. Hands the latest published positions, speeds and winner
+        to the model, which publishes the resulting changes.
+        """
+        frame = self.simulation.latest()
+        if frame is None:
+            return
+        count = len(self.model.horses)
+        self.model.apply_tick(
+            frame[1:1 + count], frame[1 + count:1 + 2 * count],
+            self.view.finish_x, self.simulation.race_ticks(frame), self.simulation.winner
+        )
+        frame.release()
 
-                # Determine if the player won and calculate payout or loss
-                bet = self.model.bet
-                player_won = (horse.number == bet.horse_number)
-                payout = bet.amount * len(self.model.horses) if player_won else -bet.amount
+    def _on_winner(self, event: WinnerDecided) -> None:
+        """
+        Show the result of a decided race and, unless races are scheduled,
+        settle it after a short delay.
+
+        Args:
+            event (WinnerDecided): The model's winner event.
+        """
+        # Determine if the player won and calculate payout or loss
+        bet = self.model.bet
+        if bet is None:
+            # A scheduled race the player did not bet on
+            player_won, payout = None, 0
+        elif bet.cash_out is not None:
+            payout = bet.cash_out - bet.amount
+            player_won = payout >= 0
+        else:
+            player_won = (event.horse_number == bet.horse_number)
+            payout = bet.amount * len(self.model.horses) if player_won else -bet.amount
 
-                # Display race result in the view
-                self.view.show_result(horse.number, player_won, abs(payout))
+        # Display race result in the view
+        self.view.show_result(event.horse_number, player_won, abs(payout))
 
-                # After a short delay, finalize the race and reset
-                def finish_race(dt):
-                    self.view.result_popup.dismiss()
-                    self.model.resolve_race()
-                    self.view.update_balance(self.model.balance)
-                    self._reset()
+        # In timed mode the scheduler decides how long the result is held
+        if self.scheduler is None:
+            Clock.schedule_once(lambda dt: self.finish_race(), 2)
 
-                Clock.schedule_once(finish_race, 2)
+    def finish_race(self) -> None:
+        """
+        Dismiss the result, settle the race and reset for the next one.
+        """
+        self.view.result_popup.dismiss()
+        start = time.perf_counter()
+        self.model.resolve_race()
+        if self.settlement_times is not None:
+            self.settlement_times.record(time.perf_counter() - start)
+        self._reset()
+
+    def cash_out(self) -> None:
+        """
+        Handle the player cashing out the active bet at the latest quote.
+        """
+        quote = self.odds.latest
+        if quote is None or quote.cash_out is None:
+            return
+        try:
+            self.model.cash_out(quote.cash_out)
+        except ValueError:
+            # The race was decided between the quote and the click
+            return
+        self.view.on_odds(OddsUpdated(quote.probabilities, None))
 
     def _reset(self) -> None:
         """
         Internal method to stop the animation loop, reset the game state,
         and refresh the track visuals for a new race.
         """
-        Clock.unschedule(self.view.event)
+        self.view.stop_race_animation()
+        if self.simulation is not None:
+            self.simulation.stop()
         self.model.reset()
         self.view.reset_track()
 
@@ -128,5 +279,14 @@ class GameController:
             self.view.show_deposit_error(str(e))
             return
 
-        self.view.update_balance(self.model.balance)
         self.view.dismiss_deposit_popup()
+
+    def setting_changed(self, name: str, value) -> None:
+        """
+        Announce a change of an interface setting, e.g. to the event log.
+
+        Args:
+            name (str): Setting name.
+            value: The new value.
+        """
+        self.model.events.publish(SettingChanged(name, value))
@@ -0,0 +1,241 @@
+"""
+File: event_log.py
+
+Description:
+    Writes every game event to a structured log of JSON lines for incident
+    review. Publishing an event only appends it to an in-memory queue; a
+    background writer serializes queued events in batches, appends them to
+    the current log file and, once it exceeds a size limit, rotates it into
+    a gzip-compressed segment named after its first record's time. Reading
+    a time range back only opens the segments that can overlap it.
+
+    Files in the log directory:
+        events.jsonl                  Current log, appended to.
+        events-<first ms>.jsonl.gz    Rotated, compressed segments.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+import gzip
+import json
+import os
+import shutil
+import threading
+import time
+from collections import deque
+from typing import Iterator, List, Optional, Tuple
+
+from kivy.logger import Logger
+
+from events import (
+    BetPlaced, CashedOut, Deposited, EventBus, LeaderChanged, RaceSettled, RaceStarted,
+    SettingChanged, WinnerDecided
+)
+
+CURRENT_FILE = "events.jsonl"
+SEGMENT_PREFIX = "events-"
+SEGMENT_SUFFIX = ".jsonl.gz"
+
+# Event types written to the log
+LOGGED_EVENTS = (
+    BetPlaced, RaceStarted, LeaderChanged, WinnerDecided, RaceSettled,
+    CashedOut, Deposited, SettingChanged,
+)
+
+
+class EventLog:
+    """
+    Asynchronous, rotating JSON-lines log of game events.
+
+    Attributes:
+        directory (str): Directory holding the current log and its segments.
+        max_bytes (int): Size after which the current log is rotated.
+        flush_interval (float): Seconds between the writer's batches.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 8 * 1024 * 1024,
+                 flush_interval: float = 0.5) -> None:
+        """
+        Open the log and start the background writer.
+
+        Args:
+            directory (str): Directory for the log files; created if missing.
+            max_bytes (int): Size after which the current log is rotated.
+            flush_interval (float): Seconds between the writer's batches.
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory: str = directory
+        self.max_bytes: int = max_bytes
+        self.flush_interval: float = flush_interval
+        self._queue: "deque[Tuple[float, object]]" = deque()
+        self._stop = threading.Event()
+        self._writer = threading.Thread(target=self._run, name="event-log", daemon=True)
+        self._writer.start()
+
+    def attach(self, events: EventBus) -> None:
+        """
+        Log the game events published on a model's event bus.
+
+        Args:
+            events (EventBus): The game state's event bus.
+        """
+        for event_type in LOGGED_EVENTS:
+            events.subscribe(event_type, self.log)
+
+    def log(self, event) -> None:
+        """
+        Queue an event for the writer; never touches the disk.
+
+        Args:
+            event: A NamedTuple event.
+        """
+        self._queue.append((time.time(), event))
+
+    def close(self) -> None:
+        """
+        Write queued events and stop the writer.
+        """
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        self._writer.join()
+
+    def _run(self) -> None:
+        """
+        Writer thread: append queued events in batches and rotate when due.
+        """
+        path = os.path.join(self.directory, CURRENT_FILE)
+        _trim_torn(path)
+        log = open(path, "a", encoding="utf-8")
+        try:
+            while True:
+                stopping = self._stop.wait(self.flush_interval)
+                batch = []
+                while self._queue:
+                    batch.append(self._queue.popleft())
+                if batch:
+                    try:
+                        log.write("".join(_encode(t, event) for t, event in batch))
+                        log.flush()
+                        if log.tell() >= self.max_bytes:
+                            log.close()
+                            self._rotate(path)
+                            log = open(path, "a", encoding="utf-8")
+                    except OSError as e:
+                        Logger.error(f"EventLog: unable to write {len(batch)} events: {e}")
+                if stopping:
+                    return
+        finally:
+            log.close()
+
+    def _rotate(self, path: str) -> None:
+        """
+        Compress the current log into a segment and start an empty one.
+        """
+        with open(path, encoding="utf-8") as f:
+            try:
+                first = json.loads(f.readline())["t"]
+            except (ValueError, KeyError):
+                # The first record was torn by a crash
+                first = time.time()
+        segment = os.path.join(self.directory, f"{SEGMENT_PREFIX}{int(first * 1000)}{SEGMENT_SUFFIX}")
+        with open(path, "rb") as src, gzip.open(segment + ".tmp", "wb", compresslevel=6) as dst:
+            shutil.copyfileobj(src, dst, 1024 * 1024)
+        os.replace(segment + ".tmp", segment)
+        os.remove(path)
+
+
+def _trim_torn(path: str) -> None:
+    """
+    Cut a record torn by a crash off the end of a log, so that the next
+    record appended starts on a clean line.
+    """
+    if not os.path.exists(path):
+        return
+    with open(path, "r+b") as f:
+        size = f.seek(0, os.SEEK_END)
+        end = size
+        # Search backwards for the end of the last complete record
+        while end > 0:
+            start = max(0, end - 4096)
+            f.seek(start)
+            newline = f.read(end - start).rfind(b"\n")
+            if newline >= 0:
+                end = start + newline + 1
+                break
+            end = start
+        if end < size:
+            Logger.warning(f"EventLog: discarding torn record at the end of {os.path.basename(path)}")
+            f.truncate(end)
+
+
+def _encode(timestamp: float, event) -> str:
+    """
+    Serialize one event as a JSON line.
+    """
+    record = {"t": timestamp, "type": type(event).__name__}
+    record.update(event._asdict())
+    return json.dumps(record, separators=(",", ":")) + "\n"
+
+
+def _segments(directory: str) -> List[Tuple[float, str]]:
+    """
+    List rotated segments ordered by their first record's time.
+    """
+    found = []
+    for name in os.listdir(directory):
+        if name.startswith(SEGMENT_PREFIX) and name.endswith(SEGMENT_SUFFIX):
+            try:
+                first = int(name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)]) / 1000
+            except ValueError:
+                continue
+            found.append((first, name))
+    return sorted(found)
+
+
+def read_events(directory: str, start: Optional[float] = None,
+                end: Optional[float] = None) -> Iterator[dict]:
+    """
+    Read the logged events in a time range, oldest first.
+
+    Segments that end before `start` or begin at or after `end` are not
+    opened. A record torn by a crash at the end of the current log is skipped.
+
+    Args:
+        directory (str): The event log directory.
+        start (Optional[float]): Earliest event time, inclusive.
+        end (Optional[float]): Latest event time, exclusive.
+
+    Yields:
+        dict: One decoded record per event, with its time under "t" and its
+        event type under "type".
+    """
+    segments = _segments(directory)
+    paths = []
+    for i, (first, name) in enumerate(segments):
+        # A segment ends where the next one (or the current log) begins
+        following = segments[i + 1][0] if i + 1 < len(segments) else None
+        if end is not None and first >= end:
+            break
+        if start is not None and following is not None and following <= start:
+            continue
+        paths.append(os.path.join(directory, name))
+    current = os.path.join(directory, CURRENT_FILE)
+    if os.path.exists(current):
+        paths.append(current)
+
+    for path in paths:
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                t = record["t"]
+                if start is not None and t < start:
+                    continue
+                if end is not None and t >= end:
+                    return
+                yield record
@@ -0,0 +1,247 @@
+"""
+File: events.py
+
+Description:
+    Defines the change events published by the game model and a minimal
+    synchronous event bus to deliver them. Consumers subscribe to the event
+    types they need, so the view, loggers or metrics only do work when
+    something they care about changed; publishing an event nobody listens
+    to costs a single dictionary lookup.
+
+    This module must not import Kivy: the model, and with it this module,
+    is also used by the simulation worker process.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple, Type
+
+
+class PositionsTick(NamedTuple):
+    """
+    Horse positions after one or more simulation ticks, published once per batch.
+
+    Attributes:
+        positions (Tuple[float, ...]): Position of each horse, in horse order.
+        speeds (Tuple[float, ...]): Speed of each horse in pixels per tick.
+    """
+    positions: Tuple[float, ...]
+    speeds: Tuple[float, ...]
+
+
+class RaceStarted(NamedTuple):
+    """
+    A race has been set up and is about to run. Together with the physics
+    profile, the seed, positions and finish line replay the race exactly.
+
+    Attributes:
+        start_speeds (Tuple[float, ...]): Speeds assigned at the start, in horse order.
+        seed (int): Seed of the race's generator.
+        positions (Tuple[float, ...]): Starting positions, in horse order.
+        finish_x (float): Position at which a horse finishes; 0 if not yet known.
+        physics (str): Name of the physics profile.
+    """
+    start_speeds: Tuple[float, ...]
+    seed: int = 0
+    positions: Tuple[float, ...] = ()
+    finish_x: float = 0.0
+    physics: str = "classic"
+
+
+class LeaderChanged(NamedTuple):
+    """
+    A different horse has taken the lead.
+
+    Attributes:
+        horse_number (int): Number of the leading horse.
+    """
+    horse_number: int
+
+
+class WinnerDecided(NamedTuple):
+    """
+    The first horse has crossed the finish line.
+
+    Attributes:
+        horse_number (int): Number of the winning horse.
+    """
+    horse_number: int
+
+
+class BalanceChanged(NamedTuple):
+    """
+    The player's balance changed.
+
+    Attributes:
+        balance (float): The new balance.
+    """
+    balance: float
+
+
+class Deposited(NamedTuple):
+    """
+    The player deposited money.
+
+    Attributes:
+        amount (float): Amount deposited.
+        balance (float): Balance after the deposit.
+    """
+    amount: float
+    balance: float
+
+
+class RaceFinished(NamedTuple):
+    """
+    A decided race was closed, whether or not the player bet on it.
+
+    Attributes:
+        winner (int): Number of the winning horse.
+        finishing_order (Tuple[int, ...]): Horse numbers from first to last.
+        ticks (int): Simulation ticks until the winner crossed the finish.
+        start_speeds (Tuple[float, ...]): Speeds assigned at the start, in horse order.
+        stake (float): Amount wagered; 0 without a bet.
+        payout (float): Amount returned to the player; 0 for a lost bet or no bet.
+    """
+    winner: int
+    finishing_order: Tuple[int, ...]
+    ticks: int
+    start_speeds: Tuple[float, ...]
+    stake: float = 0.0
+    payout: float = 0.0
+
+
+class RaceSettled(NamedTuple):
+    """
+    A race was settled against the player's bet.
+
+    Attributes:
+        horse_number (int): Number of the horse bet on.
+        amount (float): Amount wagered.
+        winner (int): Number of the winning horse.
+        delta (float): Change of the balance; negative when the bet was lost.
+        balance (float): Balance after settlement.
+        finishing_order (Tuple[int, ...]): Horse numbers from first to last.
+        ticks (int): Simulation ticks until the winner crossed the finish.
+        start_speeds (Tuple[float, ...]): Speeds assigned at the start, in horse order.
+    """
+    horse_number: int
+    amount: float
+    winner: int
+    delta: float
+    balance: float
+    finishing_order: Tuple[int, ...]
+    ticks: int
+    start_speeds: Tuple[float, ...]
+
+
+class CashedOut(NamedTuple):
+    """
+    The player settled the active bet early at a quoted value.
+
+    Attributes:
+        horse_number (int): Number of the horse bet on.
+        amount (float): Amount wagered.
+        value (float): Amount received for the bet.
+        balance (float): Balance after cashing out.
+    """
+    horse_number: int
+    amount: float
+    value: float
+    balance: float
+
+
+class OddsUpdated(NamedTuple):
+    """
+    New in-play quotes for the running race.
+
+    Attributes:
+        probabilities (Tuple[float, ...]): Win probability of each horse, in horse order.
+        cash_out (Optional[float]): Current cash-out value of the active bet, or
+            None if it cannot be cashed out.
+    """
+    probabilities: Tuple[float, ...]
+    cash_out: Optional[float]
+
+
+class BetPlaced(NamedTuple):
+    """
+    The player placed a bet.
+
+    Attributes:
+        horse_number (int): Number of the horse bet on.
+        amount (float): Amount wagered.
+    """
+    horse_number: int
+    amount: float
+
+
+class SettingChanged(NamedTuple):
+    """
+    The player changed a setting of the interface.
+
+    Attributes:
+        name (str): Setting name, e.g. "language", "music_muted" or "sounds_muted".
+        value (object): The new value.
+    """
+    name: str
+    value: object
+
+
+class EventBus:
+    """
+    Synchronous publish/subscribe dispatcher keyed by event type.
+
+    Handlers run in the publisher's thread, in subscription order.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize a bus without subscribers.
+        """
+        self._handlers: Dict[Type, List[Callable]] = {}
+
+    def subscribe(self, event_type: Type, handler: Callable) -> None:
+        """
+        Call a handler for every published event of a type.
+
+        Args:
+            event_type (Type): Event class to listen for.
+            handler (Callable): Called with the event instance.
+        """
+        self._handlers.setdefault(event_type, []).append(handler)
+
+    def unsubscribe(self, event_type: Type, handler: Callable) -> None:
+        """
+        Stop calling a handler; unknown handlers are ignored.
+
+        Args:
+            event_type (Type): Event class the handler was subscribed to.
+            handler (Callable): The handler to remove.
+        """
+        handlers = self._handlers.get(event_type)
+        if handlers and handler in handlers:
+            handlers.remove(handler)
+
+    def has_subscribers(self, event_type: Type) -> bool:
+        """
+        Check whether anyone listens for an event type, so publishers can
+        skip building events nobody consumes.
+
+        Args:
+            event_type (Type): Event class.
+
+        Returns:
+            bool: True if at least one handler is subscribed.
+        """
+        return bool(self._handlers.get(event_type))
+
+    def publish(self, event) -> None:
+        """
+        Deliver an event to the handlers subscribed to its type.
+
+        Args:
+            event: The event instance.
+        """
+        for handler in tuple(self._handlers.get(type(event), ())):
+            handler(event)
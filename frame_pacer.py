@@ -0,0 +1,138 @@
+"""
+File: frame_pacer.py
+
+Description:
+    Adapts the Kivy main loop rate to what is happening on screen. Between
+    races nothing moves, so the loop only wakes a few times per second to poll
+    input; the window is still redrawn only when something changed. Touch and
+    key input switch to the interactive rate for a short while so buttons and
+    popup animations stay smooth, and during a race the loop is paced by the
+    display (vsync) or by a configured frame rate.
+
+    The Kivy clock reads its own frame rate cap (the graphics ``maxfps``
+    setting) once, when it is created, and has no public way to change it
+    afterwards. The pacer therefore sleeps at the end of each frame until
+    the current mode's frame time has passed, and the game starts the clock
+    uncapped (``maxfps`` 0) so the pacer's rate is the only limit.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+import time
+
+from kivy.clock import Clock
+from kivy.config import Config
+from kivy.core.window import Window
+
+
+class FramePacer:
+    """
+    Switches the Kivy main loop between idle, interactive and racing frame rates.
+
+    Attributes:
+        idle_fps (float): Loop rate while waiting for input between races.
+        active_fps (float): Loop rate for interface interaction and animations.
+        race_fps (float): Loop rate during a race; 0 leaves pacing to vsync.
+        idle_after (float): Seconds without input before returning to idle.
+        mode (str): Current mode: "idle", "active" or "racing".
+    """
+
+    def __init__(self, idle_fps: float = 10, active_fps: float = None,
+                 race_fps: float = 0, idle_after: float = 1.5) -> None:
+        """
+        Initialize the pacer, listen for user input and enter idle mode.
+
+        Args:
+            idle_fps (float): Loop rate while idle.
+            active_fps (float): Loop rate while interacting; defaults to the
+                graphics ``maxfps`` setting.
+            race_fps (float): Loop rate during races; 0 to follow the display.
+            idle_after (float): Seconds without input before returning to idle.
+        """
+        if active_fps is None:
+            active_fps = Config.getint("graphics", "maxfps")
+        self.idle_fps: float = idle_fps
+        self.active_fps: float = active_fps
+        self.race_fps: float = race_fps
+        self.idle_after: float = idle_after
+        self.mode: str = ""
+        self._frame_time = 0.0
+        self._last_frame = time.perf_counter()
+
+        self._idle_trigger = Clock.create_trigger(self._on_quiet, idle_after)
+        for event in ("on_touch_down", "on_touch_move", "on_touch_up", "on_key_down"):
+            Window.fbind(event, self._on_input)
+        self._set_mode("idle")
+        # Runs after the callbacks scheduled before it, on every frame
+        self._pace_event = Clock.schedule_interval(self._pace, 0)
+
+    def stop(self) -> None:
+        """
+        Stop pacing the main loop and listening for input, e.g. when the app stops.
+        """
+        self._pace_event.cancel()
+        self._idle_trigger.cancel()
+        for event in ("on_touch_down", "on_touch_move", "on_touch_up", "on_key_down"):
+            Window.funbind(event, self._on_input)
+
+    def wake(self) -> None:
+        """
+        Run at the interactive rate until no input arrived for `idle_after` seconds.
+        """
+        if self.mode == "racing":
+            return
+        self._set_mode("active")
+        self._idle_trigger.cancel()
+        self._idle_trigger()
+
+    def set_racing(self, racing: bool) -> None:
+        """
+        Enter or leave race pacing.
+
+        Args:
+            racing (bool): True when a race starts, False once it has been reset.
+        """
+        if racing:
+            self._idle_trigger.cancel()
+            self._set_mode("racing")
+        else:
+            self._set_mode("active")
+            self.wake()
+
+    def _on_input(self, *args) -> None:
+        """
+        Window input handler; never consumes the event.
+        """
+        self.wake()
+        return False
+
+    def _on_quiet(self, dt) -> None:
+        """
+        Return to idle once input has stopped, unless a race is running.
+        """
+        if self.mode == "active":
+            self._set_mode("idle")
+
+    def _set_mode(self, mode: str) -> None:
+        """
+        Apply the loop rate of a mode from the next frame on.
+        """
+        if mode == self.mode:
+            return
+        self.mode = mode
+        fps = {"idle": self.idle_fps, "active": self.active_fps, "racing": self.race_fps}[mode]
+        # Each loop iteration lasts at least 1/fps; 0 disables the sleep so
+        # the buffer swap (vsync) sets the pace.
+        self._frame_time = 1.0 / fps if fps > 0 else 0.0
+
+    def _pace(self, dt) -> None:
+        """
+        Sleep out the rest of the current mode's frame time.
+        """
+        now = time.perf_counter()
+        remaining = self._frame_time - (now - self._last_frame)
+        if remaining > 0:
+            time.sleep(remaining)
+            now = time.perf_counter()
+        self._last_frame = now
@@ -2,7 +2,9 @@
 File: language_manager.py
 
 Description:
-    Loads and provides access to localized language strings from JSON files.
+    Loads every localized language catalog once at startup and provides
+    access to its strings and precompiled format templates, and keeps widgets
+    bound to translation keys up to date when the language changes.
 
 Version: 1.0
 Author: Robbe de Guytenaer, Bernardo José Willis Lozano
@@ -10,42 +12,206 @@ Author: Robbe de Guytenaer, Bernardo José Willis Lozano
 
 import json
 import os
+import sys
+import weakref
+from operator import itemgetter
+from string import Formatter
+from typing import Callable, Dict, List, Optional
+
+# Catalog directory, resolved from this file so the working directory does not matter
+LANG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets', 'lang')
+
+
+def compile_template(template: str) -> Callable[..., str]:
+    """
+    Compile a positional format template (e.g. "Horse number {0} wins!") into
+    a printf-style template once, so rendering it does not parse the braces
+    again on every call.
+
+    Templates using conversions, format specs or named fields fall back to
+    `str.format`.
+
+    Args:
+        template (str): The format template.
+
+    Returns:
+        Callable[..., str]: Function taking the positional format arguments.
+    """
+    parts: List[str] = []
+    indexes: List[int] = []
+    auto = 0
+    for literal, field, spec, conversion in Formatter().parse(template):
+        parts.append(literal.replace('%', '%%'))
+        if field is None:
+            continue
+        if spec or conversion or not (field == '' or field.isdigit()):
+            return template.format
+        if field == '':
+            index, auto = auto, auto + 1
+        else:
+            index = int(field)
+        parts.append('%s')
+        indexes.append(index)
+
+    compiled = ''.join(parts)
+    count = len(indexes)
+    if count == 0:
+        return lambda *args: template
+    if indexes == list(range(count)):
+        return lambda *args: compiled % args[:count]
+    pick = itemgetter(*indexes)
+    if count == 1:
+        return lambda *args: compiled % (pick(args),)
+    return lambda *args: compiled % pick(args)
 
 
 class LanguageManager:
     """
     Manages loading and retrieval of localized strings for different languages.
 
+    All catalogs in the language directory are read once when the manager is
+    created. Each language is resolved against the fallback language, so a
+    key missing from a translation shows the fallback text (and a key missing
+    everywhere shows the key itself). Switching languages only swaps the
+    active tables and never touches the disk.
+
+    Widgets declare the translation key they display through `bind`; a call
+    to `set_language` then updates exactly those widgets in a single pass,
+    without rebuilding or closing any open dialog.
+
     Attributes:
         strings (dict): Mapping of translation keys to localized strings.
+        language (str): ISO code of the currently loaded language.
     """
 
-    def __init__(self, default_language: str = 'en'):
+    # Maximum number of memoized formatted strings for the active language
+    FORMAT_MEMO_SIZE = 512
+
+    def __init__(self, default_language: str = 'en', fallback_language: str = 'en',
+                 lang_dir: str = LANG_DIR):
         """
-        Initialize the LanguageManager and load the default language.
+        Initialize the LanguageManager, load all catalogs and select the default language.
 
         Args:
             default_language (str): ISO code of the language to load initially (e.g., 'en', 'es', 'sv').
+            fallback_language (str): ISO code of the language used for missing keys.
+            lang_dir (str): Directory containing the '{lang_code}.json' catalogs.
+
+        Raises:
+            json.JSONDecodeError: If a catalog file contains invalid JSON.
         """
         self.strings: dict = {}
+        self.language: str = default_language
+        self._templates: Dict[str, Callable[..., str]] = {}
+        # (key, args) -> formatted text, for values that repeat (e.g. horse numbers)
+        self._formatted: Dict[tuple, str] = {}
+        # widget -> {attribute: (key, format args, compose)}
+        self._bindings = weakref.WeakKeyDictionary()
+
+        raw: Dict[str, dict] = {}
+        for name in sorted(os.listdir(lang_dir)):
+            code, ext = os.path.splitext(name)
+            if ext == '.json':
+                with open(os.path.join(lang_dir, name), 'r', encoding='utf-8') as f:
+                    raw[code] = {sys.intern(k): v for k, v in json.load(f).items()}
+
+        fallback = raw.get(fallback_language, {})
+        self._catalog: Dict[str, dict] = {
+            code: {**fallback, **strings} for code, strings in raw.items()
+        }
+        self._compiled: Dict[str, Dict[str, Callable[..., str]]] = {
+            code: {k: compile_template(v) for k, v in strings.items() if '{' in v}
+            for code, strings in self._catalog.items()
+        }
         self.load(default_language)
 
-    def load(self, lang_code: str) -> None:
+    @property
+    def languages(self) -> List[str]:
+        """
+        ISO codes of all available languages.
+
+        Returns:
+            List[str]: The loaded language codes.
         """
-        Load translation strings from a JSON file for the specified language.
+        return list(self._catalog)
 
-        The JSON file should be located at 'assets/lang/{lang_code}.json'.
+    def load(self, lang_code: str) -> None:
+        """
+        Make the preloaded catalog of the specified language the active one.
 
         Args:
             lang_code (str): ISO code of the language to load.
 
         Raises:
-            FileNotFoundError: If the JSON file does not exist.
-            json.JSONDecodeError: If the JSON file contains invalid JSON.
+            FileNotFoundError: If no catalog exists for the language.
+        """
+        if lang_code not in self._catalog:
+            raise FileNotFoundError(f"No language catalog for '{lang_code}'")
+        self.strings = self._catalog[lang_code]
+        self._templates = self._compiled[lang_code]
+        self._formatted.clear()
+        self.language = lang_code
+
+    def set_language(self, lang_code: str) -> None:
+        """
+        Switch to another language and update every bound widget.
+
+        Args:
+            lang_code (str): ISO code of the language to switch to.
         """
-        path = os.path.join('assets', 'lang', f'{lang_code}.json')
-        with open(path, 'r', encoding='utf-8') as f:
-            self.strings = json.load(f)
+        self.load(lang_code)
+        self.refresh()
+
+    def bind(self, widget, key: str, *args, attr: str = 'text',
+             compose: Optional[Callable[[str], str]] = None) -> None:
+        """
+        Bind a widget attribute to a translation key and set it immediately.
+
+        Binding the same widget attribute again replaces the previous binding,
+        so widgets whose content changes (e.g. a mute toggle or a tutorial step)
+        simply rebind to the new key.
+
+        Args:
+            widget: The widget showing the text.
+            key (str): Translation key to display.
+            *args: Positional arguments for the translation's format template.
+            attr (str): Widget attribute to set (e.g. 'text' or 'title').
+            compose (Optional[Callable[[str], str]]): Optional function building
+                the final text from the localized string.
+        """
+        self._bindings.setdefault(widget, {})[attr] = (key, args, compose)
+        setattr(widget, attr, self._render(key, args, compose))
+
+    def unbind(self, widget, attr: Optional[str] = None) -> None:
+        """
+        Remove a widget's bindings.
+
+        Args:
+            widget: The bound widget.
+            attr (Optional[str]): Attribute to unbind, or None to unbind all.
+        """
+        attrs = self._bindings.get(widget)
+        if attrs is None:
+            return
+        if attr is None:
+            del self._bindings[widget]
+        else:
+            attrs.pop(attr, None)
+
+    def refresh(self) -> None:
+        """
+        Re-render every bound widget attribute for the current language.
+        """
+        for widget, attrs in list(self._bindings.items()):
+            for attr, (key, args, compose) in attrs.items():
+                setattr(widget, attr, self._render(key, args, compose))
+
+    def _render(self, key: str, args: tuple, compose: Optional[Callable[[str], str]]) -> str:
+        """
+        Build the text of a binding.
+        """
+        text = self.format(key, *args) if args else self.get(key)
+        return compose(text) if compose else text
 
     def get(self, key: str) -> str:
         """
@@ -60,3 +226,26 @@ class LanguageManager:
             str: The localized string, or the key if no translation is found.
         """
         return self.strings.get(key, key)
+
+    def format(self, key: str, *args) -> str:
+        """
+        Retrieve the localized string for the given key and fill in its
+        positional format arguments using the precompiled template.
+
+        Args:
+            key (str): The translation key to look up.
+            *args: Positional format arguments; must be hashable.
+
+        Returns:
+            str: The formatted localized string.
+        """
+        memo_key = (key, args)
+        text = self._formatted.get(memo_key)
+        if text is not None:
+            return text
+        template = self._templates.get(key)
+        text = self.get(key) if template is None else template(*args)
+        if len(self._formatted) >= self.FORMAT_MEMO_SIZE:
+            self._formatted.clear()
+        self._formatted[memo_key] = text
+        return text
@@ -0,0 +1,342 @@
+"""
+File: leaderboard.py
+
+Description:
+    Keeps a persistent leaderboard of players ranked by peak balance, net
+    winnings and longest winning streak, updated from settled races. Every
+    metric has a rank index: a list of (-value, account id) keys kept sorted
+    as players' values change. Reading the top K is a slice of that list and
+    a player's rank is one binary search, so showing the board never sorts
+    the player table.
+
+    The table is saved as a JSON snapshot, replaced atomically by a
+    background thread shortly after changes, so settling a race never waits
+    for the disk.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+import json
+import os
+import threading
+import time
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Tuple
+
+from kivy.logger import Logger
+
+from events import BalanceChanged, EventBus, RaceSettled
+
+LEADERBOARD_FILE = "leaderboard.json"
+
+# Ranked metrics, each a PlayerStats attribute
+METRICS = ("peak_balance", "net_winnings", "longest_streak")
+
+
+class PlayerStats:
+    """
+    Leaderboard figures of one player.
+
+    Attributes:
+        account_id (str): The player's account.
+        name (str): Name shown on the board.
+        races (int): Races settled against the player's bets.
+        peak_balance (float): Highest balance reached.
+        net_winnings (float): Total won minus total lost.
+        streak (int): Current run of consecutive winning races.
+        longest_streak (int): Longest run of consecutive winning races.
+    """
+
+    __slots__ = ("account_id", "name", "races", "peak_balance", "net_winnings",
+                 "streak", "longest_streak")
+
+    def __init__(self, account_id: str, name: str = "", races: int = 0,
+                 peak_balance: float = 0.0, net_winnings: float = 0.0,
+                 streak: int = 0, longest_streak: int = 0) -> None:
+        """
+        Initialize a player's figures.
+
+        Args:
+            account_id (str): The player's account.
+            name (str): Name shown on the board; defaults to the account id.
+            races (int): Races settled.
+            peak_balance (float): Highest balance reached.
+            net_winnings (float): Total won minus total lost.
+            streak (int): Current winning streak.
+            longest_streak (int): Longest winning streak.
+        """
+        self.account_id: str = account_id
+        self.name: str = name or account_id
+        self.races: int = races
+        self.peak_balance: float = peak_balance
+        self.net_winnings: float = net_winnings
+        self.streak: int = streak
+        self.longest_streak: int = longest_streak
+
+    def to_dict(self) -> dict:
+        """
+        Serialize the figures for the snapshot.
+
+        Returns:
+            dict: The figures as JSON-compatible values.
+        """
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+
+class RankIndex:
+    """
+    Players ordered by one metric, best first; ties are ordered by account id.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty index.
+        """
+        self._keys: List[Tuple[float, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def build(self, values: Dict[str, float]) -> None:
+        """
+        Replace the index with players' values in a single sort.
+
+        Args:
+            values (Dict[str, float]): Value per account id.
+        """
+        self._keys = sorted((-value, account_id) for account_id, value in values.items())
+
+    def update(self, account_id: str, old: Optional[float], new: float) -> None:
+        """
+        Move a player to the position of a new value.
+
+        Args:
+            account_id (str): The player's account.
+            old (Optional[float]): Value the player is indexed under, None if not yet indexed.
+            new (float): The new value.
+        """
+        if old is not None:
+            if old == new:
+                return
+            i = bisect_left(self._keys, (-old, account_id))
+            del self._keys[i]
+        insort(self._keys, (-new, account_id))
+
+    def top(self, k: int) -> List[Tuple[str, float]]:
+        """
+        The best K players.
+
+        Args:
+            k (int): Number of players.
+
+        Returns:
+            List[Tuple[str, float]]: (account id, value) pairs, best first.
+        """
+        return [(account_id, -value) for value, account_id in self._keys[:k]]
+
+    def rank(self, value: float) -> int:
+        """
+        Rank of a value: one more than the number of players with a better one.
+
+        Args:
+            value (float): The value to rank.
+
+        Returns:
+            int: The 1-based rank; tied players share a rank.
+        """
+        return bisect_left(self._keys, (-value,)) + 1
+
+
+class Leaderboard:
+    """
+    Persistent player table with a rank index per metric.
+
+    Attributes:
+        directory (str): Directory holding the snapshot.
+        save_delay (float): Seconds the writer waits to batch changes together.
+    """
+
+    def __init__(self, directory: str, save_delay: float = 1.0) -> None:
+        """
+        Load the table and start the background writer.
+
+        Args:
+            directory (str): Directory for the snapshot; created if missing.
+            save_delay (float): Seconds to wait for more changes before saving.
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory: str = directory
+        self.save_delay: float = save_delay
+        self._players: Dict[str, PlayerStats] = {}
+        self._indexes: Dict[str, RankIndex] = {metric: RankIndex() for metric in METRICS}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._load()
+        self._writer = threading.Thread(target=self._run, name="leaderboard", daemon=True)
+        self._writer.start()
+
+    def attach(self, events: EventBus, account_id: str, balance: float) -> None:
+        """
+        Rank the races settled on a model's event bus under an account.
+
+        Args:
+            events (EventBus): The game state's event bus.
+            account_id (str): Account of the model's player.
+            balance (float): The player's current balance.
+        """
+        self.record_balance(account_id, balance)
+        events.subscribe(RaceSettled, lambda event: self.record_race(account_id, event))
+        events.subscribe(BalanceChanged, lambda event: self.record_balance(account_id, event.balance))
+
+    def register(self, account_id: str, name: str) -> None:
+        """
+        Add a player to the board or rename one.
+
+        Args:
+            account_id (str): The player's account.
+            name (str): Name shown on the board.
+        """
+        with self._lock:
+            self._player(account_id).name = name
+        self._wake.set()
+
+    def record_race(self, account_id: str, settled: RaceSettled) -> None:
+        """
+        Update a player's figures with a settled race.
+
+        Args:
+            account_id (str): The player's account.
+            settled (RaceSettled): The settlement.
+        """
+        with self._lock:
+            player = self._player(account_id)
+            player.races += 1
+            self._set(player, "net_winnings", player.net_winnings + settled.delta)
+            player.streak = player.streak + 1 if settled.delta > 0 else 0
+            if player.streak > player.longest_streak:
+                self._set(player, "longest_streak", player.streak)
+            if settled.balance > player.peak_balance:
+                self._set(player, "peak_balance", settled.balance)
+        self._wake.set()
+
+    def record_balance(self, account_id: str, balance: float) -> None:
+        """
+        Raise a player's peak balance if the balance exceeds it.
+
+        Args:
+            account_id (str): The player's account.
+            balance (float): The player's current balance.
+        """
+        with self._lock:
+            player = self._player(account_id)
+            if balance <= player.peak_balance:
+                return
+            self._set(player, "peak_balance", balance)
+        self._wake.set()
+
+    def top(self, metric: str, k: int = 10) -> List[Tuple[str, float]]:
+        """
+        The leading players by a metric.
+
+        Args:
+            metric (str): One of METRICS.
+            k (int): Number of players.
+
+        Returns:
+            List[Tuple[str, float]]: (name, value) pairs, best first.
+        """
+        with self._lock:
+            return [(self._players[a].name, v) for a, v in self._indexes[metric].top(k)]
+
+    def rank(self, metric: str, account_id: str) -> Optional[int]:
+        """
+        A player's rank by a metric.
+
+        Args:
+            metric (str): One of METRICS.
+            account_id (str): The player's account.
+
+        Returns:
+            Optional[int]: The 1-based rank, or None for an unknown player.
+        """
+        with self._lock:
+            player = self._players.get(account_id)
+            if player is None:
+                return None
+            return self._indexes[metric].rank(getattr(player, metric))
+
+    def __len__(self) -> int:
+        return len(self._players)
+
+    def close(self) -> None:
+        """
+        Save pending changes and stop the writer.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        self._writer.join()
+
+    def _player(self, account_id: str) -> PlayerStats:
+        """
+        Look up a player, adding and indexing a new one. Called with the lock held.
+        """
+        player = self._players.get(account_id)
+        if player is None:
+            player = self._players[account_id] = PlayerStats(account_id)
+            for metric, index in self._indexes.items():
+                index.update(account_id, None, getattr(player, metric))
+        return player
+
+    def _set(self, player: PlayerStats, metric: str, value: float) -> None:
+        """
+        Change a ranked figure and move the player in its index. Called with the lock held.
+        """
+        self._indexes[metric].update(player.account_id, getattr(player, metric), value)
+        setattr(player, metric, value)
+
+    def _load(self) -> None:
+        path = os.path.join(self.directory, LEADERBOARD_FILE)
+        if not os.path.exists(path):
+            return
+        try:
+            with open(path, encoding="utf-8") as f:
+                rows = json.load(f)
+        except (OSError, ValueError) as e:
+            Logger.error(f"Leaderboard: unable to load {path}: {e}")
+            return
+        for row in rows:
+            player = PlayerStats(**row)
+            self._players[player.account_id] = player
+        for metric, index in self._indexes.items():
+            index.build({a: getattr(p, metric) for a, p in self._players.items()})
+
+    def _run(self) -> None:
+        """
+        Writer thread: save a snapshot shortly after changes.
+        """
+        while True:
+            self._wake.wait()
+            if not self._closed:
+                time.sleep(self.save_delay)
+            self._wake.clear()
+            with self._lock:
+                rows = [p.to_dict() for p in self._players.values()]
+            try:
+                self._save(rows)
+            except OSError as e:
+                Logger.error(f"Leaderboard: unable to save: {e}")
+            if self._closed:
+                return
+
+    def _save(self, rows: List[dict]) -> None:
+        path = os.path.join(self.directory, LEADERBOARD_FILE)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(rows, f, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
@@ -0,0 +1,323 @@
+"""
+File: ledger.py
+
+Description:
+    Persists the player's money movements in a crash-safe, append-only
+    ledger. Every deposit, bet, cash-out and race settlement is appended to a
+    write-ahead log of JSON lines; the log is periodically compacted into a
+    snapshot so that replaying it at startup only reads the records written
+    since. Records are queued on the UI thread and written, batched and
+    fsynced by a background thread, so ledger I/O never blocks a frame.
+
+    Files in the ledger directory:
+        snapshot.json           State as of a sequence number, replaced atomically.
+        wal-<first seq>.jsonl   Log segments; one is started after every snapshot.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+import json
+import os
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from kivy.logger import Logger
+
+from events import BetPlaced, CashedOut, Deposited, EventBus, RaceSettled
+
+SNAPSHOT_FILE = "snapshot.json"
+SEGMENT_PREFIX = "wal-"
+SEGMENT_SUFFIX = ".jsonl"
+
+
+class LedgerState:
+    """
+    State reconstructed from the ledger.
+
+    Attributes:
+        seq (int): Sequence number of the last applied record.
+        balance (Optional[float]): Balance after that record; None for an empty ledger.
+        open_bet (Optional[Tuple[int, float]]): (horse number, amount) of a bet
+            that was placed but never settled.
+    """
+
+    def __init__(self, seq: int = 0, balance: Optional[float] = None,
+                 open_bet: Optional[Tuple[int, float]] = None) -> None:
+        """
+        Initialize a LedgerState.
+
+        Args:
+            seq (int): Sequence number of the last applied record.
+            balance (Optional[float]): Balance after that record.
+            open_bet (Optional[Tuple[int, float]]): Unsettled bet, if any.
+        """
+        self.seq: int = seq
+        self.balance: Optional[float] = balance
+        self.open_bet: Optional[Tuple[int, float]] = open_bet
+
+    def apply(self, record: dict) -> None:
+        """
+        Apply one log record.
+
+        Args:
+            record (dict): The decoded record.
+        """
+        self.seq = record["seq"]
+        kind = record["type"]
+        if kind == "bet":
+            self.open_bet = (record["horse"], record["amount"])
+        else:
+            if kind in ("settle", "void", "cashout"):
+                self.open_bet = None
+            self.balance = record["balance"]
+
+    def to_dict(self) -> dict:
+        """
+        Serialize the state for a snapshot.
+
+        Returns:
+            dict: The state as JSON-compatible values.
+        """
+        return {"seq": self.seq, "balance": self.balance, "open_bet": self.open_bet}
+
+
+class Ledger:
+    """
+    Append-only ledger of deposits, bets and settlements.
+
+    Attributes:
+        directory (str): Directory holding the snapshot and log segments.
+        snapshot_every (int): Number of records after which the log is compacted.
+        flush_delay (float): Seconds the writer waits to batch records together.
+        state (LedgerState): State replayed at startup; not updated afterwards.
+    """
+
+    def __init__(self, directory: str, snapshot_every: int = 500,
+                 flush_delay: float = 0.05) -> None:
+        """
+        Replay the ledger and start the background writer.
+
+        Args:
+            directory (str): Directory holding the ledger files; created if missing.
+            snapshot_every (int): Records between snapshots.
+            flush_delay (float): Seconds to wait for more records before writing.
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory: str = directory
+        self.snapshot_every: int = snapshot_every
+        self.flush_delay: float = flush_delay
+
+        began = time.perf_counter()
+        self.state: LedgerState = self._replay()
+        Logger.info(
+            f"Ledger: replayed up to record {self.state.seq} "
+            f"in {(time.perf_counter() - began) * 1000:.1f} ms"
+        )
+
+        self._seq = self.state.seq
+        self._pending: List[dict] = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        # Only the writer thread touches the files and this running state
+        self._written = LedgerState(**self.state.to_dict())
+        self._since_snapshot = 0
+        self._segment = self._open_segment()
+        self._writer = threading.Thread(target=self._run, name="ledger-writer", daemon=True)
+        self._writer.start()
+
+    def restore(self, default_balance: float,
+                resumed_bet: Optional[Tuple[int, float]] = None) -> float:
+        """
+        Determine the starting balance and close out what a crash left open.
+
+        A bet that was placed but never settled belongs to a race that did not
+        finish; it is voided, which leaves the balance unchanged because bets
+        are only charged at settlement, unless that race is being resumed.
+
+        Args:
+            default_balance (float): Balance to open an empty ledger with.
+            resumed_bet (Optional[Tuple[int, float]]): (horse number, amount)
+                of the bet of a race resumed from a checkpoint, which stays open.
+
+        Returns:
+            float: The balance to start the game with.
+        """
+        if self.state.balance is None:
+            self._append("open", balance=default_balance)
+            return default_balance
+        if self.state.open_bet is not None and tuple(self.state.open_bet) != resumed_bet:
+            horse, amount = self.state.open_bet
+            Logger.warning(f"Ledger: voiding unsettled bet of ${amount} on horse {horse}")
+            self._append("void", horse=horse, amount=amount, balance=self.state.balance)
+        return self.state.balance
+
+    def attach(self, events: EventBus) -> None:
+        """
+        Record the money movements published on a model's event bus.
+
+        Args:
+            events (EventBus): The game state's event bus.
+        """
+        events.subscribe(Deposited, self._on_deposited)
+        events.subscribe(BetPlaced, self._on_bet_placed)
+        events.subscribe(CashedOut, self._on_cashed_out)
+        events.subscribe(RaceSettled, self._on_race_settled)
+
+    def close(self) -> None:
+        """
+        Write all queued records and stop the writer thread.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        self._writer.join()
+
+    def _on_deposited(self, event: Deposited) -> None:
+        self._append("deposit", amount=event.amount, balance=event.balance)
+
+    def _on_bet_placed(self, event: BetPlaced) -> None:
+        self._append("bet", horse=event.horse_number, amount=event.amount)
+
+    def _on_cashed_out(self, event: CashedOut) -> None:
+        self._append(
+            "cashout", horse=event.horse_number, amount=event.amount,
+            value=event.value, balance=event.balance
+        )
+
+    def _on_race_settled(self, event: RaceSettled) -> None:
+        self._append(
+            "settle", horse=event.horse_number, amount=event.amount,
+            winner=event.winner, delta=event.delta, balance=event.balance
+        )
+
+    def _append(self, kind: str, **fields) -> None:
+        """
+        Queue a record for the writer; never touches the disk.
+        """
+        self._seq += 1
+        record = {"seq": self._seq, "type": kind, "time": time.time()}
+        record.update(fields)
+        with self._lock:
+            self._pending.append(record)
+        self._wake.set()
+
+    def _run(self) -> None:
+        """
+        Writer thread: write queued records in batches, then compact when due.
+        """
+        while True:
+            self._wake.wait()
+            if not self._closed:
+                # Give records produced by the same user action time to arrive
+                time.sleep(self.flush_delay)
+            self._wake.clear()
+            with self._lock:
+                batch, self._pending = self._pending, []
+            if batch:
+                try:
+                    self._write(batch)
+                except OSError as e:
+                    Logger.error(f"Ledger: unable to write {len(batch)} records: {e}")
+                    if not self._closed:
+                        # Keep them queued; they are retried with the next batch
+                        with self._lock:
+                            self._pending[:0] = batch
+            if self._closed:
+                self._segment.close()
+                return
+
+    def _write(self, batch: List[dict]) -> None:
+        """
+        Append a batch to the current segment and make it durable.
+        """
+        self._segment.write("".join(json.dumps(r, separators=(",", ":")) + "\n" for r in batch))
+        self._segment.flush()
+        os.fsync(self._segment.fileno())
+        for record in batch:
+            self._written.apply(record)
+        self._since_snapshot += len(batch)
+        if self._since_snapshot >= self.snapshot_every:
+            self._snapshot()
+
+    def _snapshot(self) -> None:
+        """
+        Atomically replace the snapshot, start a new segment and delete the
+        segments it covers.
+        """
+        path = os.path.join(self.directory, SNAPSHOT_FILE)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self._written.to_dict(), f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+        self._segment.close()
+        old_segments = self._segments()
+        self._segment = self._open_segment(new=True)
+        for _, name in old_segments:
+            os.remove(os.path.join(self.directory, name))
+        self._since_snapshot = 0
+
+    def _segments(self) -> List[Tuple[int, str]]:
+        """
+        List log segments ordered by their first sequence number.
+        """
+        found = []
+        for name in os.listdir(self.directory):
+            if name.startswith(SEGMENT_PREFIX) and name.endswith(SEGMENT_SUFFIX):
+                try:
+                    first = int(name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)])
+                except ValueError:
+                    continue
+                found.append((first, name))
+        return sorted(found)
+
+    def _open_segment(self, new: bool = False):
+        """
+        Open the segment to append to: the latest one, or a fresh one.
+        """
+        segments = self._segments()
+        if segments and not new:
+            name = segments[-1][1]
+        else:
+            name = f"{SEGMENT_PREFIX}{self._written.seq + 1:012d}{SEGMENT_SUFFIX}"
+        return open(os.path.join(self.directory, name), "a", encoding="utf-8")
+
+    def _replay(self) -> LedgerState:
+        """
+        Rebuild the state from the snapshot and the segments written since.
+        A record torn by a crash ends its segment and is cut off, so that
+        later appends start on a clean line.
+        """
+        state = LedgerState()
+        snapshot = os.path.join(self.directory, SNAPSHOT_FILE)
+        if os.path.exists(snapshot):
+            with open(snapshot, encoding="utf-8") as f:
+                data = json.load(f)
+            open_bet = tuple(data["open_bet"]) if data["open_bet"] else None
+            state = LedgerState(data["seq"], data["balance"], open_bet)
+
+        for _, name in self._segments():
+            path = os.path.join(self.directory, name)
+            good = 0
+            with open(path, "rb") as f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        break
+                    good += len(line)
+                    if record["seq"] > state.seq:
+                        state.apply(record)
+            if good < os.path.getsize(path):
+                Logger.warning(f"Ledger: discarding torn record at the end of {name}")
+                with open(path, "r+b") as f:
+                    f.truncate(good)
+        return state
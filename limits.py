@@ -0,0 +1,267 @@
+"""
+File: limits.py
+
+Description:
+    Enforces rolling-window velocity limits on deposits and stakes per
+    account, e.g. at most $1000 deposited per hour and $5000 per day. Each
+    window is divided into a fixed number of buckets holding the amount
+    charged during that slice of time plus a running total, so checking and
+    charging an amount only touches the buckets that expired since the
+    account's last update: constant time and constant memory per account
+    and limit, without keeping any history.
+
+    This module must not import Kivy: it is used by the model.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+import array
+import threading
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence
+
+
+class Limit(NamedTuple):
+    """
+    A cap on the amount of one kind charged within a rolling window.
+
+    Attributes:
+        kind (str): What is limited, "deposit" or "stake".
+        window (float): Length of the window in seconds.
+        cap (float): Largest total allowed within any window.
+        buckets (int): Number of buckets the window is divided into; the
+            window effectively ends up to one bucket early.
+    """
+    kind: str
+    window: float
+    cap: float
+    buckets: int = 60
+
+
+class Charge(NamedTuple):
+    """
+    An amount charged to an account, which can be released again.
+
+    Attributes:
+        amount (float): Amount charged.
+        time (float): Time of the charge in seconds.
+    """
+    amount: float
+    time: float
+
+
+class LimitExceeded(ValueError):
+    """
+    Raised when charging an amount would exceed a limit.
+    """
+
+
+class RollingWindow:
+    """
+    Bucketed running total of the amounts charged within a window.
+    """
+
+    __slots__ = ("span", "buckets", "epoch", "total")
+
+    def __init__(self, limit: Limit, now: float) -> None:
+        """
+        Initialize an empty window.
+
+        Args:
+            limit (Limit): The limit this window tracks.
+            now (float): Current time in seconds.
+        """
+        self.span: float = limit.window / limit.buckets
+        self.buckets = array.array("d", bytes(8 * limit.buckets))
+        self.epoch: int = int(now // self.span)
+        self.total: float = 0.0
+
+    def advance(self, now: float) -> None:
+        """
+        Drop the buckets that fell out of the window since the last update.
+
+        Args:
+            now (float): Current time in seconds.
+        """
+        epoch = int(now // self.span)
+        expired = epoch - self.epoch
+        if expired <= 0:
+            return
+        count = len(self.buckets)
+        if expired >= count:
+            self.buckets = array.array("d", bytes(8 * count))
+            self.total = 0.0
+        else:
+            for e in range(self.epoch + 1, epoch + 1):
+                i = e % count
+                self.total -= self.buckets[i]
+                self.buckets[i] = 0.0
+        self.epoch = epoch
+
+    def held(self, charge: Charge) -> float:
+        """
+        Part of an earlier charge still counted by the window.
+
+        Args:
+            charge (Charge): The charge.
+
+        Returns:
+            float: The amount, or 0 once its bucket has expired.
+        """
+        epoch = int(charge.time // self.span)
+        if not 0 <= self.epoch - epoch < len(self.buckets):
+            return 0.0
+        return min(charge.amount, self.buckets[epoch % len(self.buckets)])
+
+    def release(self, charge: Charge, amount: float) -> None:
+        """
+        Take an amount off the bucket an earlier charge went into.
+
+        Args:
+            charge (Charge): The charge.
+            amount (float): Amount released, as returned by `held`.
+        """
+        if amount:
+            self.buckets[int(charge.time // self.span) % len(self.buckets)] -= amount
+            self.total -= amount
+
+    def add(self, amount: float) -> None:
+        """
+        Charge an amount to the current bucket.
+
+        Args:
+            amount (float): Amount to add.
+        """
+        self.buckets[self.epoch % len(self.buckets)] += amount
+        self.total += amount
+
+
+class LimitsEngine:
+    """
+    Shared table of per-account rolling windows for a set of limits.
+
+    Safe to use from several threads; every check-and-charge is atomic.
+
+    Attributes:
+        limits (List[Limit]): The enforced limits.
+    """
+
+    def __init__(self, limits: Sequence[Limit],
+                 clock: Callable[[], float] = time.time) -> None:
+        """
+        Initialize an engine without accounts.
+
+        Args:
+            limits (Sequence[Limit]): The limits to enforce.
+            clock (Callable[[], float]): Source of the current time in seconds.
+        """
+        self.limits: List[Limit] = list(limits)
+        self._by_kind: Dict[str, List[Limit]] = {}
+        for limit in self.limits:
+            self._by_kind.setdefault(limit.kind, []).append(limit)
+        self._clock = clock
+        self._accounts: Dict[str, Dict[str, List[RollingWindow]]] = {}
+        self._lock = threading.Lock()
+
+    def charge(self, account_id: str, kind: str, amount: float,
+               replaces: Optional[Charge] = None) -> Charge:
+        """
+        Charge an amount if it keeps the account within every limit of its kind.
+
+        Args:
+            account_id (str): The account charged.
+            kind (str): "deposit" or "stake".
+            amount (float): Amount to charge.
+            replaces (Optional[Charge]): An earlier charge released in the same
+                step, e.g. the stake of a bet being replaced; it does not count
+                against the new amount.
+
+        Returns:
+            Charge: The charge, to release it later.
+
+        Raises:
+            LimitExceeded: If the amount would exceed a limit; nothing is
+                charged or released.
+        """
+        now = self._clock()
+        limits = self._by_kind.get(kind)
+        if not limits:
+            return Charge(amount, now)
+        with self._lock:
+            windows = self._windows(account_id, kind, limits, now)
+            released = []
+            for limit, window in zip(limits, windows):
+                window.advance(now)
+                held = window.held(replaces) if replaces is not None else 0.0
+                if window.total - held + amount > limit.cap:
+                    raise LimitExceeded(
+                        f"Limit of ${limit.cap:g} per {_describe(limit.window)} reached"
+                    )
+                released.append(held)
+            for window, held in zip(windows, released):
+                window.release(replaces, held)
+                window.add(amount)
+        return Charge(amount, now)
+
+    def refund(self, account_id: str, kind: str, charge: Charge) -> None:
+        """
+        Release an earlier charge, e.g. the stake of a cancelled bet. Parts
+        of it that already left a window are not refunded there.
+
+        Args:
+            account_id (str): The account charged.
+            kind (str): "deposit" or "stake".
+            charge (Charge): The charge to release.
+        """
+        limits = self._by_kind.get(kind)
+        if not limits:
+            return
+        now = self._clock()
+        with self._lock:
+            for window in self._windows(account_id, kind, limits, now):
+                window.advance(now)
+                window.release(charge, window.held(charge))
+
+    def remaining(self, account_id: str, kind: str) -> float:
+        """
+        Largest amount of a kind the account can currently be charged.
+
+        Args:
+            account_id (str): The account.
+            kind (str): "deposit" or "stake".
+
+        Returns:
+            float: The headroom under the tightest limit; infinite without limits.
+        """
+        limits = self._by_kind.get(kind)
+        if not limits:
+            return float("inf")
+        now = self._clock()
+        with self._lock:
+            windows = self._windows(account_id, kind, limits, now)
+            for window in windows:
+                window.advance(now)
+            return max(0.0, min(limit.cap - w.total for limit, w in zip(limits, windows)))
+
+    def _windows(self, account_id: str, kind: str, limits: List[Limit],
+                 now: float) -> List[RollingWindow]:
+        """
+        Look up or create an account's windows for the limits of one kind.
+        """
+        kinds = self._accounts.setdefault(account_id, {})
+        windows = kinds.get(kind)
+        if windows is None:
+            windows = kinds[kind] = [RollingWindow(limit, now) for limit in limits]
+        return windows
+
+
+def _describe(seconds: float) -> str:
+    """
+    Name a window length for error messages.
+    """
+    for unit, length in (("day", 86400), ("hour", 3600), ("minute", 60)):
+        if seconds % length == 0:
+            count = int(seconds // length)
+            return unit if count == 1 else f"{count} {unit}s"
+    return f"{seconds:g} seconds"
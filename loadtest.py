@@ -0,0 +1,257 @@
+"""
+File: loadtest.py
+
+Description:
+    Load generator that drives the game engine with thousands of virtual
+    bettors to find where it saturates. Every bettor is an account with its
+    own GameState; bets and deposits arrive as Poisson processes at the
+    configured per-bettor rates and go through the same validation as the
+    game (`GameState.place_bet` and `deposit_money`). Races close at a fixed
+    interval, settling every open bet with `resolve_race`.
+
+    The load is open-loop: operations are scheduled at their arrival times
+    whether or not the engine kept up, and latency is measured from the
+    scheduled arrival to completion. Once the offered load exceeds what the
+    engine can serve, queueing shows up as rapidly growing latencies instead
+    of being hidden by a slowed-down generator.
+
+    Usage:
+        python loadtest.py --bettors 1000,5000,20000 --duration 10
+
+    This module must not import Kivy: it drives the model directly.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+import argparse
+import random
+import time
+from typing import Callable, Dict, List, Sequence
+
+from limits import Limit, LimitsEngine
+from model import GameState
+
+# Reported latency percentiles
+PERCENTILES = (50, 99, 99.9)
+
+# Finish line of the simulated races; horses start at 100
+FINISH_X = 800.0
+
+
+def parse_distribution(spec: str) -> Callable[[random.Random], float]:
+    """
+    Parse an amount distribution such as "fixed:10", "uniform:1,50" or
+    "lognormal:2.5,0.8". Drawn amounts are rounded to whole units of at least 1,
+    like the amounts entered in the game.
+
+    Args:
+        spec (str): Distribution name and parameters.
+
+    Returns:
+        Callable[[random.Random], float]: Draws one amount.
+
+    Raises:
+        ValueError: If the specification cannot be parsed.
+    """
+    name, _, params = spec.partition(":")
+    try:
+        args = [float(p) for p in params.split(",")] if params else []
+        if name == "fixed" and len(args) == 1:
+            draw = lambda rng: args[0]
+        elif name == "uniform" and len(args) == 2:
+            draw = lambda rng: rng.uniform(args[0], args[1])
+        elif name == "lognormal" and len(args) == 2:
+            draw = lambda rng: rng.lognormvariate(args[0], args[1])
+        else:
+            raise ValueError
+    except ValueError:
+        raise ValueError(f"Invalid distribution: {spec!r}") from None
+    return lambda rng: max(1, round(draw(rng)))
+
+
+def percentiles(samples: Sequence[float], ps: Sequence[float] = PERCENTILES) -> List[float]:
+    """
+    Compute percentiles by the nearest-rank method.
+
+    Args:
+        samples (Sequence[float]): Measured values.
+        ps (Sequence[float]): Percentiles between 0 and 100.
+
+    Returns:
+        List[float]: One value per percentile; zeros without samples.
+    """
+    if not samples:
+        return [0.0] * len(ps)
+    ordered = sorted(samples)
+    n = len(ordered)
+    return [ordered[min(n - 1, max(0, int(p / 100 * n + 0.5) - 1))] for p in ps]
+
+
+class LoadTest:
+    """
+    One load level: a population of virtual bettors driven for a fixed time.
+
+    Attributes:
+        bettors (int): Number of virtual bettors.
+        results (Dict[str, List[float]]): Latencies in seconds per operation.
+        rejected (Dict[str, int]): Operations refused by validation.
+    """
+
+    def __init__(self, bettors: int, bet_rate: float, deposit_rate: float,
+                 race_interval: float, bet_size: str, deposit_size: str,
+                 balance: float, limits: Sequence[Limit] = (), seed: int = 0) -> None:
+        """
+        Create the bettors' accounts.
+
+        Args:
+            bettors (int): Number of virtual bettors.
+            bet_rate (float): Bets per bettor per second.
+            deposit_rate (float): Deposits per bettor per second.
+            race_interval (float): Seconds between race closes.
+            bet_size (str): Bet amount distribution, see `parse_distribution`.
+            deposit_size (str): Deposit amount distribution.
+            balance (float): Starting balance of every bettor.
+            limits (Sequence[Limit]): Deposit and stake limits shared by all accounts.
+            seed (int): Seed of the random generator.
+        """
+        self.bettors: int = bettors
+        self.bet_rate = bet_rate * bettors
+        self.deposit_rate = deposit_rate * bettors
+        self.race_interval = race_interval
+        self._bet_size = parse_distribution(bet_size)
+        self._deposit_size = parse_distribution(deposit_size)
+        self._rng = random.Random(seed)
+        engine = LimitsEngine(limits) if limits else None
+        self._accounts = [
+            GameState(balance=balance, limits=engine, account_id=str(i)) for i in range(bettors)
+        ]
+        self._race = GameState(balance=0)
+        self._open_bets: Dict[int, GameState] = {}
+        self.results: Dict[str, List[float]] = {"bet": [], "deposit": [], "settlement": [], "close": []}
+        self.rejected: Dict[str, int] = {"bet": 0, "deposit": 0}
+
+    def run(self, duration: float) -> float:
+        """
+        Offer the load for a duration.
+
+        Args:
+            duration (float): Seconds of scheduled arrivals.
+
+        Returns:
+            float: Wall-clock seconds until every scheduled operation completed.
+        """
+        rng = self._rng
+        total_rate = self.bet_rate + self.deposit_rate
+        start = time.perf_counter()
+        next_arrival = rng.expovariate(total_rate) if total_rate else duration
+        next_close = self.race_interval
+
+        while min(next_arrival, next_close) < duration:
+            due = min(next_arrival, next_close)
+            delay = start + due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+            if next_close <= next_arrival:
+                self._close_race(start + due)
+                next_close += self.race_interval
+            else:
+                index = rng.randrange(self.bettors)
+                if rng.random() * total_rate < self.bet_rate:
+                    self._bet(index, start + due)
+                else:
+                    self._deposit(index, start + due)
+                next_arrival += rng.expovariate(total_rate)
+
+        return time.perf_counter() - start
+
+    def _bet(self, index: int, scheduled: float) -> None:
+        account = self._accounts[index]
+        try:
+            # A bettor with an open bet replaces it, which releases the
+            # replaced stake from the limits, as in the game
+            account.place_bet(self._rng.randint(1, len(account.horses)), self._bet_size(self._rng))
+            self._open_bets[index] = account
+        except ValueError:
+            self.rejected["bet"] += 1
+        self.results["bet"].append(time.perf_counter() - scheduled)
+
+    def _deposit(self, index: int, scheduled: float) -> None:
+        try:
+            self._accounts[index].deposit_money(self._deposit_size(self._rng))
+        except ValueError:
+            self.rejected["deposit"] += 1
+        self.results["deposit"].append(time.perf_counter() - scheduled)
+
+    def _close_race(self, scheduled: float) -> None:
+        """
+        Run a race to its winner and settle every open bet against it.
+        """
+        race = self._race
+        race.reset()
+        race.setup_race(FINISH_X)
+        while race.winner is None:
+            race.advance(FINISH_X)
+        positions = list(race.positions)
+        speeds = list(race.speeds)
+
+        # Every account takes over the shared race's outcome, as the game
+        # does with a race simulated by the worker process
+        settlement = self.results["settlement"]
+        for account in self._open_bets.values():
+            account.apply_tick(positions, speeds, FINISH_X, race.race_ticks, race.winner)
+            account.resolve_race()
+            account.reset()
+            settlement.append(time.perf_counter() - scheduled)
+        self._open_bets.clear()
+        self.results["close"].append(time.perf_counter() - scheduled)
+
+
+def main(argv=None) -> None:
+    """
+    Parse the command line, run each load level and print a report.
+    """
+    parser = argparse.ArgumentParser(description="Drive the game engine with virtual bettors.")
+    parser.add_argument("--bettors", default="1000,5000,20000",
+                        help="comma-separated bettor counts, one load level each")
+    parser.add_argument("--duration", type=float, default=10, help="seconds per load level")
+    parser.add_argument("--bet-rate", type=float, default=0.2, help="bets per bettor per second")
+    parser.add_argument("--deposit-rate", type=float, default=0.02,
+                        help="deposits per bettor per second")
+    parser.add_argument("--race-interval", type=float, default=2, help="seconds between race closes")
+    parser.add_argument("--bet-size", default="lognormal:2.5,0.8", help="bet amount distribution")
+    parser.add_argument("--deposit-size", default="uniform:10,200", help="deposit amount distribution")
+    parser.add_argument("--balance", type=float, default=100, help="starting balance per bettor")
+    parser.add_argument("--slo", type=float, default=50,
+                        help="p99.9 bet acceptance latency in ms above which a level counts as saturated")
+    parser.add_argument("--limit", action="append", default=[], metavar="KIND:SECONDS:CAP",
+                        help="rolling limit per account, e.g. deposit:3600:1000; repeatable")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    limits = []
+    for spec in args.limit:
+        kind, window, cap = spec.split(":")
+        limits.append(Limit(kind, float(window), float(cap)))
+
+    header = f"{'bettors':>8} {'offered/s':>10} {'served/s':>10} {'op':>10} {'p50 ms':>9} {'p99 ms':>9} {'p99.9 ms':>9} {'rejected':>9}"
+    print(header)
+    for bettors in (int(b) for b in args.bettors.split(",")):
+        test = LoadTest(
+            bettors, args.bet_rate, args.deposit_rate, args.race_interval,
+            args.bet_size, args.deposit_size, args.balance, limits, args.seed
+        )
+        elapsed = test.run(args.duration)
+        offered = test.bet_rate + test.deposit_rate
+        served = (len(test.results["bet"]) + len(test.results["deposit"])) / elapsed
+        for op, samples in test.results.items():
+            p50, p99, p999 = (v * 1000 for v in percentiles(samples))
+            print(f"{bettors:>8} {offered:>10.0f} {served:>10.0f} {op:>10} "
+                  f"{p50:>9.3f} {p99:>9.3f} {p999:>9.3f} {test.rejected.get(op, ''):>9}")
+        p999 = percentiles(test.results["bet"])[-1] * 1000
+        if p999 > args.slo:
+            print(f"{'':>8} saturated: p99.9 bet acceptance {p999:.1f} ms exceeds {args.slo:g} ms")
+
+
+if __name__ == "__main__":
+    main()
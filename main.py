@@ -9,16 +9,76 @@ Version: 1.0
 Author: Robbe de Guytenaer, Bernardo José Willis Lozano
 """
 
-from kivy.app import App
-from kivy.config import Config
+import os
+import time
+
+# Imported first so the Kivy import itself can be timed
+from startup_profiler import PROFILER
+PROFILER.start()
+
+with PROFILER.phase("Kivy import"):
+    from kivy.config import Config
+    # The frame pacer limits the loop rate itself; the clock reads its cap
+    # once, when importing the app creates it
+    _MAX_FPS = Config.getint('graphics', 'maxfps')
+    Config.set('graphics', 'maxfps', '0')
+    from kivy.app import App
+# Game specific settings, overridable from the Kivy config file
+Config.setdefaults('horserace', {
+    'window_size': '1000x600',
+    'render_scale': '1',
+    'render_smooth': '1',
+    'texture_budget_mb': '96',
+    'idle_fps': '10',
+    'race_fps': '0',
+    'idle_after': '1.5',
+    'simulation': 'inline',
+    'ledger_dir': '',
+    'history_dir': '',
+    'race_mode': 'manual',
+    'betting_window': '15',
+    'result_hold': '3',
+    'metrics_port': '0',
+    'event_log_dir': '',
+    'deposit_limit_hour': '0',
+    'deposit_limit_day': '0',
+    'stake_limit_hour': '0',
+    'stake_limit_day': '0',
+    'leaderboard_dir': '',
+    'checkpoint_dir': '',
+    'checkpoint_every': '6',
+    'tracks': '1',
+    'physics': 'classic',
+    'physics_file': '',
+})
 # Set window size before the app is built
-Config.set('graphics', 'width', '1000')
-Config.set('graphics', 'height', '600')
+_width, _, _height = Config.get('horserace', 'window_size').partition('x')
+Config.set('graphics', 'width', _width)
+Config.set('graphics', 'height', _height)
+# A race frame rate of 0 follows the display, which needs vsync
+if Config.getfloat('horserace', 'race_fps') == 0 and not Config.get('graphics', 'vsync'):
+    Config.set('graphics', 'vsync', '1')
 
-from language_manager import LanguageManager
-from model import GameState
-from view import GameView
-from controller import GameController
+with PROFILER.phase("game modules + window"):
+    from kivy.core.window import Window
+    from kivy.clock import Clock
+    from kivy.logger import Logger
+    from language_manager import LanguageManager
+    from model import GameState
+    from limits import Limit, LimitsEngine
+    from physics import PROFILES, load_profiles
+    from view import GameView
+    from controller import GameController
+    from texture_cache import TextureCache
+    from frame_pacer import FramePacer
+    from simulation import SimulationProcess
+    from ledger import Ledger
+    from race_history import RaceHistory
+    from scheduler import RaceScheduler
+    from metrics import MetricsExporter
+    from event_log import EventLog
+    from leaderboard import Leaderboard
+    from checkpoint import Checkpoint
 
 
 class HorseRaceGameApp(App):
@@ -40,20 +100,218 @@ class HorseRaceGameApp(App):
             GameView: The initialized view bound to its controller.
         """
         # Load localized strings
-        lang_mgr = LanguageManager(default_language='en')
+        with PROFILER.phase("LanguageManager"):
+            lang_mgr = LanguageManager(default_language='en')
+
+        # Restore the balance from the ledger, which then records every
+        # deposit, bet and settlement
+        with PROFILER.phase("Ledger replay"):
+            self.ledger = Ledger(self._data_dir('ledger_dir', 'ledger'))
+
+        # A race interrupted by a crash is resumed from its checkpoint, and
+        # its bet is kept open instead of being voided
+        self.checkpoint = Checkpoint(
+            os.path.join(self._data_dir('checkpoint_dir', 'checkpoint'), 'race.bin'),
+            every=Config.getint('horserace', 'checkpoint_every'),
+        )
+        resumed = self.checkpoint.load()
+        resumed_bet = resumed.bet[:2] if resumed is not None and resumed.bet else None
 
         # Initialize the game state with a starting balance
-        model = GameState(balance=100)
+        physics = self._physics()
+        with PROFILER.phase("GameState"):
+            model = GameState(
+                balance=self.ledger.restore(default_balance=100, resumed_bet=resumed_bet),
+                limits=self._limits(),
+                physics=physics,
+            )
+            self.ledger.attach(model.events)
+            if resumed is not None:
+                resumed.apply(model)
+            self.checkpoint.attach(model)
+
+        # Archive settled races for reporting
+        self.history = RaceHistory(self._data_dir('history_dir', 'history'), len(model.horses))
+        self.history.attach(model.events)
+
+        # Log every game event for incident review
+        self.event_log = EventLog(self._data_dir('event_log_dir', 'events'))
+        self.event_log.attach(model.events)
+
+        # Rank the player on the persistent leaderboard
+        self.leaderboard = Leaderboard(self._data_dir('leaderboard_dir', 'leaderboard'))
+        self.leaderboard.attach(model.events, model.account_id, model.balance)
+
+        # Share one budgeted texture cache across all widgets
+        budget_mb = Config.getfloat('horserace', 'texture_budget_mb')
+        textures = TextureCache(budget_bytes=int(budget_mb * 1024 * 1024))
+
+        # Throttle the main loop between races and pace it to the display during races
+        self.pacer = pacer = FramePacer(
+            idle_fps=Config.getfloat('horserace', 'idle_fps'),
+            active_fps=_MAX_FPS,
+            race_fps=Config.getfloat('horserace', 'race_fps'),
+            idle_after=Config.getfloat('horserace', 'idle_after'),
+        )
 
         # Create the game view, passing in the language manager for text rendering
-        view = GameView(lang_mgr)
+        view = GameView(lang_mgr, textures=textures, pacer=pacer)
+
+        # Venue screens show up to 16 races at once; the others run on their own
+        tracks = max(1, min(Config.getint('horserace', 'tracks'), 16))
+        if tracks > 1:
+            view.show_tracks(
+                [GameState(balance=0, account_id=f"venue{i}", physics=physics)
+                 for i in range(1, tracks)],
+                hold=Config.getfloat('horserace', 'result_hold'),
+            )
+
+        # Weak GPUs on big screens draw the track at a lower resolution
+        render_scale = Config.getfloat('horserace', 'render_scale')
+        if 0 < render_scale < 1:
+            view.set_render_scale(
+                render_scale, smooth=Config.getboolean('horserace', 'render_smooth')
+            )
+
+        # Optionally move the race simulation out of the UI process
+        self.simulation = None
+        if Config.get('horserace', 'simulation') == 'process':
+            self.simulation = SimulationProcess(len(model.horses), physics)
 
         # Instantiate the controller with model and view, then bind it to the view
-        controller = GameController(model, view)
+        controller = GameController(model, view, simulation=self.simulation)
         view.controller = controller
 
+        # In timed mode races run back to back instead of on each bet
+        self.scheduler = None
+        if Config.get('horserace', 'race_mode') == 'timed':
+            self.scheduler = RaceScheduler(
+                controller,
+                betting_window=Config.getfloat('horserace', 'betting_window'),
+                result_hold=Config.getfloat('horserace', 'result_hold'),
+            )
+
+        # Optionally serve operational metrics on a local port
+        self.metrics = None
+        metrics_port = Config.getint('horserace', 'metrics_port')
+        if metrics_port:
+            self.metrics = MetricsExporter(
+                model.events, metrics_port,
+                textures=textures, effects=view.effects, audio=view.audio
+            )
+            try:
+                self.metrics.start()
+                view.frame_times = self.metrics.frame_times
+                controller.settlement_times = self.metrics.settlement_times
+            except OSError as e:
+                Logger.error(f"Metrics: unable to listen on port {metrics_port}: {e}")
+                self.metrics = None
+
+        # Startup ends when the first frame has been presented
+        built = time.perf_counter()
+
+        def _first_frame(*_):
+            Window.unbind(on_flip=_first_frame)
+            PROFILER.record("first frame", time.perf_counter() - built)
+            PROFILER.finish()
+            # The track has its final size by now and lays out its horses on
+            # the next frame; the first race's odds and a resumed race need both
+            Clock.schedule_once(lambda dt: self._begin(controller, resumed is not None), 0)
+
+        Window.bind(on_flip=_first_frame)
         return view
 
+    def _begin(self, controller: GameController, resume: bool) -> None:
+        """
+        Resume an interrupted race or start scheduling races.
+
+        Args:
+            controller (GameController): The game controller.
+            resume (bool): Whether a race was restored from the checkpoint.
+        """
+        if resume:
+            Logger.info("Checkpoint: resuming the interrupted race")
+            if self.scheduler is not None:
+                self.scheduler.resume()
+            controller.resume_race()
+        elif self.scheduler is not None:
+            self.scheduler.start()
+
+    @staticmethod
+    def _limits():
+        """
+        Build the rolling deposit and stake limits configured in the horserace section.
+
+        Returns:
+            Optional[LimitsEngine]: The limits engine, or None if no limit is set.
+        """
+        limits = []
+        for kind in ('deposit', 'stake'):
+            for period, window, buckets in (('hour', 3600, 60), ('day', 86400, 96)):
+                cap = Config.getfloat('horserace', f'{kind}_limit_{period}')
+                if cap > 0:
+                    limits.append(Limit(kind, window, cap, buckets))
+        return LimitsEngine(limits) if limits else None
+
+    @staticmethod
+    def _physics():
+        """
+        Look up the physics profile selected in the horserace section, among
+        the built-in profiles and those of the configured profile file.
+
+        Returns:
+            PhysicsProfile: The profile; the classic one if it is unknown.
+        """
+        profiles = dict(PROFILES)
+        path = Config.get('horserace', 'physics_file')
+        if path:
+            try:
+                profiles.update(load_profiles(path))
+            except (OSError, ValueError) as e:
+                Logger.error(f"Physics: unable to load profiles from {path}: {e}")
+        name = Config.get('horserace', 'physics')
+        if name not in profiles:
+            Logger.error(f"Physics: unknown profile {name!r}, using classic")
+            name = 'classic'
+        return profiles[name]
+
+    def _data_dir(self, option: str, name: str) -> str:
+        """
+        Determine where a persistent store is kept.
+
+        Args:
+            option (str): Option in the horserace config section overriding the location.
+            name (str): Folder name used when the option is empty.
+
+        Returns:
+            str: The configured directory, else a folder in the app's user data
+            directory, else one next to this file if that cannot be created.
+        """
+        configured = Config.get('horserace', option)
+        if configured:
+            return configured
+        try:
+            return os.path.join(self.user_data_dir, name)
+        except OSError:
+            return os.path.join(os.path.dirname(os.path.abspath(__file__)), name)
+
+    def on_stop(self) -> None:
+        """
+        Stop pacing the main loop, shut down the simulation worker, if one was
+        started, and write any queued ledger records, archived races, logged
+        events, leaderboard changes and the race checkpoint.
+        """
+        self.pacer.stop()
+        if self.simulation is not None:
+            self.simulation.close()
+        if self.metrics is not None:
+            self.metrics.close()
+        self.ledger.close()
+        self.history.close()
+        self.event_log.close()
+        self.leaderboard.close()
+        self.checkpoint.close()
+
 
 if __name__ == '__main__':
     HorseRaceGameApp().run()
@@ -0,0 +1,301 @@
+"""
+File: metrics.py
+
+Description:
+    Exposes the game's operational metrics on a local HTTP endpoint in the
+    Prometheus text format: race frame times, race throughput, the delay
+    from bet to off, settlement latency, money flow and cache sizes.
+
+    Collection runs on the UI thread and only updates plain counters and
+    fixed-size rings of durations, without locks: every update is a single
+    attribute or item assignment, which the GIL keeps consistent for the
+    server thread. Cache and audio gauges come from objects the UI thread
+    mutates, so they are sampled on the UI thread and published as one
+    snapshot. Percentiles and rates are computed when the endpoint is
+    scraped, on the server's thread.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+import array
+import bisect
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from kivy.clock import Clock
+from kivy.logger import Logger
+
+from events import (
+    BetPlaced, CashedOut, Deposited, EventBus, RaceSettled, RaceStarted, WinnerDecided
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Quantiles reported for durations
+QUANTILES = (0.5, 0.9, 0.99)
+
+# Seconds between samples of the cache and audio gauges
+GAUGE_INTERVAL = 1.0
+
+
+class Durations:
+    """
+    Ring of the most recent durations, e.g. of frames, written by a single thread.
+
+    Attributes:
+        count (int): Number of durations recorded in total.
+        total (float): Sum of all recorded durations in seconds.
+    """
+
+    def __init__(self, size: int = 1024) -> None:
+        """
+        Initialize an empty ring.
+
+        Args:
+            size (int): Number of recent durations kept for percentiles.
+        """
+        self.count: int = 0
+        self.total: float = 0.0
+        self._ring = array.array("d", bytes(8 * size))
+
+    def record(self, seconds: float) -> None:
+        """
+        Record one duration.
+
+        Args:
+            seconds (float): The duration, e.g. the time since the previous frame.
+        """
+        self._ring[self.count % len(self._ring)] = seconds
+        self.total += seconds
+        self.count += 1
+
+    def quantiles(self, qs: Sequence[float] = QUANTILES) -> List[Tuple[float, float]]:
+        """
+        Compute quantiles over the recent durations.
+
+        Args:
+            qs (Sequence[float]): Quantiles between 0 and 1.
+
+        Returns:
+            List[Tuple[float, float]]: (quantile, seconds) pairs; empty before
+            the first duration.
+        """
+        filled = min(self.count, len(self._ring))
+        if not filled:
+            return []
+        recent = sorted(self._ring[:filled])
+        return [(q, recent[min(filled - 1, int(q * filled))]) for q in qs]
+
+
+class MetricsExporter:
+    """
+    Collects metrics from the model's events and serves them over HTTP.
+
+    Attributes:
+        host (str): Address the endpoint listens on.
+        port (int): Port the endpoint listens on.
+        frame_times (Durations): Frame durations recorded by the race animation.
+        settlement_times (Durations): Durations of settling races, recorded
+            by the controller.
+    """
+
+    def __init__(self, events: EventBus, port: int, host: str = "127.0.0.1",
+                 textures=None, effects=None, audio=None) -> None:
+        """
+        Initialize the exporter and subscribe it to the model's events.
+
+        Args:
+            events (EventBus): The game state's event bus.
+            port (int): Port to listen on.
+            host (str): Address to listen on; local only by default.
+            textures (TextureCache): Texture cache to report on, if any.
+            effects (EffectMixer): Effect mixer to report on, if any.
+            audio (AudioLoader): Audio loader to report on, if any.
+        """
+        self.host: str = host
+        self.port: int = port
+        self.frame_times: Durations = Durations()
+        self.settlement_times: Durations = Durations(256)
+        self._textures = textures
+        self._effects = effects
+        self._audio = audio
+
+        self._races = 0
+        self._race_times: "deque[float]" = deque()
+        self._bets = 0
+        self._stakes = 0.0
+        self._payouts = 0.0
+        self._cash_outs = 0
+        self._deposits = 0
+        self._deposited = 0.0
+        self._bet_time: Optional[float] = None
+        self._bet_to_off = (0, 0.0)
+        self._gauges: Dict[str, int] = {}
+        self._sampler = None
+        self._server: Optional[ThreadingHTTPServer] = None
+
+        events.subscribe(BetPlaced, self._on_bet_placed)
+        events.subscribe(RaceStarted, self._on_race_started)
+        events.subscribe(WinnerDecided, self._on_winner)
+        events.subscribe(RaceSettled, self._on_race_settled)
+        events.subscribe(CashedOut, self._on_cashed_out)
+        events.subscribe(Deposited, self._on_deposited)
+
+    def start(self) -> None:
+        """
+        Start serving the endpoint on a background thread and sampling the
+        gauges on the UI thread.
+
+        Raises:
+            OSError: If the address cannot be bound.
+        """
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = exporter.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args) -> None:
+                Logger.debug("Metrics: " + format % args)
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        threading.Thread(
+            target=self._server.serve_forever, name="metrics-http", daemon=True
+        ).start()
+        Logger.info(f"Metrics: serving on http://{self.host}:{self.port}/metrics")
+        self.sample_gauges()
+        self._sampler = Clock.schedule_interval(self.sample_gauges, GAUGE_INTERVAL)
+
+    def close(self) -> None:
+        """
+        Stop serving the endpoint.
+        """
+        if self._sampler is not None:
+            self._sampler.cancel()
+            self._sampler = None
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def render(self) -> str:
+        """
+        Render every metric in the Prometheus text format.
+
+        Returns:
+            str: The exposition text.
+        """
+        lines: List[str] = []
+
+        def metric(name: str, kind: str, help_text: str, samples) -> None:
+            lines.append(f"# HELP horserace_{name} {help_text}")
+            lines.append(f"# TYPE horserace_{name} {kind}")
+            for suffix, value in samples:
+                lines.append(f"horserace_{name}{suffix} {value}")
+
+        frames = self.frame_times
+        metric("race_frame_seconds", "summary", "Time between race animation frames.",
+               [(f'{{quantile="{q}"}}', v) for q, v in frames.quantiles()]
+               + [("_sum", frames.total), ("_count", frames.count)])
+
+        # Copied at once, as races are appended on the UI thread meanwhile;
+        # the times are in order, so the past hour is a suffix of them
+        race_times = list(self._race_times)
+        recent = len(race_times) - bisect.bisect_left(race_times, time.monotonic() - 3600)
+        metric("races_total", "counter", "Races run to a winner.", [("", self._races)])
+        metric("races_last_hour", "gauge", "Races decided in the past hour.", [("", recent)])
+
+        count, total = self._bet_to_off
+        metric("bet_to_off_seconds", "summary", "Time from the last bet to the start of its race.",
+               [("_sum", total), ("_count", count)])
+        settlements = self.settlement_times
+        metric("settlement_seconds", "summary", "Time taken to settle a race.",
+               [(f'{{quantile="{q}"}}', v) for q, v in settlements.quantiles()]
+               + [("_sum", settlements.total), ("_count", settlements.count)])
+
+        metric("bets_total", "counter", "Bets placed.", [("", self._bets)])
+        metric("stakes_total", "counter", "Amount wagered on settled races.", [("", self._stakes)])
+        metric("payouts_total", "counter", "Amount returned to players, including cash-outs.",
+               [("", self._payouts)])
+        metric("cash_outs_total", "counter", "Bets cashed out before the finish.",
+               [("", self._cash_outs)])
+        metric("deposits_total", "counter", "Deposits made.", [("", self._deposits)])
+        metric("deposited_total", "counter", "Amount deposited.", [("", self._deposited)])
+
+        # One snapshot, replaced as a whole by the UI thread
+        gauges = self._gauges
+        if "texture_assets" in gauges:
+            metric("texture_cache_assets", "gauge", "Textures held by the texture cache.",
+                   [("", gauges["texture_assets"])])
+            metric("texture_cache_bytes", "gauge", "Memory held by the texture cache.",
+                   [('{memory="gpu"}', gauges["texture_gpu_bytes"]),
+                    ('{memory="cpu"}', gauges["texture_cpu_bytes"])])
+        if "audio_voices" in gauges:
+            metric("audio_voices", "gauge", "Decoded sound effect voices.",
+                   [("", gauges["audio_voices"])])
+        if "audio_pending" in gauges:
+            metric("audio_pending", "gauge", "Sounds waiting to be loaded.",
+                   [("", gauges["audio_pending"])])
+
+        return "\n".join(lines) + "\n"
+
+    def sample_gauges(self, *args) -> None:
+        """
+        Snapshot the cache and audio gauges for the endpoint. Runs on the UI
+        thread, which owns the objects they are read from.
+        """
+        gauges = {}
+        if self._textures is not None:
+            stats = self._textures.stats()
+            gauges["texture_assets"] = stats["assets"]
+            gauges["texture_gpu_bytes"] = stats["gpu_bytes"]
+            gauges["texture_cpu_bytes"] = stats["cpu_bytes"]
+        if self._effects is not None:
+            gauges["audio_voices"] = self._effects.stats()["voices"]
+        if self._audio is not None:
+            gauges["audio_pending"] = self._audio.pending
+        self._gauges = gauges
+
+    def _on_bet_placed(self, event: BetPlaced) -> None:
+        self._bets += 1
+        self._bet_time = time.monotonic()
+
+    def _on_race_started(self, event: RaceStarted) -> None:
+        if self._bet_time is not None:
+            count, total = self._bet_to_off
+            self._bet_to_off = (count + 1, total + time.monotonic() - self._bet_time)
+            self._bet_time = None
+
+    def _on_winner(self, event: WinnerDecided) -> None:
+        self._races += 1
+        now = time.monotonic()
+        self._race_times.append(now)
+        # Only the past hour is reported; trimming here bounds the times
+        # kept even when nothing scrapes the metrics
+        while self._race_times[0] < now - 3600:
+            self._race_times.popleft()
+
+    def _on_race_settled(self, event: RaceSettled) -> None:
+        self._stakes += event.amount
+        self._payouts += event.amount + event.delta
+
+    def _on_cashed_out(self, event: CashedOut) -> None:
+        self._cash_outs += 1
+
+    def _on_deposited(self, event: Deposited) -> None:
+        self._deposits += 1
+        self._deposited += event.amount
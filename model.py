@@ -3,19 +3,28 @@ File: model.py
 
 Description:
     Defines the core data models for the Horse Race Betting Game, including
-    representations of horses, bets, and overall game state logic.
+    representations of horses, bets, and overall game state logic. State
+    changes are published as events on the game state's event bus.
 
 Version: 1.0
 Author: Robbe de Guytenaer, Bernardo José Willis Lozano
 """
 
 import random
-from typing import List, Optional
+from typing import List, Optional, Sequence
+
+from events import (
+    BalanceChanged, BetPlaced, CashedOut, Deposited, EventBus, LeaderChanged,
+    PositionsTick, RaceFinished, RaceSettled, RaceStarted, WinnerDecided
+)
+from limits import Charge, LimitsEngine
+from physics import PROFILES, FieldKernel, PhysicsProfile
 
 
 class HorseModel:
     """
-    Represents a single horse in the race.
+    Represents a single horse in the race. Its position and speed live in
+    the field's flat lists, which the physics kernel advances in bulk.
 
     Attributes:
         number (int): Unique identifier for the horse.
@@ -23,16 +32,42 @@ class HorseModel:
         speed (float): Current speed of the horse.
     """
 
-    def __init__(self, number: int) -> None:
+    __slots__ = ("number", "_lane", "_positions", "_speeds")
+
+    def __init__(self, number: int, positions: Optional[List[float]] = None,
+                 speeds: Optional[List[float]] = None) -> None:
         """
         Initialize a HorseModel instance.
 
         Args:
             number (int): The horse's unique number.
+            positions (Optional[List[float]]): The field's positions, indexed
+                by number - 1; the horse keeps its own if omitted.
+            speeds (Optional[List[float]]): The field's speeds, likewise.
         """
         self.number: int = number
-        self.position: float = 0.0
-        self.speed: float = 0.0
+        if positions is None:
+            self._lane = 0
+            self._positions, self._speeds = [0.0], [0.0]
+        else:
+            self._lane = number - 1
+            self._positions, self._speeds = positions, speeds
+
+    @property
+    def position(self) -> float:
+        return self._positions[self._lane]
+
+    @position.setter
+    def position(self, value: float) -> None:
+        self._positions[self._lane] = value
+
+    @property
+    def speed(self) -> float:
+        return self._speeds[self._lane]
+
+    @speed.setter
+    def speed(self, value: float) -> None:
+        self._speeds[self._lane] = value
 
 
 class Bet:
@@ -42,6 +77,9 @@ class Bet:
     Attributes:
         horse_number (int): The number of the horse the user bets on.
         amount (float): The amount wagered.
+        cash_out (Optional[float]): Amount received if the bet was cashed out
+            before the race finished.
+        charge (Optional[Charge]): The stake charged to the account's limits.
     """
 
     def __init__(self, horse_number: int, amount: float) -> None:
@@ -54,6 +92,8 @@ class Bet:
         """
         self.horse_number: int = horse_number
         self.amount: float = amount
+        self.cash_out: Optional[float] = None
+        self.charge: Optional[Charge] = None
 
 
 class GameState:
@@ -65,81 +105,318 @@ class GameState:
         balance (float): The player's current balance.
         bet (Optional[Bet]): The active bet, if any.
         winner (Optional[int]): The winning horse number after a race.
+        leader (Optional[int]): The horse currently in the lead during a race.
+        finish_x (float): Position at which a horse has finished the current race.
+        finish_order (List[int]): Horse numbers in the order they crossed the finish.
+        race_ticks (int): Simulation ticks run in the current race.
+        winning_tick (int): Tick on which the winner crossed the finish.
+        start_speeds (List[float]): Speeds assigned at the start of the race.
+        next_speeds (Optional[List[float]]): Speeds drawn ahead of time for the
+            next race by `prepare_race_speeds`.
+        race_seed (int): Seed of the generator driving the current race's
+            speed fluctuations, so a race can be replayed from any tick.
         horses (List[HorseModel]): The list of horses in the race.
+        positions (List[float]): Position of each horse, in horse order.
+        speeds (List[float]): Speed of each horse, in horse order.
+        events (EventBus): Bus on which state changes are published.
+        limits (Optional[LimitsEngine]): Rolling deposit and stake limits.
+        account_id (str): Account the limits are charged to.
+        physics (FieldKernel): The compiled physics profile moving the horses.
     """
 
-    def __init__(self, balance: float) -> None:
+    def __init__(self, balance: float, events: Optional[EventBus] = None,
+                 limits: Optional[LimitsEngine] = None, account_id: str = "local",
+                 physics: Optional[PhysicsProfile] = None) -> None:
         """
         Initialize the game state with a starting balance and six horses.
 
         Args:
             balance (float): Starting player balance.
+            events (Optional[EventBus]): Bus to publish changes on; a new one
+                is created if omitted.
+            limits (Optional[LimitsEngine]): Rolling deposit and stake limits
+                to enforce, if any.
+            account_id (str): Account the limits are charged to.
+            physics (Optional[PhysicsProfile]): Physics of the races; the
+                classic profile if omitted.
         """
         self.balance: float = balance
         self.bet: Optional[Bet] = None
         self.winner: Optional[int] = None
-        self.horses: List[HorseModel] = [HorseModel(i + 1) for i in range(6)]
+        self.leader: Optional[int] = None
+        self.finish_x: float = 0.0
+        self.finish_order: List[int] = []
+        self.race_ticks: int = 0
+        self.winning_tick: int = 0
+        self.start_speeds: List[float] = []
+        self.next_speeds: Optional[List[float]] = None
+        self.race_seed: int = 0
+        self._rng = random.Random()
+        self.positions: List[float] = [0.0] * 6
+        self.speeds: List[float] = [0.0] * 6
+        self.horses: List[HorseModel] = [
+            HorseModel(i + 1, self.positions, self.speeds) for i in range(6)
+        ]
+        self.events: EventBus = events if events is not None else EventBus()
+        self.limits: Optional[LimitsEngine] = limits
+        self.account_id: str = account_id
+        self.physics: FieldKernel = FieldKernel(physics or PROFILES["classic"], len(self.horses))
 
     def place_bet(self, horse_number: int, amount: float) -> None:
         """
-        Place a bet on a specific horse.
+        Place a bet on a specific horse. A bet placed while another one is
+        still open replaces it, and the replaced stake no longer counts
+        against the stake limits.
 
         Args:
             horse_number (int): The number of the horse to bet on.
             amount (float): The amount to wager.
 
         Raises:
-            ValueError: If the amount is not positive or exceeds the current balance.
+            ValueError: If the amount is not positive, exceeds the current
+                balance or would exceed a stake limit.
         """
         if amount <= 0:
             raise ValueError("Enter a valid amount")
         if amount > self.balance:
             raise ValueError("Not enough money in balance")
-        self.bet = Bet(horse_number, amount)
+        bet = Bet(horse_number, amount)
+        if self.limits is not None:
+            # A cashed-out stake was used, so it stays charged
+            previous = self.bet
+            replaces = None
+            if previous is not None and previous.cash_out is None:
+                replaces = previous.charge
+            bet.charge = self.limits.charge(self.account_id, "stake", amount, replaces)
+        self.bet = bet
+        self.events.publish(BetPlaced(horse_number, amount))
 
-    def setup_race(self) -> None:
+    def setup_race(self, finish_x: float = 0.0) -> None:
         """
         Prepare the race by resetting the winner, initializing each horse's
         starting position, and assigning a random starting speed.
+
+        Args:
+            finish_x (float): Finish line of the race, recorded with its start.
         """
-        self.winner = None
+        self._clear_race()
+        self.finish_x = finish_x
         start_x = 100.0
         for horse in self.horses:
             horse.position = start_x
             horse.speed = random.uniform(1.0, 3.0)
+        self.start_speeds = [horse.speed for horse in self.horses]
+        self._seed_race()
+        self._publish_started()
 
-    def setup_race_speeds(self) -> None:
+    def setup_race_speeds(self, finish_x: float = 0.0) -> None:
         """
         Reset the winner and assign a new random speed to each horse without
-        changing positions.
+        changing positions. Speeds prepared with `prepare_race_speeds` are
+        used if present.
+
+        Args:
+            finish_x (float): Finish line of the race, recorded with its start.
         """
-        self.winner = None
-        for horse in self.horses:
-            horse.speed = random.uniform(1.0, 3.0)
+        self._clear_race()
+        self.finish_x = finish_x
+        speeds = self.next_speeds or self.prepare_race_speeds()
+        self.next_speeds = None
+        for horse, speed in zip(self.horses, speeds):
+            horse.speed = speed
+        self.start_speeds = list(speeds)
+        self._seed_race()
+        self._publish_started()
+
+    def prepare_race_speeds(self) -> List[float]:
+        """
+        Draw the starting speeds of the next race ahead of time, so that they
+        can be quoted before the race starts.
+
+        Returns:
+            List[float]: The speeds, in horse order.
+        """
+        self.next_speeds = [random.uniform(1.0, 3.0) for _ in self.horses]
+        return self.next_speeds
 
-    def update_speeds(self) -> None:
+    def _seed_race(self) -> None:
         """
-        Apply a small random fluctuation to each horse's speed and clamp it
-        between minimum and maximum thresholds.
+        Seed the race's own generator; each tick draws one number per horse
+        from it. Also sets the horses' cruising speeds from their start speeds.
         """
-        for horse in self.horses:
-            horse.speed += random.uniform(-0.2, 0.2)
-            horse.speed = max(0.5, min(horse.speed, 4.0))
+        self.race_seed = random.getrandbits(63)
+        self._rng.seed(self.race_seed)
+        self.physics.begin(self.start_speeds)
+
+    def _publish_started(self) -> None:
+        """
+        Publish the start of the race with everything needed to replay it.
+        """
+        self.events.publish(RaceStarted(
+            tuple(self.start_speeds), self.race_seed, tuple(self.positions),
+            self.finish_x, self.physics.profile.name,
+        ))
+
+    def resume_race(self, seed: int, ticks: int) -> None:
+        """
+        Put the race's generator where it was after a number of ticks, so a
+        race restored from a checkpoint continues exactly as it would have.
+
+        Args:
+            seed (int): The race's seed.
+            ticks (int): Ticks the race had run.
+        """
+        self.race_seed = seed
+        self._rng.seed(seed)
+        draw = self._rng.random
+        for _ in range(ticks * len(self.horses)):
+            draw()
+        self.physics.begin(self.start_speeds)
+
+    def advance(self, finish_x: float, ticks: int = 1) -> None:
+        """
+        Run simulation ticks through the physics kernel: change speeds, move
+        every horse and record the first horse to reach the finish as the
+        winner. Changes are published once for the whole batch.
+
+        Args:
+            finish_x (float): Position at which a horse has finished.
+            ticks (int): Number of ticks to simulate.
+        """
+        if ticks <= 0:
+            return
+        self.finish_x = finish_x
+        order = self.finish_order
+        finished = [h.number in order for h in self.horses] if order else [False] * len(self.horses)
+        crossings = self.physics.run(
+            self.positions, self.speeds, self.race_ticks, ticks, finish_x, finished, self._rng.random
+        )
+        self.race_ticks += ticks
+
+        winner = None
+        for tick, lane in crossings:
+            order.append(lane + 1)
+            if self.winner is None and winner is None:
+                winner = lane + 1
+                self.winning_tick = tick
+        self._publish_tick(winner)
+
+    def apply_tick(self, positions: Sequence[float], speeds: Sequence[float],
+                   finish_x: float, ticks: int, winner: Optional[int] = None) -> None:
+        """
+        Take over positions and speeds simulated elsewhere, e.g. by a worker
+        process, and publish the resulting changes.
+
+        Args:
+            positions (Sequence[float]): Position of each horse, in horse order.
+            speeds (Sequence[float]): Speed of each horse, in horse order.
+            finish_x (float): Position at which a horse has finished.
+            ticks (int): Ticks the simulation has run in this race.
+            winner (Optional[int]): Winner reported by the simulation, if decided.
+        """
+        for horse, position, speed in zip(self.horses, positions, speeds):
+            horse.position = position
+            horse.speed = speed
+        self.finish_x = finish_x
+        self.race_ticks = ticks
+
+        # Horses that crossed since the last applied tick, front runner first
+        order = self.finish_order
+        crossed = sorted(
+            (h for h in self.horses if h.position >= finish_x and h.number not in order),
+            key=lambda h: -h.position
+        )
+        numbers = [h.number for h in crossed]
+        if winner in numbers:
+            numbers.remove(winner)
+            numbers.insert(0, winner)
+        order.extend(numbers)
+
+        if winner is not None and self.winner is None:
+            self.winning_tick = ticks
+            self._publish_tick(winner)
+        else:
+            self._publish_tick(None)
+
+    def _publish_tick(self, winner: Optional[int]) -> None:
+        """
+        Publish the position batch, a leader change and a newly decided winner.
+        """
+        events = self.events
+        positions = self.positions
+        if events.has_subscribers(PositionsTick):
+            events.publish(PositionsTick(tuple(positions), tuple(self.speeds)))
+
+        leader = positions.index(max(positions)) + 1
+        if leader != self.leader:
+            self.leader = leader
+            events.publish(LeaderChanged(leader))
+
+        if winner is not None:
+            self.winner = winner
+            events.publish(WinnerDecided(winner))
 
     def resolve_race(self) -> None:
         """
         Adjust the player's balance based on the race outcome and the active bet.
         If the bet matches the winner, the player wins payout equal to bet
         amount times number of horses; otherwise, the bet amount is lost.
+        Every decided race is announced as finished, with or without a bet.
         """
-        if self.bet is None or self.winner is None:
+        if self.winner is None:
             return
 
-        if self.bet.horse_number == self.winner:
-            payout = self.bet.amount * len(self.horses)
-            self.balance += payout
+        # Horses still short of the finish are ranked by how far they got
+        order = list(self.finish_order)
+        order.extend(
+            h.number for h in sorted(self.horses, key=lambda h: -h.position)
+            if h.number not in order
+        )
+        finished = RaceFinished(
+            self.winner, tuple(order), self.winning_tick, tuple(self.start_speeds)
+        )
+        if self.bet is None:
+            self.events.publish(finished)
+            return
+
+        if self.bet.cash_out is not None:
+            # Already credited when the bet was cashed out
+            delta = self.bet.cash_out - self.bet.amount
         else:
-            self.balance -= self.bet.amount
+            if self.bet.horse_number == self.winner:
+                delta = self.bet.amount * len(self.horses)
+            else:
+                delta = -self.bet.amount
+            self.balance += delta
+
+        # The stake comes back with the winnings, or as part of a cash-out
+        self.events.publish(finished._replace(
+            stake=self.bet.amount, payout=self.bet.amount + delta
+        ))
+        self.events.publish(RaceSettled(
+            self.bet.horse_number, self.bet.amount, self.winner, delta, self.balance,
+            tuple(order), self.winning_tick, tuple(self.start_speeds)
+        ))
+        self.events.publish(BalanceChanged(self.balance))
+
+    def cash_out(self, value: float) -> None:
+        """
+        Settle the active bet before the race finishes at a quoted value.
+
+        Args:
+            value (float): Amount the player receives for the bet; the balance
+                changes by this value minus the stake.
+
+        Raises:
+            ValueError: If there is no bet that can still be cashed out.
+        """
+        bet = self.bet
+        if bet is None or bet.cash_out is not None or self.winner is not None:
+            raise ValueError("This bet can no longer be cashed out")
+        bet.cash_out = value
+        self.balance += value - bet.amount
+        self.events.publish(CashedOut(bet.horse_number, bet.amount, value, self.balance))
+        self.events.publish(BalanceChanged(self.balance))
 
     def reset(self) -> None:
         """
@@ -147,11 +424,21 @@ class GameState:
         to zero.
         """
         self.bet = None
-        self.winner = None
+        self._clear_race()
         for horse in self.horses:
             horse.position = 0.0
             horse.speed = 0.0
 
+    def _clear_race(self) -> None:
+        """
+        Forget the outcome and progress of the previous race.
+        """
+        self.winner = None
+        self.leader = None
+        self.finish_order = []
+        self.race_ticks = 0
+        self.winning_tick = 0
+
     def deposit_money(self, amount: float) -> None:
         """
         Increase the player's balance by the specified amount, enforcing a
@@ -161,11 +448,16 @@ class GameState:
             amount (float): The amount to deposit.
 
         Raises:
-            ValueError: If the amount is not positive or exceeds the maximum limit.
+            ValueError: If the amount is not positive, exceeds the maximum limit
+                or would exceed a rolling deposit limit.
         """
         MAX_DEPOSIT = 1000.0
         if amount <= 0:
             raise ValueError("Enter a valid amount")
         if amount > MAX_DEPOSIT:
             raise ValueError(f"Cannot deposit more than ${MAX_DEPOSIT}")
+        if self.limits is not None:
+            self.limits.charge(self.account_id, "deposit", amount)
         self.balance += amount
+        self.events.publish(Deposited(amount, self.balance))
+        self.events.publish(BalanceChanged(self.balance))
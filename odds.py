@@ -0,0 +1,207 @@
+"""
+File: odds.py
+
+Description:
+    Computes in-play win probabilities and cash-out quotes while a race is
+    running. Each horse's speed performs a bounded random walk, so the
+    distance it covers in the next k ticks is approximately normal. Its mean
+    and variance come from the race's physics profile: the jitter, the speed
+    bounds, and the pull of each horse's acceleration towards a cruising
+    speed that fades once it tires. From that, the probability
+    that a horse has finished by tick k follows in closed form; integrating
+    "finishes in this interval while all others are still running" over a
+    coarse time grid gives each horse's chance of winning.
+
+    Quotes are throttled to a few per second and the grid resolution adapts
+    to stay inside a per-quote time budget, so odds never cost a race frame.
+
+    This module must not import Kivy: the model it reads is Kivy-free.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+import math
+import time
+from typing import List, Optional, Sequence
+
+from events import OddsUpdated, PositionsTick, WinnerDecided
+from model import GameState
+from physics import PROFILES, FieldKernel
+
+_SQRT2 = math.sqrt(2.0)
+
+
+def win_probabilities(distances: Sequence[float], speeds: Sequence[float],
+                      steps: int = 24, physics: Optional[FieldKernel] = None,
+                      tick: int = 0, start_speeds: Optional[Sequence[float]] = None
+                      ) -> List[float]:
+    """
+    Estimate each horse's probability of finishing first.
+
+    Args:
+        distances (Sequence[float]): Distance left to the finish per horse, in
+            speed units (scaled up by the race distance); 0 or less for
+            horses that already finished.
+        speeds (Sequence[float]): Current speed per horse in pixels per tick.
+        steps (int): Number of intervals of the time grid.
+        physics (Optional[FieldKernel]): Physics of the race; the classic
+            profile if omitted.
+        tick (int): Ticks the race has run.
+        start_speeds (Optional[Sequence[float]]): Starting speeds of a race
+            that has not begun, setting its cruising speeds; those of the
+            running race are used if omitted.
+
+    Returns:
+        List[float]: Win probability per horse, summing to 1.
+    """
+    count = len(distances)
+    finished = [i for i, d in enumerate(distances) if d <= 0]
+    if finished:
+        # Already decided; the first finisher in horse order wins, as in the model
+        return [1.0 if i == finished[0] else 0.0 for i in range(count)]
+
+    if physics is None:
+        physics = FieldKernel(PROFILES["classic"], count)
+    targets = None if start_speeds is None else physics.cruising_speeds(start_speeds)
+
+    # The race is all but decided once the fastest expected finisher has
+    # had twice its expected time; later intervals carry no probability mass
+    min_speed = physics.profile.min_speed
+    expected = [d / max(v, min_speed) for d, v in zip(distances, speeds)]
+    horizon = 2 * min(expected) + 10
+    dk = horizon / steps
+    means, variances = physics.forecast(
+        speeds, [n * dk for n in range(1, steps + 1)], tick, targets
+    )
+
+    # P(horse i finished by each grid time), all starting at 0
+    finished_by = [[0.0] for _ in range(count)]
+    for i in range(count):
+        lane = finished_by[i]
+        for mean, variance in zip(means[i], variances[i]):
+            if variance > 0:
+                z = (mean - distances[i]) / math.sqrt(variance)
+                lane.append(0.5 * (1 + math.erf(z / _SQRT2)))
+            else:
+                lane.append(1.0 if mean >= distances[i] else 0.0)
+
+    wins = [0.0] * count
+    for n in range(1, steps + 1):
+        # Probability that each horse is still running, midway through the interval
+        running = [1 - 0.5 * (f[n - 1] + f[n]) for f in finished_by]
+        for i in range(count):
+            mass = finished_by[i][n] - finished_by[i][n - 1]
+            if mass <= 0:
+                continue
+            others = 1.0
+            for j in range(count):
+                if j != i:
+                    others *= running[j]
+            wins[i] += mass * others
+
+    total = sum(wins)
+    if total <= 0:
+        return [1 / count] * count
+    return [w / total for w in wins]
+
+
+class OddsQuoter:
+    """
+    Publishes live win probabilities and the active bet's cash-out value.
+
+    The quoter listens to the model's position ticks, recomputes at most
+    `rate` times per second and publishes an OddsUpdated event. If a
+    computation exceeds half the time budget the time grid is coarsened;
+    when it runs well within the budget the grid is refined again.
+
+    Attributes:
+        rate (float): Maximum quotes per second.
+        budget (float): Time budget of one quote in seconds.
+        margin (float): House margin deducted from the fair cash-out value.
+        steps (int): Current resolution of the time grid.
+        latest (Optional[OddsUpdated]): The most recent quote of the running race.
+    """
+
+    MIN_STEPS = 6
+    MAX_STEPS = 48
+
+    def __init__(self, model: GameState, rate: float = 5, budget: float = 0.002,
+                 margin: float = 0.05) -> None:
+        """
+        Initialize the quoter and subscribe it to the model's events.
+
+        Args:
+            model (GameState): The game state to quote.
+            rate (float): Maximum quotes per second.
+            budget (float): Time budget of one quote in seconds.
+            margin (float): House margin on cash-out values, e.g. 0.05 for 5%.
+        """
+        self.model = model
+        self.rate: float = rate
+        self.budget: float = budget
+        self.margin: float = margin
+        self.steps: int = 24
+        self.latest: Optional[OddsUpdated] = None
+        self._last_quote = 0.0
+
+        model.events.subscribe(PositionsTick, self._on_positions)
+        model.events.subscribe(WinnerDecided, self._on_winner)
+
+    def cash_out_value(self, probabilities: Sequence[float]) -> Optional[float]:
+        """
+        Value offered for the active bet given the current win probabilities.
+
+        A winning bet returns the stake plus the stake times the number of
+        horses, so the fair value is that return times the chance of winning.
+
+        Args:
+            probabilities (Sequence[float]): Win probability per horse.
+
+        Returns:
+            Optional[float]: The offer rounded to cents, or None if there is no
+            bet that can be cashed out.
+        """
+        bet = self.model.bet
+        if bet is None or bet.cash_out is not None or self.model.winner is not None:
+            return None
+        full_return = bet.amount * (len(self.model.horses) + 1)
+        fair = probabilities[bet.horse_number - 1] * full_return
+        return round(fair * (1 - self.margin), 2)
+
+    def _on_positions(self, event: PositionsTick) -> None:
+        """
+        Quote the race if the previous quote is old enough.
+        """
+        now = time.perf_counter()
+        if now - self._last_quote < 1 / self.rate or self.model.winner is not None:
+            return
+        self._last_quote = now
+
+        finish_x = self.model.finish_x
+        # Longer races cover the track at a fraction of the speed
+        scale = self.model.physics.distance
+        distances = [(finish_x - p) * scale for p in event.positions]
+        probabilities = win_probabilities(
+            distances, event.speeds, self.steps, self.model.physics, self.model.race_ticks
+        )
+        elapsed = time.perf_counter() - now
+
+        if elapsed > self.budget / 2:
+            self.steps = max(self.MIN_STEPS, self.steps // 2)
+        elif elapsed < self.budget / 8:
+            self.steps = min(self.MAX_STEPS, self.steps + 4)
+
+        self._publish(probabilities)
+
+    def _on_winner(self, event: WinnerDecided) -> None:
+        """
+        Publish the settled odds; the bet can no longer be cashed out.
+        """
+        count = len(self.model.horses)
+        self._publish([1.0 if n == event.horse_number else 0.0 for n in range(1, count + 1)])
+        self._last_quote = 0.0
+
+    def _publish(self, probabilities: List[float]) -> None:
+        self.latest = OddsUpdated(tuple(probabilities), self.cash_out_value(probabilities))
+        self.model.events.publish(self.latest)
@@ -0,0 +1,384 @@
+"""
+File: physics.py
+
+Description:
+    Race physics of the Horse Race Betting Game. How horses move is
+    described by physics profiles, plain data that can be loaded from a JSON
+    file: the race distance, the random walk of the speeds and, per lane, a
+    horse's rating, acceleration and stamina. A profile is compiled into a
+    FieldKernel, which advances the whole field over a batch of ticks in a
+    single call on flat lists of positions and speeds.
+
+    Every tick draws exactly one random number per horse, in lane order,
+    whatever the profile, so a race can still be replayed from its seed.
+    The "classic" profile reproduces the original physics exactly: a uniform
+    random walk of the speeds clamped between fixed bounds.
+
+    This module must not import Kivy: it is used by the model.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+import json
+import math
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+
+class HorseProfile(NamedTuple):
+    """
+    How one lane's horse runs.
+
+    Attributes:
+        rating (float): Relative bias of the horse's cruising speed; 0.1
+            cruises 10% faster than the speed drawn at the start.
+        acceleration (float): Fraction of the gap to the cruising speed
+            closed per tick; 0 leaves the speed to the random walk alone,
+            which the rating, stamina and fade then have no effect on.
+        stamina (float): Ticks the horse holds its cruising speed before
+            tiring; infinite for a horse that never tires.
+        fade (float): Fraction of the cruising speed lost per tick once tired.
+    """
+    rating: float = 0.0
+    acceleration: float = 0.0
+    stamina: float = math.inf
+    fade: float = 0.0
+
+
+class PhysicsProfile(NamedTuple):
+    """
+    Physics of a race, as data.
+
+    Attributes:
+        name (str): Name the profile is selected by.
+        distance (float): Race length in track lengths; the horses cross the
+            track this many times slower.
+        jitter (float): Largest random change of a speed per tick.
+        min_speed (float): Lowest speed in pixels per tick.
+        max_speed (float): Highest speed in pixels per tick.
+        horses (Tuple[HorseProfile, ...]): Per lane; lanes beyond the tuple
+            run like HorseProfile().
+    """
+    name: str
+    distance: float = 1.0
+    jitter: float = 0.2
+    min_speed: float = 0.5
+    max_speed: float = 4.0
+    horses: Tuple[HorseProfile, ...] = ()
+
+
+# Built-in profiles; more can be loaded with `load_profiles`
+PROFILES: Dict[str, PhysicsProfile] = {
+    "classic": PhysicsProfile("classic"),
+    # Short and fast: horses quickly settle at their cruising speeds
+    "sprint": PhysicsProfile(
+        "sprint", distance=0.8, jitter=0.15,
+        horses=(HorseProfile(acceleration=0.05),) * 6,
+    ),
+    # Long races decided by stamina: front runners fade, stayers finish strong
+    "staying": PhysicsProfile(
+        "staying", distance=2.0, jitter=0.1,
+        horses=(
+            HorseProfile(0.15, 0.04, 240, 0.004),
+            HorseProfile(0.10, 0.03, 300, 0.003),
+            HorseProfile(0.05, 0.02, 420, 0.002),
+            HorseProfile(0.00, 0.02, 540, 0.002),
+            HorseProfile(-0.05, 0.02, 720, 0.001),
+            HorseProfile(-0.05, 0.01, math.inf, 0.0),
+        ),
+    ),
+}
+
+
+def load_profiles(path: str) -> Dict[str, PhysicsProfile]:
+    """
+    Read physics profiles from a JSON file: a list of objects with the
+    fields of PhysicsProfile, whose "horses" are objects with the fields of
+    HorseProfile. A null stamina means a horse that never tires.
+
+    Args:
+        path (str): The profile file.
+
+    Returns:
+        Dict[str, PhysicsProfile]: The profiles by name.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If it does not describe valid profiles; the message
+            names the offending profile.
+    """
+    with open(path, encoding="utf-8") as f:
+        rows = json.load(f)
+    if not isinstance(rows, list):
+        raise ValueError(f"Invalid physics profiles in {path}: expected a list of profiles")
+    profiles = {}
+    for index, row in enumerate(rows):
+        label = f"#{index + 1}"
+        if isinstance(row, dict) and isinstance(row.get("name"), str):
+            label = repr(row["name"])
+        try:
+            profile = _profile_from_row(row)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid physics profile {label} in {path}: {e}") from None
+        profiles[profile.name] = profile
+    return profiles
+
+
+def _profile_from_row(row: object) -> PhysicsProfile:
+    """
+    Build and check one profile read by `load_profiles`.
+
+    Args:
+        row (object): The profile's JSON value.
+
+    Returns:
+        PhysicsProfile: The profile.
+
+    Raises:
+        TypeError: If a value has the wrong type or a field is unknown.
+        ValueError: If a value is out of range.
+    """
+    if not isinstance(row, dict):
+        raise TypeError("expected an object")
+    row = dict(row)
+    if not isinstance(row.get("name"), str):
+        raise TypeError("expected a string name")
+    rows = row.pop("horses", [])
+    if not isinstance(rows, list):
+        raise TypeError("expected a list of horses")
+    horses = []
+    for lane, horse in enumerate(rows, 1):
+        if not isinstance(horse, dict):
+            raise TypeError(f"horse {lane}: expected an object")
+        horse = dict(horse)
+        if horse.get("stamina") is None:
+            horse["stamina"] = math.inf
+        try:
+            horse = HorseProfile(**horse)
+        except TypeError as e:
+            raise TypeError(f"horse {lane}: {e}") from None
+        _check_numbers(horse, f"horse {lane}: ")
+        if not 0 <= horse.acceleration <= 1:
+            raise ValueError(f"horse {lane}: acceleration must be between 0 and 1")
+        if horse.stamina < 0 or horse.fade < 0:
+            raise ValueError(f"horse {lane}: stamina and fade must not be negative")
+        # Rating and fatigue act on the cruising speed, which only an
+        # accelerating horse is drawn towards
+        if horse.acceleration == 0 and (
+                horse.rating != 0 or horse.fade != 0 or horse.stamina != math.inf):
+            raise ValueError(f"horse {lane}: rating, stamina and fade need an acceleration above 0")
+        horses.append(horse)
+    profile = PhysicsProfile(horses=tuple(horses), **row)
+    _check_numbers(profile)
+    if profile.distance <= 0 or profile.jitter < 0:
+        raise ValueError("distance must be positive and jitter not negative")
+    if not 0 < profile.min_speed <= profile.max_speed:
+        raise ValueError("speeds must satisfy 0 < min_speed <= max_speed")
+    return profile
+
+
+def _check_numbers(values: NamedTuple, prefix: str = "") -> None:
+    """
+    Check that the numeric fields of a profile are finite numbers; only a
+    horse's stamina may be infinite.
+
+    Args:
+        values (NamedTuple): A PhysicsProfile or HorseProfile.
+        prefix (str): Prepended to the error message.
+
+    Raises:
+        TypeError: If a field is not a number.
+        ValueError: If a field is not finite.
+    """
+    for field, value in zip(values._fields, values):
+        if field in ("name", "horses"):
+            continue
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise TypeError(f"{prefix}{field} must be a number")
+        if math.isnan(value) or (math.isinf(value) and field != "stamina"):
+            raise ValueError(f"{prefix}{field} must be finite")
+
+
+def profile_from_json(text: str) -> PhysicsProfile:
+    """
+    Rebuild a profile serialized with `json.dumps`, e.g. for a worker process.
+
+    Args:
+        text (str): The profile as a JSON array.
+
+    Returns:
+        PhysicsProfile: The profile.
+    """
+    *fields, horses = json.loads(text)
+    return PhysicsProfile(*fields, tuple(HorseProfile(*h) for h in horses))
+
+
+class FieldKernel:
+    """
+    A physics profile compiled for a field of horses.
+
+    Attributes:
+        profile (PhysicsProfile): The compiled profile.
+        distance (float): Race length in track lengths.
+    """
+
+    def __init__(self, profile: PhysicsProfile, num_horses: int) -> None:
+        """
+        Compile a profile into per-lane parameter lists.
+
+        Args:
+            profile (PhysicsProfile): The profile.
+            num_horses (int): Number of horses in the field.
+        """
+        self.profile: PhysicsProfile = profile
+        self.distance: float = profile.distance
+        lanes = [profile.horses[i] if i < len(profile.horses) else HorseProfile()
+                 for i in range(num_horses)]
+        self._bias = [1.0 + h.rating for h in lanes]
+        self._accel = [h.acceleration for h in lanes]
+        self._stamina = [h.stamina for h in lanes]
+        self._fade = [h.fade for h in lanes]
+        self._targets = [0.0] * num_horses
+        # Without acceleration, fatigue or distance the field is a plain
+        # random walk, which skips computing cruising speeds altogether
+        self._walk_only = (
+            not any(self._accel) and profile.distance == 1.0
+        )
+
+    def begin(self, start_speeds: Sequence[float]) -> None:
+        """
+        Derive the horses' cruising speeds from their starting speeds.
+
+        Args:
+            start_speeds (Sequence[float]): Speeds drawn at the start of the race.
+        """
+        self._targets = self.cruising_speeds(start_speeds)
+
+    def cruising_speeds(self, start_speeds: Sequence[float]) -> List[float]:
+        """
+        The cruising speeds a race started at the given speeds would have.
+
+        Args:
+            start_speeds (Sequence[float]): Speeds drawn at the start of the race.
+
+        Returns:
+            List[float]: Cruising speed per lane.
+        """
+        return [s * b for s, b in zip(start_speeds, self._bias)]
+
+    def forecast(self, speeds: Sequence[float], times: Sequence[float], tick: int = 0,
+                 targets: Optional[Sequence[float]] = None
+                 ) -> Tuple[List[List[float]], List[List[float]]]:
+        """
+        Mean and variance of the distance each horse covers by future times.
+
+        The speed relaxes towards the cruising speed by the acceleration per
+        tick and is shaken by the uniform jitter; the cruising speed fades
+        once a horse tires. Each interval between two times uses the
+        cruising speed at its midpoint, and mean speeds are kept within the
+        profile's bounds. Distances are in speed units, before the race
+        distance scales them down.
+
+        Args:
+            speeds (Sequence[float]): Current speed per lane.
+            times (Sequence[float]): Increasing numbers of ticks from now.
+            tick (int): Ticks the race has run so far, for fatigue.
+            targets (Optional[Sequence[float]]): Cruising speed per lane; those
+                of the running race if omitted.
+
+        Returns:
+            Tuple[List[List[float]], List[List[float]]]: Means and variances,
+            per lane, one per time.
+        """
+        p = self.profile
+        lo, hi = p.min_speed, p.max_speed
+        step_variance = p.jitter ** 2 / 3
+        if targets is None:
+            targets = self._targets
+        means, variances = [], []
+        for i, speed in enumerate(speeds):
+            a = self._accel[i]
+            stamina, fade = self._stamina[i], self._fade[i]
+            lane_means, lane_variances = [], []
+            mean, covered, now = speed, 0.0, 0.0
+            for k in times:
+                dt = k - now
+                if a > 0:
+                    target = targets[i]
+                    tired = tick + now + dt / 2 - stamina
+                    if tired > 0:
+                        target *= max(0.0, 1.0 - fade * tired)
+                    # v(t) - target decays by (1 - a) per tick
+                    r = 1.0 - a
+                    decay = r ** dt
+                    covered += target * dt + (mean - target) * r * (1.0 - decay) / a
+                    mean = target + (mean - target) * decay
+                    mean = lo if mean < lo else hi if mean > hi else mean
+                    # Each tick's jitter persists in the speed, shrinking by r per tick
+                    variance = (k - 2 * r * (1 - r ** k) / a
+                                + r * r * (1 - r ** (2 * k)) / (1 - r * r)) / (a * a)
+                else:
+                    covered += mean * dt
+                    variance = k * (k + 1) * (2 * k + 1) / 6
+                now = k
+                lane_means.append(covered)
+                lane_variances.append(step_variance * variance)
+            means.append(lane_means)
+            variances.append(lane_variances)
+        return means, variances
+
+    def run(self, positions: List[float], speeds: List[float], tick: int, ticks: int,
+            finish_x: float, finished: List[bool],
+            random: Callable[[], float]) -> List[Tuple[int, int]]:
+        """
+        Advance the field by a batch of ticks, in place.
+
+        Args:
+            positions (List[float]): Position per lane, updated.
+            speeds (List[float]): Speed per lane, updated.
+            tick (int): Ticks the race has run before this batch.
+            ticks (int): Number of ticks to run.
+            finish_x (float): Position at which a horse has finished.
+            finished (List[bool]): Whether each lane has finished, updated.
+            random (Callable[[], float]): The race's generator, drawn once per
+                horse per tick.
+
+        Returns:
+            List[Tuple[int, int]]: (tick, lane) of every finish, in order.
+        """
+        p = self.profile
+        lo, hi = p.min_speed, p.max_speed
+        j, span = -p.jitter, 2 * p.jitter
+        lanes = range(len(positions))
+        crossings = []
+
+        if self._walk_only:
+            for t in range(tick + 1, tick + ticks + 1):
+                for i in lanes:
+                    v = speeds[i] + (j + span * random())
+                    v = lo if v < lo else hi if v > hi else v
+                    speeds[i] = v
+                    x = positions[i] = positions[i] + v
+                    if x >= finish_x and not finished[i]:
+                        finished[i] = True
+                        crossings.append((t, i))
+            return crossings
+
+        scale = 1.0 / self.distance
+        targets, accel, stamina, fade = self._targets, self._accel, self._stamina, self._fade
+        for t in range(tick + 1, tick + ticks + 1):
+            for i in lanes:
+                target = targets[i]
+                tired = t - stamina[i]
+                if tired > 0:
+                    left = 1.0 - fade[i] * tired
+                    target = target * left if left > 0.0 else 0.0
+                v = speeds[i]
+                v += accel[i] * (target - v) + (j + span * random())
+                v = lo if v < lo else hi if v > hi else v
+                speeds[i] = v
+                x = positions[i] = positions[i] + v * scale
+                if x >= finish_x and not finished[i]:
+                    finished[i] = True
+                    crossings.append((t, i))
+        return crossings
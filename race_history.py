@@ -0,0 +1,341 @@
+"""
+File: race_history.py
+
+Description:
+    Archives every finished race, with or without a bet, in a columnar store
+    for reporting. Each column is a file of fixed-width binary values, one
+    record per race, so appending a race is a handful of small appends and
+    queries read only the columns they need straight from memory-mapped files.
+    Races are stored in settlement order, which makes the time column sorted
+    and lets date ranges be located by binary search instead of a scan. A race
+    counts once it is in every column: a write that fails part-way is cut off
+    again, and opening an archive cuts every column to the races stored in all
+    of them, so the columns stay aligned.
+
+    Columns (per race):
+        time     float64    settlement time (Unix seconds)
+        winner   uint8      winning horse number
+        order    uint8[n]   horse numbers from first to last
+        ticks    uint32     simulation ticks until the winner finished
+        speeds   float32[n] speeds assigned at the start, in horse order
+        stake    float64    amount wagered
+        payout   float64    amount returned to the player (0 for a lost bet or no bet)
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+import array
+import json
+import mmap
+import os
+import queue
+import threading
+import time
+from bisect import bisect_left
+from datetime import date, datetime, timedelta
+from typing import BinaryIO, Dict, Optional, Tuple
+
+from kivy.logger import Logger
+
+from events import EventBus, RaceFinished
+
+META_FILE = "meta.json"
+FORMAT_VERSION = 1
+
+# (column name, array typecode, values per race or None for one per horse)
+COLUMNS = (
+    ("time", "d", 1),
+    ("winner", "B", 1),
+    ("order", "B", None),
+    ("ticks", "I", 1),
+    ("speeds", "f", None),
+    ("stake", "d", 1),
+    ("payout", "d", 1),
+)
+
+
+class RaceHistory:
+    """
+    Append-only columnar archive of finished races with aggregation queries.
+
+    Appends are handed to a background thread; queries run on the caller's
+    thread against memory maps that are refreshed when the archive grew.
+
+    Attributes:
+        directory (str): Directory holding one file per column.
+        num_horses (int): Number of horses per race.
+    """
+
+    def __init__(self, directory: str, num_horses: int = 6) -> None:
+        """
+        Open or create an archive.
+
+        Args:
+            directory (str): Directory holding the column files; created if missing.
+            num_horses (int): Number of horses per race, fixed when the archive is created.
+
+        Raises:
+            ValueError: If an existing archive uses another format or field size.
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory: str = directory
+
+        meta_path = os.path.join(directory, META_FILE)
+        if os.path.exists(meta_path):
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta["version"] != FORMAT_VERSION or meta["num_horses"] != num_horses:
+                raise ValueError(f"Incompatible race history in {directory}: {meta}")
+        else:
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump({"version": FORMAT_VERSION, "num_horses": num_horses}, f)
+        self.num_horses: int = num_horses
+
+        self._widths: Dict[str, int] = {
+            name: (per_race or num_horses) for name, _, per_race in COLUMNS
+        }
+        self._codes: Dict[str, str] = {name: code for name, code, _ in COLUMNS}
+        # Bytes per race in each column
+        self._sizes: Dict[str, int] = {
+            name: array.array(code).itemsize * self._widths[name] for name, code, _ in COLUMNS
+        }
+        self._maps: Dict[str, Tuple[mmap.mmap, memoryview]] = {}
+        self._mapped_count = 0
+
+        # Drop races cut short in some columns, e.g. by a crash mid-append
+        self._count = len(self)
+        for name in self._sizes:
+            path = self._path(name)
+            if os.path.exists(path) and os.path.getsize(path) > self._count * self._sizes[name]:
+                os.truncate(path, self._count * self._sizes[name])
+
+        self._queue: "queue.Queue" = queue.Queue()
+        self._writer = threading.Thread(target=self._run, name="race-history", daemon=True)
+        self._writer.start()
+
+    def attach(self, events: EventBus) -> None:
+        """
+        Archive every race finished on a model's event bus.
+
+        Args:
+            events (EventBus): The game state's event bus.
+        """
+        events.subscribe(RaceFinished, self.append)
+
+    def append(self, finished: RaceFinished, timestamp: Optional[float] = None) -> None:
+        """
+        Queue a finished race for archiving.
+
+        Args:
+            finished (RaceFinished): The model's event closing the race.
+            timestamp (Optional[float]): Settlement time; defaults to now.
+        """
+        self._queue.put((time.time() if timestamp is None else timestamp, finished))
+
+    def flush(self) -> None:
+        """
+        Wait until every queued race has been written.
+        """
+        self._queue.join()
+
+    def close(self) -> None:
+        """
+        Write queued races, stop the writer and unmap the columns.
+        """
+        if not self._writer.is_alive():
+            return
+        self._queue.put(None)
+        self._writer.join()
+        self._unmap()
+
+    def __len__(self) -> int:
+        sizes = [
+            os.path.getsize(self._path(name)) // size if os.path.exists(self._path(name)) else 0
+            for name, size in self._sizes.items()
+        ]
+        # A race is complete once it is present in every column
+        return min(sizes)
+
+    def column(self, name: str, start: Optional[float] = None,
+               end: Optional[float] = None) -> memoryview:
+        """
+        Return a column's values for the races settled in a time range.
+
+        The view reads straight from the memory-mapped file; per-horse columns
+        hold `num_horses` consecutive values per race. Views must be released
+        (or dropped) before the archive is closed.
+
+        Args:
+            name (str): Column name.
+            start (Optional[float]): Earliest settlement time, inclusive.
+            end (Optional[float]): Latest settlement time, exclusive.
+
+        Returns:
+            memoryview: The column values of the selected races.
+        """
+        lo, hi = self._range(start, end)
+        width = self._widths[name]
+        return self._view(name)[lo * width:hi * width]
+
+    def win_rate_by_horse(self, start: Optional[float] = None,
+                          end: Optional[float] = None) -> Dict[int, float]:
+        """
+        Fraction of races won by each horse number in a time range.
+
+        Args:
+            start (Optional[float]): Earliest settlement time, inclusive.
+            end (Optional[float]): Latest settlement time, exclusive.
+
+        Returns:
+            Dict[int, float]: Win rate per horse number; empty without races.
+        """
+        winners = self.column("winner", start, end)
+        total = len(winners)
+        if not total:
+            return {}
+        counts = bytes(winners)
+        winners.release()
+        return {n: counts.count(n) / total for n in range(1, self.num_horses + 1)}
+
+    def house_return_per_day(self, start: Optional[date] = None,
+                             end: Optional[date] = None) -> Dict[date, float]:
+        """
+        Stakes taken minus payouts made, per local calendar day.
+
+        Args:
+            start (Optional[date]): First day, inclusive; defaults to the first race.
+            end (Optional[date]): Last day, inclusive; defaults to the last race.
+
+        Returns:
+            Dict[date, float]: House return per day that had races.
+        """
+        count = self._refresh()
+        if not count:
+            return {}
+        times = self._view("time")
+        first = start or datetime.fromtimestamp(times[0]).date()
+        last = end or datetime.fromtimestamp(times[count - 1]).date()
+        stake, payout = self._view("stake"), self._view("payout")
+
+        result = {}
+        day = first
+        lo = self._bisect(self._day_start(day))
+        while day <= last and lo < count:
+            hi = self._bisect(self._day_start(day + timedelta(days=1)))
+            if hi > lo:
+                result[day] = sum(stake[lo:hi]) - sum(payout[lo:hi])
+            day += timedelta(days=1)
+            lo = hi
+        return result
+
+    def _run(self) -> None:
+        """
+        Writer thread: append queued races to every column file.
+        """
+        # Unbuffered, so a failed append can be cut off exactly
+        files = {name: open(self._path(name), "ab", buffering=0) for name, _, _ in COLUMNS}
+        try:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    self._queue.task_done()
+                    return
+                timestamp, finished = item
+                values = {
+                    "time": (timestamp,),
+                    "winner": (finished.winner,),
+                    "order": finished.finishing_order,
+                    "ticks": (finished.ticks,),
+                    "speeds": finished.start_speeds,
+                    "stake": (finished.stake,),
+                    "payout": (finished.payout,),
+                }
+                try:
+                    records = {
+                        name: array.array(code, values[name]).tobytes() for name, code, _ in COLUMNS
+                    }
+                    for name, record in records.items():
+                        if len(record) != self._sizes[name]:
+                            raise ValueError(f"{name} needs {self._widths[name]} values per race")
+                    for name, record in records.items():
+                        if files[name].write(record) != len(record):
+                            raise OSError(f"short write to {self._path(name)}")
+                    self._count += 1
+                except (OSError, OverflowError, ValueError) as e:
+                    Logger.error(f"RaceHistory: unable to archive race: {e}")
+                    self._realign(files)
+                self._queue.task_done()
+        finally:
+            for f in files.values():
+                f.close()
+
+    def _realign(self, files: Dict[str, BinaryIO]) -> None:
+        """
+        Cut the columns back to the races stored in all of them after a
+        failed append.
+
+        Args:
+            files (Dict[str, BinaryIO]): The writer's column files.
+        """
+        for name, f in files.items():
+            try:
+                f.truncate(self._count * self._sizes[name])
+            except OSError as e:
+                Logger.error(f"RaceHistory: unable to realign {self._path(name)}: {e}")
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, f"{name}.col")
+
+    def _refresh(self) -> int:
+        """
+        Remap the columns if races were appended since they were last mapped.
+
+        Returns:
+            int: Number of complete races.
+        """
+        count = len(self)
+        if count != self._mapped_count:
+            self._unmap()
+            self._mapped_count = count
+        return count
+
+    def _view(self, name: str) -> memoryview:
+        """
+        Typed view over the races mapped by the last `_refresh`.
+        """
+        if name not in self._maps:
+            code = self._codes[name]
+            length = self._mapped_count * self._widths[name] * array.array(code).itemsize
+            if not length:
+                return memoryview(array.array(code))
+            with open(self._path(name), "rb") as f:
+                mapped = mmap.mmap(f.fileno(), length, access=mmap.ACCESS_READ)
+            self._maps[name] = (mapped, memoryview(mapped).cast(code))
+        return self._maps[name][1]
+
+    def _unmap(self) -> None:
+        for mapped, view in self._maps.values():
+            try:
+                view.release()
+                mapped.close()
+            except BufferError:
+                # A caller still holds a column view; it is unmapped when collected
+                pass
+        self._maps = {}
+
+    def _range(self, start: Optional[float], end: Optional[float]) -> Tuple[int, int]:
+        """
+        Locate the races settled in [start, end) by binary search on time.
+        """
+        count = self._refresh()
+        lo = 0 if start is None else self._bisect(start)
+        hi = count if end is None else self._bisect(end)
+        return lo, max(lo, hi)
+
+    def _bisect(self, timestamp: float) -> int:
+        return bisect_left(self._view("time"), timestamp)
+
+    @staticmethod
+    def _day_start(day: date) -> float:
+        return datetime.combine(day, datetime.min.time()).timestamp()
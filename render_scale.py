@@ -0,0 +1,86 @@
+"""
+File: render_scale.py
+
+Description:
+    Render-scale mode for big screens driven by weak GPUs. The race track,
+    with its horses, is drawn into an offscreen framebuffer at a fraction of
+    the window's resolution, and that framebuffer is stretched over the
+    track's area of the window. The widgets keep their window size and
+    layout; only the pixels the GPU fills for them are reduced, by the
+    square of the scale. The controls, labels and popups are drawn outside
+    the container and stay at native resolution.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+from kivy.graphics import (
+    ClearBuffers, ClearColor, Color, Fbo, PopMatrix, PushMatrix, Rectangle, Scale, Translate
+)
+from kivy.uix.widget import Widget
+
+
+class RenderScaleContainer(Widget):
+    """
+    Widget drawing its single child into a framebuffer at a reduced resolution.
+
+    Attributes:
+        scale (float): Internal resolution as a fraction of the window's, e.g. 0.5.
+        child (Widget): The widget rendered at the reduced resolution.
+    """
+
+    def __init__(self, child: Widget, scale: float, smooth: bool = True, **kwargs):
+        """
+        Wrap a widget; it is kept at the container's position and size.
+
+        Args:
+            child (Widget): The widget to render, e.g. the race track.
+            scale (float): Internal resolution as a fraction of the window's,
+                between 0 and 1.
+            smooth (bool): Upscale with linear filtering rather than
+                nearest-neighbour, which keeps hard pixel edges.
+        """
+        super().__init__(**kwargs)
+        self.scale: float = scale
+        self.child = child
+        self._filter = "linear" if smooth else "nearest"
+
+        self.fbo = Fbo(size=(1, 1))
+        with self.fbo.before:
+            ClearColor(0, 0, 0, 1)
+            ClearBuffers()
+            PushMatrix()
+            # Map the window coordinates the child lays out in onto the buffer
+            self._scale = Scale(scale, scale, 1)
+            self._translate = Translate()
+        with self.fbo.after:
+            PopMatrix()
+        # The buffer is drawn before the rectangle showing it
+        self.canvas.add(self.fbo)
+        with self.canvas:
+            Color(1, 1, 1, 1)
+            self._rect = Rectangle()
+
+        child.size_hint = (None, None)
+        super().add_widget(child)
+        # Draw the child into the buffer instead of the window
+        self.canvas.remove(child.canvas)
+        self.fbo.add(child.canvas)
+        self.bind(pos=self._update, size=self._update)
+
+    def _update(self, *args) -> None:
+        """
+        Resize the buffer to the container's size at the internal resolution
+        and keep the child at the container's geometry.
+        """
+        w, h = max(1, int(self.width * self.scale)), max(1, int(self.height * self.scale))
+        if tuple(self.fbo.size) != (w, h):
+            self.fbo.size = (w, h)
+            texture = self.fbo.texture
+            texture.mag_filter = self._filter
+            self._rect.texture = texture
+        self._translate.xy = (-self.x, -self.y)
+        self._rect.pos = self.pos
+        self._rect.size = self.size
+        self.child.pos = self.pos
+        self.child.size = self.size
@@ -0,0 +1,406 @@
+"""
+File: replay_export.py
+
+Description:
+    Offline export of race replays to PNG image sequences, for highlight
+    clips and dispute review. Races are read from the event log, whose
+    RaceStarted records hold everything needed to replay a race exactly, or
+    generated from seeds. Each race is simulated again with its physics
+    profile and drawn by the game's own RaceTrack and HorseSprite widgets
+    into an offscreen framebuffer; no window is shown.
+
+    Frames are stepped by the export's frame rate instead of the clock, so
+    a race is exported as fast as it can be drawn rather than in real time.
+    Reading a frame back is the only work done per frame on the main thread;
+    PNG encoding runs on a pool of threads, as zlib releases the GIL while
+    compressing.
+
+    A recorded race is drawn at the export's size: its positions are scaled
+    from the recorded track to the exported one, so the replay has the
+    recorded outcome at any resolution. The replayed winner is checked
+    against the winner the log recorded.
+
+    Usage:
+        python replay_export.py --events events --since 2024-05-01 --out replays
+        python replay_export.py --seed 1 2 3 --physics staying --fps 60
+
+    Every race is written to its own folder, <out>/<race>/frame-00000.png, ...
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+import argparse
+import os
+import random
+import struct
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterator, NamedTuple, Optional, Tuple
+
+# Kivy must neither parse this tool's arguments nor show its window
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+from kivy.config import Config  # noqa: E402
+Config.set("graphics", "window_state", "hidden")
+
+from kivy.core.image import Image as CoreImage  # noqa: E402
+from kivy.graphics import ClearBuffers, ClearColor, Fbo  # noqa: E402
+from kivy.graphics.opengl import (  # noqa: E402
+    GL_PACK_ALIGNMENT, GL_RGB, GL_UNSIGNED_BYTE, glPixelStorei, glReadPixels
+)
+from kivy.lang import Builder  # noqa: E402
+
+from event_log import read_events  # noqa: E402
+from model import GameState  # noqa: E402
+from physics import PROFILES, PhysicsProfile, load_profiles  # noqa: E402
+from texture_cache import TextureCache  # noqa: E402
+from view import RaceTrack  # noqa: E402
+
+NUM_HORSES = 6
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+class Replay(NamedTuple):
+    """
+    A race to export.
+
+    Attributes:
+        name (str): Name of the folder the race's frames are written to.
+        seed (int): Seed of the race's generator.
+        start_speeds (Tuple[float, ...]): Speeds assigned at the start.
+        positions (Tuple[float, ...]): Starting positions on the recorded track.
+        finish_x (float): Finish line on the recorded track.
+        physics (str): Name of the physics profile.
+        winner (Optional[int]): Winner recorded for the race, if known.
+    """
+    name: str
+    seed: int
+    start_speeds: Tuple[float, ...]
+    positions: Tuple[float, ...]
+    finish_x: float
+    physics: str = "classic"
+    winner: Optional[int] = None
+
+
+def seeded_replay(seed: int, physics: str = "classic", width: float = 1000) -> Replay:
+    """
+    Generate a race from a seed, laid out like the game's track.
+
+    Args:
+        seed (int): Seed of the race; the same seed gives the same race.
+        physics (str): Name of the physics profile.
+        width (float): Width of the track the race is laid out on; the
+            race's outcome depends on it, not on the size it is exported at.
+
+    Returns:
+        Replay: The race.
+    """
+    rng = random.Random(seed)
+    return Replay(
+        name=f"seed-{seed}",
+        seed=seed,
+        start_speeds=tuple(rng.uniform(1.0, 3.0) for _ in range(NUM_HORSES)),
+        positions=(width * 0.1,) * NUM_HORSES,
+        finish_x=width * 0.9,
+        physics=physics,
+    )
+
+
+def recorded_replays(directory: str, start: Optional[float] = None,
+                     end: Optional[float] = None) -> Iterator[Replay]:
+    """
+    Read the races started in a time range from the event log.
+
+    Races logged before their starts were recorded in full cannot be
+    replayed and are skipped.
+
+    Args:
+        directory (str): The event log directory.
+        start (Optional[float]): Earliest race start, inclusive.
+        end (Optional[float]): Latest race start, exclusive.
+
+    Yields:
+        Replay: One race per logged start, with the winner logged after it.
+    """
+    pending = None
+    for record in read_events(directory, start, end):
+        kind = record["type"]
+        if kind == "WinnerDecided" and pending is not None:
+            yield pending._replace(winner=record["horse_number"])
+            pending = None
+        elif kind == "RaceStarted":
+            if pending is not None:
+                yield pending
+            pending = None
+            if "seed" in record and record.get("finish_x"):
+                pending = Replay(
+                    name=f"race-{int(record['t'] * 1000)}",
+                    seed=record["seed"],
+                    start_speeds=tuple(record["start_speeds"]),
+                    positions=tuple(record["positions"]),
+                    finish_x=record["finish_x"],
+                    physics=record["physics"],
+                )
+    if pending is not None:
+        yield pending
+
+
+def write_png(path: str, width: int, height: int, pixels: bytes, level: int = 1) -> None:
+    """
+    Write a frame read back from a framebuffer as an RGB PNG file.
+
+    Args:
+        path (str): The file to write.
+        width (int): Frame width in pixels.
+        height (int): Frame height in pixels.
+        pixels (bytes): Tightly packed RGB pixels, bottom row first as
+            OpenGL reads them.
+        level (int): zlib compression level, 1 (fastest) to 9 (smallest).
+    """
+    # PNG stores rows top first, each behind a filter type byte (0, none)
+    stride = width * 3
+    view = memoryview(pixels)
+    rows = []
+    for y in range(height - 1, -1, -1):
+        rows.append(b"\0")
+        rows.append(view[y * stride:(y + 1) * stride])
+    data = zlib.compress(b"".join(rows), level)
+    with open(path, "wb") as f:
+        f.write(_PNG_SIGNATURE)
+        f.write(_png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)))
+        f.write(_png_chunk(b"IDAT", data))
+        f.write(_png_chunk(b"IEND", b""))
+
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+    return (struct.pack(">I", len(data)) + kind + data
+            + struct.pack(">I", zlib.crc32(data, zlib.crc32(kind))))
+
+
+class ReplayExporter:
+    """
+    Draws replayed races offscreen and writes their frames as PNG files.
+
+    Attributes:
+        width (int): Frame width in pixels.
+        height (int): Frame height in pixels.
+        fps (float): Frames per second of replayed race time.
+        hold (float): Seconds exported after the winner finishes.
+        profiles (Dict[str, PhysicsProfile]): Physics profiles by name.
+        level (int): zlib compression level of the PNG files.
+    """
+
+    # Duration of one race simulation tick; matches GameView.RACE_TICK
+    RACE_TICK = 1 / 60
+
+    # Seconds per frame of the gallop animation; matches HorseSprite's anim_delay
+    GALLOP_FRAME = 0.05
+
+    # Longest race exported, in seconds, for profiles that never finish
+    MAX_RACE_SECONDS = 600
+
+    def __init__(self, width: int, height: int, fps: float = 30, hold: float = 2,
+                 profiles: Optional[Dict[str, PhysicsProfile]] = None, level: int = 1,
+                 jobs: Optional[int] = None) -> None:
+        """
+        Build the track and the framebuffer it is drawn into.
+
+        Args:
+            width (int): Frame width in pixels.
+            height (int): Frame height in pixels.
+            fps (float): Frames per second of replayed race time.
+            hold (float): Seconds exported after the winner finishes.
+            profiles (Optional[Dict[str, PhysicsProfile]]): Physics profiles by
+                name; the built-in ones if omitted.
+            level (int): zlib compression level of the PNG files.
+            jobs (Optional[int]): Threads encoding PNG files; one per CPU if omitted.
+        """
+        self.width: int = width
+        self.height: int = height
+        self.fps: float = fps
+        self.hold: float = hold
+        self.profiles: Dict[str, PhysicsProfile] = profiles if profiles is not None else dict(PROFILES)
+        self.level: int = level
+        self._jobs = jobs or os.cpu_count() or 1
+
+        textures = TextureCache()
+        self.track = RaceTrack(textures=textures, show_odds=False)
+        self.track.size_hint = (None, None)
+        self.track.size = (width, height)
+        self.track.reset_horses()
+        for sprite in self.track.horses:
+            # Labels render on the next clock tick, which never comes here
+            sprite.label.texture_update()
+        # Gallop frames per horse, shown by race time instead of the clock
+        self._gallop = [
+            CoreImage(sprite.animated_source).image.textures for sprite in self.track.horses
+        ]
+
+        self.fbo = Fbo(size=(width, height))
+        with self.fbo.before:
+            ClearColor(0, 0, 0, 1)
+            ClearBuffers()
+        self.fbo.add(self.track.canvas)
+
+    def export(self, replay: Replay, directory: str) -> Tuple[int, Optional[int]]:
+        """
+        Replay a race and write its frames.
+
+        Args:
+            replay (Replay): The race.
+            directory (str): Folder the frames are written to; created if missing.
+
+        Returns:
+            Tuple[int, Optional[int]]: Number of frames written and the replayed
+            winner, or None if the race did not finish within MAX_RACE_SECONDS.
+
+        Raises:
+            ValueError: If the race's physics profile is unknown.
+        """
+        profile = self.profiles.get(replay.physics)
+        if profile is None:
+            raise ValueError(f"Unknown physics profile {replay.physics!r}")
+        os.makedirs(directory, exist_ok=True)
+
+        model = GameState(balance=0, physics=profile)
+        model.positions[:] = replay.positions
+        model.speeds[:] = replay.start_speeds
+        model.start_speeds = list(replay.start_speeds)
+        model.resume_race(replay.seed, 0)
+
+        track = self.track
+        track.reset_horses()
+        for sprite in track.horses:
+            sprite.set_running(True)
+            # The gallop is stepped by race time below, not by the clock
+            sprite.image.anim_delay = -1
+        # Recorded positions are scaled from the recorded track to this one
+        scale = track.width * 0.9 / replay.finish_x
+        x0 = track.x
+
+        pending = deque()
+        frame = 0
+        end = self.MAX_RACE_SECONDS
+        with ThreadPoolExecutor(self._jobs) as pool:
+            while True:
+                t = frame / self.fps
+                if t > end:
+                    break
+                ticks = int(t / self.RACE_TICK)
+                decided = model.winner is not None
+                # Horses keep running past the line while the result is held
+                model.advance(replay.finish_x, ticks - model.race_ticks)
+                if not decided and model.winner is not None:
+                    end = t + self.hold
+                    track.horses[model.winner - 1].highlight()
+                # Positions advance by the speed scaled down by the race distance
+                step = (t / self.RACE_TICK - ticks) / model.physics.distance
+
+                gallop = int(t / self.GALLOP_FRAME)
+                for sprite, frames, pos, speed in zip(
+                        track.horses, self._gallop, model.positions, model.speeds):
+                    sprite.x = x0 + (pos + speed * step) * scale
+                    sprite.image.texture = frames[gallop % len(frames)]
+
+                path = os.path.join(directory, f"frame-{frame:05d}.png")
+                pending.append(pool.submit(
+                    write_png, path, self.width, self.height, self._draw(), self.level
+                ))
+                # Bound the frames held in memory while waiting to be encoded
+                if len(pending) > 2 * self._jobs:
+                    pending.popleft().result()
+                frame += 1
+            for job in pending:
+                job.result()
+        return frame, model.winner
+
+    def _draw(self) -> bytes:
+        """
+        Draw the track into the framebuffer and read the frame back.
+
+        Returns:
+            bytes: Tightly packed RGB pixels, bottom row first.
+        """
+        # Apply the widgets' kv canvas rules, which the event loop would
+        # otherwise do before drawing a frame
+        Builder.sync()
+        fbo = self.fbo
+        fbo.draw()
+        # Read as RGB: blending leaves the alpha channel below 1 in places,
+        # and the driver drops it faster than Python could
+        fbo.bind()
+        try:
+            glPixelStorei(GL_PACK_ALIGNMENT, 1)
+            return glReadPixels(0, 0, self.width, self.height, GL_RGB, GL_UNSIGNED_BYTE)
+        finally:
+            fbo.release()
+
+
+def _timestamp(text: Optional[str]) -> Optional[float]:
+    """
+    Parse an ISO date or date and time given on the command line.
+    """
+    return datetime.fromisoformat(text).timestamp() if text else None
+
+
+def main(argv=None) -> None:
+    """
+    Parse the command line and export the selected races.
+    """
+    parser = argparse.ArgumentParser(description="Export race replays as PNG image sequences.")
+    parser.add_argument("--events", metavar="DIR", help="event log directory to read recorded races from")
+    parser.add_argument("--since", help="earliest race start, ISO date or date and time")
+    parser.add_argument("--until", help="latest race start (exclusive), ISO date or date and time")
+    parser.add_argument("--seed", type=int, nargs="+", default=[], help="races to generate from seeds")
+    parser.add_argument("--physics", default="classic", help="physics profile of seeded races")
+    parser.add_argument("--physics-file", help="JSON file with additional physics profiles")
+    parser.add_argument("--out", default="replays", help="directory receiving one folder per race")
+    parser.add_argument("--size", default="1000x600", help="frame size, WIDTHxHEIGHT")
+    parser.add_argument("--fps", type=float, default=30, help="frames per second of race time")
+    parser.add_argument("--hold", type=float, default=2, help="seconds exported after the winner finishes")
+    parser.add_argument("--level", type=int, default=1, help="PNG compression level, 1 to 9")
+    parser.add_argument("--jobs", type=int, default=0, help="PNG encoding threads; one per CPU if 0")
+    args = parser.parse_args(argv)
+    if not args.events and not args.seed:
+        parser.error("give --events, --seed or both")
+
+    profiles = dict(PROFILES)
+    if args.physics_file:
+        profiles.update(load_profiles(args.physics_file))
+    width, _, height = args.size.partition("x")
+    exporter = ReplayExporter(
+        int(width), int(height), fps=args.fps, hold=args.hold,
+        profiles=profiles, level=args.level, jobs=args.jobs or None,
+    )
+
+    # Seeded races run on the game's default track, whatever the frame size
+    replays = [seeded_replay(seed, args.physics) for seed in args.seed]
+    if args.events:
+        replays.extend(recorded_replays(args.events, _timestamp(args.since), _timestamp(args.until)))
+    if not replays:
+        print("No replayable races found")
+        return
+
+    print(f"{'race':<24} {'frames':>7} {'winner':>6} {'seconds':>8} {'speed':>7}")
+    for replay in replays:
+        started = time.perf_counter()
+        try:
+            frames, winner = exporter.export(replay, os.path.join(args.out, replay.name))
+        except ValueError as e:
+            print(f"{replay.name:<24} skipped: {e}")
+            continue
+        elapsed = time.perf_counter() - started
+        speed = frames / args.fps / elapsed
+        # Races capped at MAX_RACE_SECONDS end without a winner
+        shown = "-" if winner is None else winner
+        print(f"{replay.name:<24} {frames:>7} {shown:>6} {elapsed:>8.2f} {speed:>6.1f}x")
+        if winner is not None and replay.winner is not None and replay.winner != winner:
+            print(f"{'':<24} warning: the log recorded horse {replay.winner} as the winner")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+File: scheduler.py
+
+Description:
+    Runs races back to back in timed mode. Each race cycles through four
+    phases: an open betting window, the off (the race itself), a hold while
+    the result is shown, and a reset into the next betting window. The next
+    race is prepared while the current one renders, so the reset only swaps
+    already prepared state and the next window opens within a frame or two.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+from kivy.clock import Clock
+
+from events import WinnerDecided
+
+
+class RaceScheduler:
+    """
+    Drives a GameController through timed betting windows and races.
+
+    Attributes:
+        controller: The GameController running the races.
+        betting_window (float): Seconds bets are accepted before each race.
+        result_hold (float): Seconds the result stays on screen.
+        phase (str): One of "idle", "betting", "off", "hold" or "reset".
+    """
+
+    PHASES = ("idle", "betting", "off", "hold", "reset")
+
+    def __init__(self, controller, betting_window: float = 15.0,
+                 result_hold: float = 3.0) -> None:
+        """
+        Initialize the scheduler and attach it to a controller.
+
+        Args:
+            controller: The GameController running the races.
+            betting_window (float): Seconds bets are accepted before each race.
+            result_hold (float): Seconds the result stays on screen.
+        """
+        self.controller = controller
+        self.betting_window: float = betting_window
+        self.result_hold: float = result_hold
+        self.phase: str = "idle"
+        self._remaining = 0
+        self._off_event = None
+        self._countdown_event = None
+        self._reset_event = None
+        controller.scheduler = self
+
+    def start(self) -> None:
+        """
+        Open the first betting window.
+        """
+        if self.phase != "idle":
+            return
+        self.controller.model.events.subscribe(WinnerDecided, self._on_winner)
+        self._open_betting()
+
+    def resume(self) -> None:
+        """
+        Take over a race resumed from a checkpoint: wait for its winner, or
+        hold its result if it was already decided.
+        """
+        if self.phase != "idle":
+            return
+        self.controller.model.events.subscribe(WinnerDecided, self._on_winner)
+        if self.controller.model.winner is None:
+            self.phase = "off"
+            Clock.schedule_once(lambda _dt: self.controller.prepare_next_race(), 0)
+        else:
+            self._on_winner(WinnerDecided(self.controller.model.winner))
+
+    def stop(self) -> None:
+        """
+        Stop scheduling races; a race that is running finishes on its own.
+        """
+        self.controller.model.events.unsubscribe(WinnerDecided, self._on_winner)
+        for event in (self._off_event, self._countdown_event, self._reset_event):
+            if event is not None:
+                event.cancel()
+        self.controller.view.hide_countdown()
+        self.phase = "idle"
+
+    def _open_betting(self) -> None:
+        """
+        Accept bets for the betting window, then start the race.
+        """
+        self.phase = "betting"
+        if self.controller.model.next_speeds is None:
+            # Only the first race is prepared here; later ones are prepared
+            # while the previous race is running
+            self.controller.prepare_next_race()
+        self.controller.show_next_race()
+
+        self._remaining = int(round(self.betting_window))
+        self.controller.view.show_countdown(self._remaining)
+        self._countdown_event = Clock.schedule_interval(self._count_down, 1)
+        self._off_event = Clock.schedule_once(self._off, self.betting_window)
+
+    def _count_down(self, dt) -> None:
+        self._remaining = max(0, self._remaining - 1)
+        self.controller.view.show_countdown(self._remaining)
+
+    def _off(self, dt) -> None:
+        """
+        Close the betting window and start the race.
+        """
+        self._countdown_event.cancel()
+        self.controller.view.hide_countdown()
+        self.phase = "off"
+        self.controller.start_race()
+        # Prepare the next race on the frame after the start, while this one renders
+        Clock.schedule_once(lambda _dt: self.controller.prepare_next_race(), 0)
+
+    def _on_winner(self, event: WinnerDecided) -> None:
+        """
+        Hold the result on screen, then reset into the next betting window.
+        """
+        self.phase = "hold"
+        self._reset_event = Clock.schedule_once(self._reset, self.result_hold)
+
+    def _reset(self, dt) -> None:
+        """
+        Settle the race and open the next betting window in the same frame.
+        """
+        self.phase = "reset"
+        self.controller.finish_race()
+        self._open_betting()
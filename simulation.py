@@ -0,0 +1,338 @@
+"""
+File: simulation.py
+
+Description:
+    Runs the race simulation in a separate worker process so that it does not
+    compete with Kivy's rendering and input handling for the GIL. The worker
+    advances the horses in fixed ticks and publishes every tick into a
+    shared-memory ring buffer, which the main process reads in place without
+    copying or unpickling anything. Commands reach the worker as JSON lines
+    on its standard input.
+
+    Shared memory layout (all fields 8 bytes):
+        header: latest published tick, winning horse number (0 = none yet),
+                number of the race being published, first tick of that race
+        ring:   RING_SLOTS slots of [tick, positions..., speeds...]
+
+    The worker runs this file as a script rather than through multiprocessing,
+    so it never re-imports main.py and with it Kivy and the window. For the
+    same reason this module must not import Kivy itself.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+import array
+import json
+import queue
+import subprocess
+import sys
+import threading
+import time
+from multiprocessing import resource_tracker, shared_memory
+from typing import List, Optional
+
+from events import WinnerDecided
+from model import GameState, HorseModel
+from physics import PROFILES, PhysicsProfile, profile_from_json
+
+# Duration of one simulation tick in seconds; horse speeds are in pixels per tick
+TICK = 1 / 60
+
+# Number of ticks kept in the ring buffer
+RING_SLOTS = 64
+
+# Header fields: latest published tick, winning horse number, race number
+# and the race's first tick (earlier than the worker's first one for a
+# resumed race, so tick counts include the ticks run before it)
+HEADER_FIELDS = 4
+
+
+def _views(buf: memoryview, num_horses: int):
+    """
+    Interpret a shared-memory buffer as its header and ring.
+
+    Both are float64 views of one cast of the buffer; tick, winner and race
+    numbers are integers well within the exact range of a double.
+
+    Args:
+        buf (memoryview): The shared-memory buffer.
+        num_horses (int): Number of horses per slot.
+
+    Returns:
+        tuple: (fields view, header view, ring view, slot size in fields).
+    """
+    slot_size = 1 + 2 * num_horses
+    fields = buf.cast("d")
+    header = fields[:HEADER_FIELDS]
+    ring = fields[HEADER_FIELDS:HEADER_FIELDS + RING_SLOTS * slot_size]
+    return fields, header, ring, slot_size
+
+
+def _buffer_size(num_horses: int) -> int:
+    """
+    Compute the shared-memory size needed for a field of horses.
+
+    Args:
+        num_horses (int): Number of horses per slot.
+
+    Returns:
+        int: Size in bytes.
+    """
+    return (HEADER_FIELDS + RING_SLOTS * (1 + 2 * num_horses)) * 8
+
+
+class SimulationProcess:
+    """
+    Main-process handle of the simulation worker.
+
+    The worker is started once and then driven by commands: `start` begins
+    a race from the given positions and speeds, `stop` halts it. Between races
+    the worker blocks waiting for the next command and uses no CPU.
+
+    Attributes:
+        num_horses (int): Number of horses simulated per race.
+    """
+
+    def __init__(self, num_horses: int, physics: Optional[PhysicsProfile] = None) -> None:
+        """
+        Create the shared memory and start the worker process.
+
+        Args:
+            num_horses (int): Number of horses simulated per race.
+            physics (Optional[PhysicsProfile]): Physics of the races; the
+                classic profile if omitted.
+        """
+        self.num_horses: int = num_horses
+        self._shm = shared_memory.SharedMemory(create=True, size=_buffer_size(num_horses))
+        self._fields, self._header, self._ring, self._slot_size = _views(self._shm.buf, num_horses)
+        self._header[0] = -1
+        self._header[1] = 0
+        self._header[2] = 0
+        self._header[3] = 0
+        self._race = 0
+
+        self._process = subprocess.Popen(
+            [sys.executable, __file__, self._shm.name, str(num_horses),
+             json.dumps(physics or PROFILES["classic"])],
+            stdin=subprocess.PIPE, text=True
+        )
+
+    @property
+    def winner(self) -> Optional[int]:
+        """
+        Winning horse number of the current race, once a horse has finished.
+
+        Returns:
+            Optional[int]: The winner, or None while the race is undecided.
+        """
+        if self._header[2] != self._race:
+            return None
+        return int(self._header[1]) or None
+
+    def race_ticks(self, frame: memoryview) -> int:
+        """
+        Number of ticks the current race has run up to a published tick.
+
+        Args:
+            frame (memoryview): A tick returned by `latest`.
+
+        Returns:
+            int: Ticks since the race started, counting the given one.
+        """
+        return int(frame[0] - self._header[3]) + 1
+
+    def start(self, horses: List[HorseModel], finish_x: float,
+              start_speeds: Optional[List[float]] = None, seed: Optional[int] = None,
+              ticks: int = 0) -> None:
+        """
+        Start simulating a race, or resume one that has already run some ticks.
+
+        Args:
+            horses (List[HorseModel]): Horses with their starting positions and speeds.
+            finish_x (float): Position at which a horse has finished.
+            start_speeds (Optional[List[float]]): Speeds drawn at the start of
+                the race, which set the cruising speeds; the current speeds if omitted.
+            seed (Optional[int]): Seed of the race's generator, so the worker
+                runs the race the model recorded; a fresh one if omitted.
+            ticks (int): Ticks the race has already run, when resuming it
+                from the horses' current positions and speeds.
+        """
+        # Numbering races lets readers ignore ticks still published for the
+        # previous race until the worker has picked up this command
+        self._race += 1
+        self._send({
+            "cmd": "start",
+            "race": self._race,
+            "positions": [h.position for h in horses],
+            "speeds": [h.speed for h in horses],
+            "start_speeds": start_speeds or [h.speed for h in horses],
+            "finish_x": finish_x,
+            "seed": seed,
+            "ticks": ticks,
+        })
+
+    def stop(self) -> None:
+        """
+        Stop the current race.
+        """
+        self._send({"cmd": "stop"})
+
+    def latest(self) -> Optional[memoryview]:
+        """
+        Return the most recently published tick of the current race.
+
+        The returned view points into shared memory: index 0 is the tick,
+        followed by one position and one speed per horse. It stays valid
+        until the worker wraps around the ring, so it should be consumed
+        right away.
+
+        Returns:
+            Optional[memoryview]: The latest tick, or None before the first one.
+        """
+        if self._header[2] != self._race:
+            return None
+        tick = int(self._header[0])
+        if tick < 0:
+            return None
+        start = (tick % RING_SLOTS) * self._slot_size
+        slot = self._ring[start:start + self._slot_size]
+        # The worker writes the tick number last; a mismatch means the slot
+        # was overwritten while we looked, so fall back to the next call
+        return slot if slot[0] == tick else None
+
+    def close(self) -> None:
+        """
+        Stop the worker and release the shared memory. Safe to call twice.
+        """
+        if self._shm is None:
+            return
+        if self._process.poll() is None:
+            self._send({"cmd": "quit"})
+            try:
+                self._process.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+        for view in (self._header, self._ring, self._fields):
+            view.release()
+        try:
+            self._shm.close()
+        except BufferError:
+            # A caller still holds a view from `latest`; the mapping is
+            # released once that view is garbage collected
+            pass
+        self._shm.unlink()
+        self._shm = None
+
+    def _send(self, command: dict) -> None:
+        """
+        Write a command line to the worker, ignoring a worker that has exited.
+        """
+        try:
+            self._process.stdin.write(json.dumps(command) + "\n")
+            self._process.stdin.flush()
+        except (BrokenPipeError, OSError):
+            pass
+
+
+def _read_commands(stream, commands: "queue.Queue") -> None:
+    """
+    Worker thread: forward command lines from the main process, then a quit
+    command once the main process closes the stream.
+    """
+    for line in stream:
+        commands.put(json.loads(line))
+    commands.put({"cmd": "quit"})
+
+
+def _run_worker(shm_name: str, num_horses: int, physics: PhysicsProfile) -> None:
+    """
+    Worker process entry point: simulate races on request and publish ticks.
+
+    Args:
+        shm_name (str): Name of the shared memory created by the main process.
+        num_horses (int): Number of horses per race.
+        physics (PhysicsProfile): Physics of the races.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    # The main process owns the memory; don't let this process's resource
+    # tracker unlink it when the worker exits
+    resource_tracker.unregister(shm._name, "shared_memory")
+    commands: "queue.Queue" = queue.Queue()
+    threading.Thread(
+        target=_read_commands, args=(sys.stdin, commands), daemon=True
+    ).start()
+
+    fields, header, ring, slot_size = _views(shm.buf, num_horses)
+    state = GameState(balance=0, physics=physics)
+
+    def publish_winner(event: WinnerDecided) -> None:
+        header[1] = event.horse_number
+
+    state.events.subscribe(WinnerDecided, publish_winner)
+    tick = int(header[0])
+    running = False
+    race = 0
+    finish_x = 0.0
+    next_tick = 0.0
+
+    try:
+        while True:
+            if not running or not commands.empty():
+                command = commands.get()
+                if command["cmd"] == "quit":
+                    break
+                if command["cmd"] == "stop":
+                    running = False
+                    continue
+                race = command["race"]
+                finish_x = command["finish_x"]
+                positions, speeds = command["positions"], command["speeds"]
+                state.reset()
+                state.positions[:] = positions
+                state.speeds[:] = speeds
+                state.start_speeds = command["start_speeds"]
+                if command["seed"] is not None:
+                    state.resume_race(command["seed"], command["ticks"])
+                else:
+                    state.physics.begin(state.start_speeds)
+                state.race_ticks = command["ticks"]
+                header[1] = 0
+                header[3] = tick + 1 - command["ticks"]
+                running = True
+                next_tick = time.perf_counter()
+
+            state.advance(finish_x)
+
+            tick += 1
+            start = (tick % RING_SLOTS) * slot_size
+            ring[start + 1:start + 1 + num_horses] = _pack(state.positions)
+            ring[start + 1 + num_horses:start + slot_size] = _pack(state.speeds)
+            ring[start] = tick
+            header[0] = tick
+            # Published after the tick, so a reader that sees the new race
+            # number also sees one of its ticks
+            header[2] = race
+
+            next_tick += TICK
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # Behind schedule: resynchronize rather than bursting
+                next_tick = time.perf_counter()
+    finally:
+        for view in (header, ring, fields):
+            view.release()
+        shm.close()
+
+
+def _pack(values) -> memoryview:
+    """
+    Pack floats into a float64 view suitable for slice assignment.
+    """
+    return memoryview(array.array("d", values))
+
+
+if __name__ == "__main__":
+    _run_worker(sys.argv[1], int(sys.argv[2]), profile_from_json(sys.argv[3]))
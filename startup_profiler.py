@@ -0,0 +1,121 @@
+"""
+File: startup_profiler.py
+
+Description:
+    Measures how long each phase of application startup takes, from importing
+    Kivy to the first frame being presented. Profiling is enabled by setting
+    the HORSERACE_PROFILE_STARTUP environment variable; when
+    HORSERACE_STARTUP_LOG names a file, every profiled start is also appended
+    to it as one JSON line so the numbers can be tracked across restarts.
+
+    This module deliberately does not import Kivy at module level, so it can
+    time the Kivy import itself.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+import json
+import os
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Tuple
+
+
+class StartupProfiler:
+    """
+    Records the duration of named startup phases.
+
+    Attributes:
+        enabled (bool): Whether phases are recorded at all.
+        phases (List[Tuple[str, float]]): Recorded (phase name, seconds) pairs, in order.
+        total (Optional[float]): Seconds from `start` to `finish`, once finished.
+    """
+
+    def __init__(self, enabled: bool = False, log_path: Optional[str] = None) -> None:
+        """
+        Initialize the profiler.
+
+        Args:
+            enabled (bool): Whether to record phases.
+            log_path (Optional[str]): File to append a JSON line per profiled start to.
+        """
+        self.enabled: bool = enabled
+        self.log_path: Optional[str] = log_path
+        self.phases: List[Tuple[str, float]] = []
+        self.total: Optional[float] = None
+        self._t0: Optional[float] = None
+
+    def start(self) -> None:
+        """
+        Mark the beginning of startup.
+        """
+        self._t0 = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Time the enclosed block as a startup phase.
+
+        Args:
+            name (str): Phase name shown in the report.
+        """
+        if not self.enabled:
+            yield
+            return
+        began = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - began))
+
+    def record(self, name: str, seconds: float) -> None:
+        """
+        Record a phase measured elsewhere.
+
+        Args:
+            name (str): Phase name shown in the report.
+            seconds (float): Duration of the phase.
+        """
+        if self.enabled:
+            self.phases.append((name, seconds))
+
+    def finish(self) -> None:
+        """
+        Mark the first interactive frame, then log and persist the report.
+        """
+        if not self.enabled or self._t0 is None or self.total is not None:
+            return
+        self.total = time.perf_counter() - self._t0
+
+        from kivy.logger import Logger
+        for line in self.report().splitlines():
+            Logger.info(f"Startup: {line}")
+
+        if self.log_path:
+            entry = {
+                "timestamp": time.time(),
+                "total_ms": round(self.total * 1000, 2),
+                "phases_ms": {name: round(sec * 1000, 2) for name, sec in self.phases},
+            }
+            with open(self.log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+
+    def report(self) -> str:
+        """
+        Format the recorded phases as a table.
+
+        Returns:
+            str: One line per phase plus the time to the first frame.
+        """
+        lines = [f"{name:<24} {sec * 1000:9.1f} ms" for name, sec in self.phases]
+        if self.total is not None:
+            lines.append(f"{'first frame (total)':<24} {self.total * 1000:9.1f} ms")
+        return "\n".join(lines)
+
+
+# Profiler shared by main and the view, configured from the environment
+PROFILER = StartupProfiler(
+    enabled=bool(os.environ.get("HORSERACE_PROFILE_STARTUP")),
+    log_path=os.environ.get("HORSERACE_STARTUP_LOG"),
+)
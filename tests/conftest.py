@@ -0,0 +1,23 @@
+"""
+File: tests/conftest.py
+
+Description:
+    Shared test setup. The game's modules live at the repository root and
+    load their assets relative to it, and Kivy must neither parse pytest's
+    arguments nor show a window while widgets are tested.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+os.environ.setdefault("KIVY_NO_CONSOLELOG", "1")
+from kivy.config import Config  # noqa: E402
+Config.set("graphics", "window_state", "hidden")
@@ -0,0 +1,93 @@
+"""
+File: tests/test_checkpoint.py
+
+Description:
+    Tests of the race checkpoint: a restored race continues exactly, a
+    torn slot falls back to the previous checkpoint and settled races are
+    not resumed.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+import pytest
+
+from checkpoint import DECIDED, RUNNING, Checkpoint
+from model import GameState
+from physics import PROFILES
+
+FINISH_X = 900.0
+
+
+def start(path: str, physics: str = "classic"):
+    model = GameState(balance=100, physics=PROFILES[physics])
+    checkpoint = Checkpoint(path, every=6)
+    checkpoint.attach(model)
+    model.place_bet(2, 10)
+    model.setup_race(FINISH_X)
+    return model, checkpoint
+
+
+def load(path: str):
+    checkpoint = Checkpoint(path)
+    try:
+        return checkpoint.load()
+    finally:
+        checkpoint.close()
+
+
+def finish(model: GameState) -> None:
+    while model.winner is None:
+        model.advance(FINISH_X)
+
+
+@pytest.mark.parametrize("physics", ["classic", "staying"])
+def test_restored_race_continues_exactly(tmp_path, physics):
+    path = str(tmp_path / "race.bin")
+    model, checkpoint = start(path, physics)
+    model.advance(FINISH_X, 20)
+    model.advance(FINISH_X, 20)
+    checkpoint.close()
+
+    state = load(path)
+    assert state.phase == RUNNING and state.race_ticks == 40
+    assert state.bet == (2, 10, None)
+    restored = GameState(balance=state.balance, physics=PROFILES[physics])
+    state.apply(restored)
+
+    finish(model)
+    finish(restored)
+    assert restored.positions == model.positions
+    assert (restored.winner, restored.winning_tick) == (model.winner, model.winning_tick)
+
+
+def test_torn_checkpoint_falls_back_to_the_previous_one(tmp_path):
+    path = str(tmp_path / "race.bin")
+    model, checkpoint = start(path)
+    model.advance(FINISH_X, 6)
+    model.advance(FINISH_X, 6)
+    checkpoint.close()
+
+    # Tear the newer slot, as a crash in the middle of writing it would
+    with open(path, "r+b") as f:
+        data = bytearray(f.read())
+        size = len(data) // 2
+        # Each slot starts with its CRC and checkpoint number
+        newer = max((0, 1), key=lambda slot: data[slot * size + 4:slot * size + 12][::-1])
+        data[newer * size + 40] ^= 0xFF
+        f.seek(0)
+        f.write(data)
+
+    state = load(path)
+    assert state.race_ticks == 6
+
+
+def test_settled_race_is_not_resumed(tmp_path):
+    path = str(tmp_path / "race.bin")
+    model, checkpoint = start(path)
+    finish(model)
+    assert checkpoint.load().phase == DECIDED
+    model.resolve_race()
+    assert checkpoint.load() is None
+    checkpoint.close()
+    assert load(path) is None
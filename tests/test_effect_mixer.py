@@ -0,0 +1,91 @@
+"""
+File: tests/test_effect_mixer.py
+
+Description:
+    Tests of the effect mixer's voice pools, voice stealing and muting.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+from audio import EffectMixer
+
+
+class Voice:
+    """
+    Sound delivered by the loader, recording how it was played.
+    """
+
+    def __init__(self, vol: float) -> None:
+        self.state = "stop"
+        self.volume = vol
+        self._orig_vol = vol
+        self.plays = 0
+
+    def play(self) -> None:
+        self.state = "play"
+        self.plays += 1
+
+    def stop(self) -> None:
+        self.state = "stop"
+
+
+class Loader:
+    """
+    Loader delivering every requested sound right away.
+    """
+
+    def __init__(self) -> None:
+        self.voices = []
+
+    def request(self, path, callback, vol=1.0) -> None:
+        voice = Voice(vol)
+        self.voices.append(voice)
+        callback(voice)
+
+
+def test_voices_are_loaded_per_effect():
+    mixer = EffectMixer(Loader())
+    assert not mixer.loaded("click")
+    mixer.add("click", "click.wav", voices=3)
+    mixer.add("whip", "whip.wav")
+    assert mixer.loaded("click")
+    assert mixer.stats() == {"effects": 2, "voices": 5}
+
+
+def test_overlapping_triggers_use_idle_voices_then_the_oldest():
+    loader = Loader()
+    mixer = EffectMixer(loader)
+    mixer.add("click", "click.wav", voices=2)
+    first, second = loader.voices
+
+    mixer.play("click")
+    mixer.play("click")
+    assert (first.plays, second.plays) == (1, 1)
+
+    # Both busy: the voice triggered longest ago restarts
+    mixer.play("click")
+    assert (first.plays, second.plays) == (2, 1)
+
+    second.stop()
+    mixer.play("click")
+    assert (first.plays, second.plays) == (2, 2)
+
+
+def test_muting_silences_and_restores_every_voice():
+    loader = Loader()
+    mixer = EffectMixer(loader)
+    mixer.add("whip", "whip.wav", vol=0.6)
+    mixer.set_muted(True)
+    mixer.play("whip")
+    voices = loader.voices
+    assert all(v.volume == 0 and v.plays == 0 for v in voices)
+
+    mixer.set_muted(False)
+    assert all(v.volume == 0.6 for v in voices)
+
+
+def test_unknown_or_unloaded_effects_are_ignored():
+    mixer = EffectMixer(Loader())
+    mixer.play("missing")
+    assert mixer.stats() == {"effects": 0, "voices": 0}
@@ -0,0 +1,65 @@
+"""
+File: tests/test_event_log.py
+
+Description:
+    Tests of the rotating event log: events are read back in order across
+    compressed segments, by time range, and torn records are cut off.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+import os
+import time
+
+from event_log import CURRENT_FILE, SEGMENT_SUFFIX, EventLog, read_events
+from events import BetPlaced, Deposited, EventBus, RaceStarted, SettingChanged
+
+
+def test_game_events_are_logged_in_order(tmp_path):
+    events = EventBus()
+    log = EventLog(str(tmp_path), flush_interval=0.01)
+    log.attach(events)
+    events.publish(Deposited(50, 150))
+    events.publish(BetPlaced(3, 20))
+    events.publish(RaceStarted((1.5, 2.5), seed=7, physics="sprint"))
+    log.close()
+
+    records = list(read_events(str(tmp_path)))
+    assert [r["type"] for r in records] == ["Deposited", "BetPlaced", "RaceStarted"]
+    assert records[1]["horse_number"] == 3 and records[1]["amount"] == 20
+    assert records[2]["start_speeds"] == [1.5, 2.5] and records[2]["physics"] == "sprint"
+
+
+def test_rotated_segments_are_read_by_time_range(tmp_path):
+    log = EventLog(str(tmp_path), max_bytes=200, flush_interval=0.01)
+    for i in range(40):
+        log.log(SettingChanged("volume", i))
+        if i % 5 == 4:
+            # Let the writer batch and rotate between groups of events
+            time.sleep(0.03)
+    log.close()
+    assert any(name.endswith(SEGMENT_SUFFIX) for name in os.listdir(tmp_path))
+
+    records = list(read_events(str(tmp_path)))
+    assert [r["value"] for r in records] == list(range(40))
+    start, end = records[12]["t"], records[31]["t"]
+    selected = [r["value"] for r in read_events(str(tmp_path), start, end)]
+    assert selected == [r["value"] for r in records if start <= r["t"] < end]
+    assert selected[0] <= 12 and selected[-1] < 31
+
+
+def test_torn_record_is_skipped(tmp_path):
+    log = EventLog(str(tmp_path), flush_interval=0.01)
+    log.log(Deposited(10, 110))
+    log.close()
+    with open(tmp_path / CURRENT_FILE, "a", encoding="utf-8") as f:
+        f.write('{"t": 1, "type": "Depo')
+    assert [r["amount"] for r in read_events(str(tmp_path))] == [10]
+
+    # A restarted log continues on a clean line
+    log = EventLog(str(tmp_path), flush_interval=0.01)
+    log.log(Deposited(20, 130))
+    log.log(Deposited(30, 160))
+    log.close()
+    assert [r["amount"] for r in read_events(str(tmp_path))] == [10, 20, 30]
@@ -0,0 +1,60 @@
+"""
+File: tests/test_events.py
+
+Description:
+    Tests of the model's event bus and the change events the model publishes.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+from events import (
+    BalanceChanged, BetPlaced, EventBus, LeaderChanged, PositionsTick, RaceStarted, WinnerDecided
+)
+from model import GameState
+
+
+def test_handlers_run_in_subscription_order():
+    bus = EventBus()
+    calls = []
+    bus.subscribe(BetPlaced, lambda e: calls.append(("a", e.horse_number)))
+    bus.subscribe(BetPlaced, lambda e: calls.append(("b", e.horse_number)))
+    bus.subscribe(BalanceChanged, lambda e: calls.append(("balance", e.balance)))
+    bus.publish(BetPlaced(2, 10))
+    assert calls == [("a", 2), ("b", 2)]
+    assert bus.has_subscribers(BetPlaced) and not bus.has_subscribers(LeaderChanged)
+
+
+def test_handler_may_unsubscribe_while_published():
+    bus = EventBus()
+    calls = []
+
+    def once(event):
+        calls.append("once")
+        bus.unsubscribe(BetPlaced, once)
+
+    bus.subscribe(BetPlaced, once)
+    bus.subscribe(BetPlaced, lambda e: calls.append("always"))
+    bus.publish(BetPlaced(1, 5))
+    bus.publish(BetPlaced(1, 5))
+    assert calls == ["once", "always", "always"]
+    # Unknown handlers are ignored
+    bus.unsubscribe(WinnerDecided, once)
+
+
+def test_model_publishes_race_changes():
+    model = GameState(balance=100)
+    seen = []
+    for event_type in (RaceStarted, PositionsTick, LeaderChanged, WinnerDecided):
+        model.events.subscribe(event_type, seen.append)
+    model.setup_race(finish_x=400.0)
+    while model.winner is None:
+        model.advance(400.0, 10)
+
+    started = seen[0]
+    assert isinstance(started, RaceStarted) and started.finish_x == 400.0
+    ticks = [e for e in seen if isinstance(e, PositionsTick)]
+    assert ticks[-1].positions == tuple(model.positions)
+    leaders = [e.horse_number for e in seen if isinstance(e, LeaderChanged)]
+    assert all(a != b for a, b in zip(leaders, leaders[1:]))
+    assert seen[-1] == WinnerDecided(model.winner)
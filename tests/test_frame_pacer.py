@@ -0,0 +1,80 @@
+"""
+File: tests/test_frame_pacer.py
+
+Description:
+    Tests of the frame pacer's loop rates and mode switches.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+import time
+
+import pytest
+from kivy.clock import Clock
+
+from frame_pacer import FramePacer
+
+
+@pytest.fixture
+def make_pacer():
+    # Pacers sleep on every clock tick until they are stopped
+    made = []
+
+    def make(**kwargs) -> FramePacer:
+        made.append(FramePacer(**kwargs))
+        return made[-1]
+    yield make
+    for pacer in made:
+        pacer.stop()
+
+
+def frame_time(pacer: FramePacer, frames: int = 3) -> float:
+    pacer._pace(0)
+    start = time.perf_counter()
+    for _ in range(frames):
+        pacer._pace(0)
+    return (time.perf_counter() - start) / frames
+
+
+def test_frames_last_at_least_the_mode_frame_time(make_pacer):
+    pacer = make_pacer(idle_fps=20, active_fps=50, race_fps=0)
+    assert pacer.mode == "idle"
+    assert frame_time(pacer) >= 0.05
+
+    pacer.wake()
+    assert pacer.mode == "active"
+    assert 0.02 <= frame_time(pacer) < 0.05
+
+    # Racing at 0 frames per second leaves the pace to the display
+    pacer.set_racing(True)
+    assert frame_time(pacer) < 0.01
+
+
+def test_input_wakes_the_pacer_except_during_races(make_pacer):
+    pacer = make_pacer(idle_fps=10, active_fps=60)
+    pacer._on_input()
+    assert pacer.mode == "active"
+    pacer._on_quiet(0)
+    assert pacer.mode == "idle"
+
+    pacer.set_racing(True)
+    pacer._on_input()
+    pacer._on_quiet(0)
+    assert pacer.mode == "racing"
+    pacer.set_racing(False)
+    assert pacer.mode == "active"
+
+
+def test_stopped_pacer_no_longer_slows_the_clock():
+    pacer = FramePacer(idle_fps=4)
+    Clock.tick()
+    start = time.perf_counter()
+    Clock.tick()
+    assert time.perf_counter() - start >= 0.2
+
+    pacer.stop()
+    start = time.perf_counter()
+    for _ in range(3):
+        Clock.tick()
+    assert time.perf_counter() - start < 0.2
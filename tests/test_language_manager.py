@@ -0,0 +1,78 @@
+"""
+File: tests/test_language_manager.py
+
+Description:
+    Tests of the language catalogs and localized text bindings: compiled
+    templates format like str.format, missing keys fall back, and switching
+    languages updates every bound widget attribute in place.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+import gc
+import json
+import weakref
+
+import pytest
+from kivy.uix.label import Label
+
+from language_manager import LanguageManager, compile_template
+
+
+@pytest.mark.parametrize("template, args", [
+    ("Horse number {0} wins!", (3,)),
+    ("{1} before {0}, {0} again", ("a", "b")),
+    ("{} and {}", (1, 2)),
+    ("{0:.2f} at 100%", (2.5,)),
+    ("{0!r}", ("x",)),
+    ("No fields, 50%", ()),
+])
+def test_compiled_templates_format_like_str_format(template, args):
+    assert compile_template(template)(*args) == template.format(*args)
+
+
+def test_missing_keys_fall_back(tmp_path):
+    (tmp_path / "en.json").write_text(json.dumps({"hello": "Hello", "bye": "Bye {0}"}))
+    (tmp_path / "nl.json").write_text(json.dumps({"hello": "Hallo"}))
+    lang = LanguageManager("nl", lang_dir=str(tmp_path))
+    assert sorted(lang.languages) == ["en", "nl"]
+    assert lang.get("hello") == "Hallo"
+    assert lang.format("bye", "Ann") == "Bye Ann"
+    assert lang.get("unknown") == "unknown"
+    with pytest.raises(FileNotFoundError):
+        lang.load("fr")
+
+
+def test_switching_language_updates_bound_widgets():
+    lang = LanguageManager()
+    title, result = Label(), Label()
+    lang.bind(title, "horse_wins", 4, compose=str.upper)
+    lang.bind(result, "you_won", 60)
+    assert title.text == "HORSE NUMBER 4 WINS!"
+
+    lang.set_language("es")
+    assert title.text == "¡EL CABALLO NÚMERO 4 GANA!"
+    assert result.text == lang.format("you_won", 60)
+
+
+def test_rebinding_replaces_and_unbinding_stops_updates():
+    lang = LanguageManager()
+    label = Label()
+    lang.bind(label, "horse_wins", 1)
+    lang.bind(label, "horse_wins", 2)
+    lang.unbind(label)
+    label.text = "kept"
+    lang.set_language("sv")
+    assert label.text == "kept"
+
+
+def test_bindings_do_not_keep_widgets_alive():
+    lang = LanguageManager()
+    label = Label()
+    lang.bind(label, "horse_wins", 1)
+    collected = weakref.ref(label)
+    del label
+    gc.collect()
+    assert collected() is None
+    lang.set_language("es")
@@ -0,0 +1,88 @@
+"""
+File: tests/test_leaderboard.py
+
+Description:
+    Tests of the leaderboard: figures follow settled races, the rank
+    indexes agree with sorting the table, and the board survives a restart.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+import random
+
+import pytest
+
+from events import RaceSettled
+from leaderboard import METRICS, Leaderboard
+from model import GameState
+
+
+def settled(delta: float, balance: float) -> RaceSettled:
+    return RaceSettled(1, 10, 1, delta, balance, (1, 2, 3, 4, 5, 6), 300, (2.0,) * 6)
+
+
+@pytest.fixture
+def board(tmp_path):
+    board = Leaderboard(str(tmp_path), save_delay=0)
+    yield board
+    board.close()
+
+
+def test_races_update_the_figures(board):
+    model = GameState(balance=100)
+    board.attach(model.events, "ann", model.balance)
+    for winner in (1, 1, 2, 1):
+        model.place_bet(1, 10)
+        model.winner = winner
+        model.resolve_race()
+        model.reset()
+
+    assert board.top("net_winnings") == [("ann", 170)]
+    assert board.top("longest_streak") == [("ann", 2)]
+    assert board.top("peak_balance") == [("ann", 270)]
+
+
+def test_ranks_and_ties(board):
+    board.record_race("ann", settled(50, 150))
+    board.record_race("bob", settled(80, 180))
+    board.record_race("cid", settled(50, 150))
+    board.register("bob", "Bob")
+
+    assert board.top("net_winnings", 2) == [("Bob", 80), ("ann", 50)]
+    assert [board.rank("net_winnings", a) for a in ("ann", "bob", "cid")] == [2, 1, 2]
+    assert board.rank("net_winnings", "dan") is None
+
+
+def test_indexes_match_a_sorted_table(board):
+    rng = random.Random(5)
+    balances = {}
+    for _ in range(500):
+        account = f"p{rng.randrange(40)}"
+        delta = rng.choice((-10, -5, 20, 40))
+        balances[account] = balances.get(account, 100) + delta
+        board.record_race(account, settled(delta, balances[account]))
+
+    for metric in METRICS:
+        top = board.top(metric, len(board))
+        values = [value for _, value in top]
+        assert values == sorted(values, reverse=True)
+        for account, value in top:
+            better = sum(1 for _, v in top if v > value)
+            assert board.rank(metric, account) == better + 1
+
+
+def test_board_survives_a_restart(tmp_path):
+    board = Leaderboard(str(tmp_path), save_delay=0)
+    board.record_race("ann", settled(40, 140))
+    board.record_race("bob", settled(-10, 90))
+    board.register("bob", "Bob")
+    expected = {metric: board.top(metric) for metric in METRICS}
+    board.close()
+
+    board = Leaderboard(str(tmp_path))
+    try:
+        assert {metric: board.top(metric) for metric in METRICS} == expected
+        assert len(board) == 2
+    finally:
+        board.close()
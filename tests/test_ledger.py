@@ -0,0 +1,96 @@
+"""
+File: tests/test_ledger.py
+
+Description:
+    Tests of the crash-safe ledger: replaying it restores the balance and
+    open bet, torn records are cut off and compaction keeps the state.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+import json
+import os
+
+from ledger import SNAPSHOT_FILE, Ledger
+from model import GameState
+
+
+def play(directory: str, **kwargs) -> GameState:
+    """
+    Deposit, win a race and place a bet that is left open.
+    """
+    ledger = Ledger(directory, flush_delay=0, **kwargs)
+    model = GameState(balance=ledger.restore(default_balance=100))
+    ledger.attach(model.events)
+    model.deposit_money(50)
+    model.place_bet(2, 20)
+    model.winner = 2
+    model.resolve_race()
+    model.reset()
+    model.place_bet(4, 30)
+    ledger.close()
+    return model
+
+
+def test_replay_restores_balance_and_open_bet(tmp_path):
+    model = play(str(tmp_path))
+    assert model.balance == 270
+
+    ledger = Ledger(str(tmp_path))
+    try:
+        assert ledger.state.balance == 270
+        assert tuple(ledger.state.open_bet) == (4, 30)
+        # The open bet belongs to a race that never finished
+        assert ledger.restore(default_balance=100) == 270
+    finally:
+        ledger.close()
+    ledger = Ledger(str(tmp_path))
+    ledger.close()
+    assert ledger.state.open_bet is None
+
+
+def test_resumed_bet_stays_open(tmp_path):
+    play(str(tmp_path))
+    ledger = Ledger(str(tmp_path))
+    ledger.restore(default_balance=100, resumed_bet=(4, 30))
+    ledger.close()
+    ledger = Ledger(str(tmp_path))
+    ledger.close()
+    assert tuple(ledger.state.open_bet) == (4, 30)
+
+
+def test_torn_record_is_cut_off(tmp_path):
+    play(str(tmp_path))
+    segment = max(name for name in os.listdir(tmp_path) if name.startswith("wal-"))
+    path = tmp_path / segment
+    size = path.stat().st_size
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"seq": 99, "type": "deposit", "bal')
+
+    ledger = Ledger(str(tmp_path), flush_delay=0)
+    assert ledger.state.balance == 270
+    assert path.stat().st_size == size
+    model = GameState(balance=ledger.restore(default_balance=100))
+    ledger.attach(model.events)
+    model.deposit_money(5)
+    ledger.close()
+
+    records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [r["type"] for r in records[-2:]] == ["void", "deposit"]
+    ledger = Ledger(str(tmp_path))
+    ledger.close()
+    assert ledger.state.balance == 275
+
+
+def test_compaction_keeps_the_state(tmp_path):
+    play(str(tmp_path), snapshot_every=2)
+    assert os.path.exists(tmp_path / SNAPSHOT_FILE)
+    # Segments covered by the snapshot are deleted
+    assert len([name for name in os.listdir(tmp_path) if name.startswith("wal-")]) == 1
+
+    ledger = Ledger(str(tmp_path))
+    ledger.close()
+    assert ledger.state.balance == 270
+    assert tuple(ledger.state.open_bet) == (4, 30)
+    assert ledger.state.seq == 5
@@ -0,0 +1,112 @@
+"""
+File: tests/test_limits.py
+
+Description:
+    Tests of the rolling-window deposit and stake limits, on their own and
+    as enforced by the game state.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+import pytest
+
+from limits import Limit, LimitExceeded, LimitsEngine
+from model import GameState
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def engine(clock):
+    return LimitsEngine([Limit("stake", 60, 100, buckets=6)], clock)
+
+
+def test_charges_within_the_window_add_up(engine, clock):
+    engine.charge("a", "stake", 60)
+    clock.now += 30
+    with pytest.raises(LimitExceeded, match=r"\$100 per minute"):
+        engine.charge("a", "stake", 50)
+    assert engine.remaining("a", "stake") == 40
+    # Other accounts and kinds are not affected
+    assert engine.remaining("b", "stake") == 100
+    assert engine.remaining("a", "deposit") == float("inf")
+
+
+def test_charges_expire_with_their_bucket(engine, clock):
+    engine.charge("a", "stake", 100)
+    clock.now += 59
+    assert engine.remaining("a", "stake") == 0
+    clock.now += 1
+    assert engine.remaining("a", "stake") == 100
+
+
+def test_refund_releases_the_charge(engine, clock):
+    charge = engine.charge("a", "stake", 70)
+    clock.now += 20
+    engine.charge("a", "stake", 30)
+    engine.refund("a", "stake", charge)
+    assert engine.remaining("a", "stake") == 70
+    # The refund does not come back when the charge's bucket expires
+    clock.now += 45
+    assert engine.remaining("a", "stake") == 70
+
+
+def test_refund_of_an_expired_charge_changes_nothing(engine, clock):
+    charge = engine.charge("a", "stake", 70)
+    clock.now += 60
+    engine.charge("a", "stake", 30)
+    engine.refund("a", "stake", charge)
+    assert engine.remaining("a", "stake") == 70
+
+
+def test_replacement_counts_only_the_new_amount(engine):
+    first = engine.charge("a", "stake", 80)
+    engine.charge("a", "stake", 90, replaces=first)
+    assert engine.remaining("a", "stake") == 10
+    with pytest.raises(LimitExceeded):
+        engine.charge("a", "stake", 200, replaces=first)
+    assert engine.remaining("a", "stake") == 10
+
+
+def test_replaced_bet_releases_its_stake(engine):
+    model = GameState(balance=1000, limits=engine, account_id="a")
+    for horse in range(1, 6):
+        model.place_bet(horse, 80)
+    assert model.bet.horse_number == 5
+    assert engine.remaining("a", "stake") == 20
+
+    # A settled bet stays charged
+    model.winner = 5
+    model.resolve_race()
+    model.reset()
+    with pytest.raises(ValueError):
+        model.place_bet(1, 80)
+
+
+def test_cashed_out_stake_stays_charged(engine):
+    model = GameState(balance=1000, limits=engine, account_id="a")
+    model.place_bet(1, 60)
+    model.cash_out(30)
+    with pytest.raises(ValueError):
+        model.place_bet(2, 60)
+
+
+def test_deposits_are_limited_by_the_model(clock):
+    engine = LimitsEngine([Limit("deposit", 3600, 500)], clock)
+    model = GameState(balance=0, limits=engine)
+    model.deposit_money(400)
+    with pytest.raises(LimitExceeded, match="per hour"):
+        model.deposit_money(200)
+    assert model.balance == 400
@@ -0,0 +1,59 @@
+"""
+File: tests/test_loadtest.py
+
+Description:
+    Tests of the synthetic bettor load generator's distributions,
+    percentiles and a short run against the model.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+import random
+
+import pytest
+
+from limits import Limit
+from loadtest import LoadTest, parse_distribution, percentiles
+
+
+def test_distributions_draw_whole_amounts():
+    rng = random.Random(1)
+    assert parse_distribution("fixed:10")(rng) == 10
+    amounts = [parse_distribution("uniform:1,50")(rng) for _ in range(200)]
+    assert all(1 <= a <= 50 and a == int(a) for a in amounts)
+    assert min(parse_distribution("lognormal:0,3")(rng) for _ in range(200)) >= 1
+
+
+@pytest.mark.parametrize("spec", ["fixed", "uniform:1", "normal:1,2", "fixed:x"])
+def test_invalid_distributions_are_rejected(spec):
+    with pytest.raises(ValueError, match="Invalid distribution"):
+        parse_distribution(spec)
+
+
+def test_nearest_rank_percentiles():
+    samples = list(range(1, 101))
+    assert percentiles(samples, (50, 99, 100)) == [50, 99, 100]
+    assert percentiles([], (50, 99)) == [0.0, 0.0]
+    assert percentiles([7.0], (0, 50)) == [7.0, 7.0]
+
+
+def test_short_run_settles_bets():
+    test = LoadTest(bettors=50, bet_rate=20, deposit_rate=2, race_interval=0.1,
+                    bet_size="fixed:5", deposit_size="fixed:20", balance=100, seed=3)
+    test.run(0.35)
+
+    assert test.results["bet"] and test.results["deposit"]
+    assert len(test.results["close"]) >= 2
+    assert 0 < len(test.results["settlement"]) <= len(test.results["bet"])
+
+
+def test_repeated_bets_replace_the_open_bet_within_the_limit():
+    # Room for a single stake: every further bet replaces the open one
+    test = LoadTest(bettors=1, bet_rate=50, deposit_rate=0, race_interval=60,
+                    bet_size="fixed:5", deposit_size="fixed:1", balance=100,
+                    limits=[Limit("stake", 3600, 5)], seed=3)
+    test.run(0.2)
+
+    assert len(test.results["bet"]) > 1
+    assert test.rejected["bet"] == 0
@@ -0,0 +1,108 @@
+"""
+File: tests/test_metrics.py
+
+Description:
+    Tests of the metrics exporter: settlement latency covers settling the
+    race, and gauges are served from snapshots taken on the UI thread.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+import time
+
+from controller import GameController
+from events import RaceSettled, WinnerDecided
+from metrics import Durations, MetricsExporter
+from model import GameState
+
+
+class QuietView:
+    """
+    The parts of GameView the controller touches when settling a race.
+    """
+
+    def __init__(self) -> None:
+        self.result_popup = self
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class FakeTextures:
+    def __init__(self) -> None:
+        self.assets = 3
+        self.calls = 0
+
+    def stats(self):
+        self.calls += 1
+        return {"assets": self.assets, "gpu_bytes": 1024, "cpu_bytes": 0}
+
+
+def test_durations_report_quantiles_over_the_ring():
+    durations = Durations(size=4)
+    for seconds in (9.0, 1.0, 2.0, 3.0, 4.0):
+        durations.record(seconds)
+    assert durations.count == 5
+    assert durations.total == 19.0
+    assert durations.quantiles((0.0, 0.5, 0.99)) == [(0.0, 1.0), (0.5, 3.0), (0.99, 4.0)]
+
+
+def test_settlement_times_the_settling_of_the_race():
+    model = GameState(balance=100)
+    controller = GameController(model, QuietView())
+    exporter = MetricsExporter(model.events, port=0)
+    controller.settlement_times = exporter.settlement_times
+    # Settling includes every subscriber, e.g. the ledger writing the race
+    model.events.subscribe(RaceSettled, lambda event: time.sleep(0.02))
+
+    model.place_bet(1, 10)
+    model.winner = 1
+    time.sleep(0.05)
+    controller.finish_race()
+
+    assert exporter.settlement_times.count == 1
+    assert 0.02 <= exporter.settlement_times.total < 0.05
+    assert "horserace_settlement_seconds_count 1" in exporter.render()
+
+
+def test_gauges_are_served_from_the_last_sample():
+    textures = FakeTextures()
+    exporter = MetricsExporter(GameState(balance=0).events, port=0, textures=textures)
+    assert "texture_cache_assets" not in exporter.render()
+
+    exporter.sample_gauges()
+    textures.assets = 5
+    text = exporter.render()
+    # Rendering on the server thread never reads the cache itself
+    assert textures.calls == 1
+    assert "horserace_texture_cache_assets 3" in text
+    assert 'horserace_texture_cache_bytes{memory="gpu"} 1024' in text
+
+    exporter.sample_gauges()
+    assert "horserace_texture_cache_assets 5" in exporter.render()
+
+
+def test_races_older_than_an_hour_are_dropped_without_scrapes(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr("metrics.time.monotonic", lambda: clock[0])
+    events = GameState(balance=0).events
+    exporter = MetricsExporter(events, port=0)
+    for _ in range(3):
+        events.publish(WinnerDecided(1))
+    clock[0] += 3000
+    events.publish(WinnerDecided(2))
+    assert "horserace_races_last_hour 4" in exporter.render()
+
+    # The next race trims the earlier ones, nothing rendered in between
+    clock[0] += 1000
+    events.publish(WinnerDecided(3))
+    assert len(exporter._race_times) == 2
+
+    clock[0] += 3000
+    text = exporter.render()
+    assert "horserace_races_last_hour 1" in text
+    assert "horserace_races_total 5" in text
+    # Rendering only reads the times
+    assert len(exporter._race_times) == 2
+    exporter.close()
@@ -0,0 +1,81 @@
+"""
+File: tests/test_odds.py
+
+Description:
+    Tests of the in-play win probabilities and cash-out quotes, checked
+    against races simulated with the same physics.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+import pytest
+
+from model import GameState
+from odds import OddsQuoter, win_probabilities
+from physics import PROFILES, FieldKernel
+
+FINISH_X = 900.0
+
+
+def race(profile: str, seed: int, tick: int, positions, speeds, start_speeds) -> GameState:
+    model = GameState(balance=100, physics=PROFILES[profile])
+    model.start_speeds = list(start_speeds)
+    model.positions[:] = positions
+    model.speeds[:] = speeds
+    model.resume_race(seed, 0)
+    model.race_ticks = tick
+    return model
+
+
+@pytest.mark.parametrize("profile, tick, positions, speeds, start_speeds", [
+    ("staying", 200, [700, 690, 680, 670, 660, 650], [2.6, 2.4, 2.2, 2.0, 1.9, 1.8],
+     [2.3, 2.2, 2.1, 2.0, 1.9, 1.8]),
+    ("sprint", 30, [300, 290, 280, 270, 260, 250], [1.5, 2.0, 2.5, 2.0, 1.8, 2.8],
+     [1.0, 1.5, 3.0, 2.0, 1.8, 2.8]),
+])
+def test_probabilities_match_simulated_races(profile, tick, positions, speeds, start_speeds):
+    model = race(profile, 0, tick, positions, speeds, start_speeds)
+    distance = model.physics.distance
+    quoted = win_probabilities(
+        [(FINISH_X - x) * distance for x in positions], speeds, 48, model.physics, tick
+    )
+
+    runs = 1000
+    wins = [0] * 6
+    for seed in range(runs):
+        model = race(profile, seed, tick, positions, speeds, start_speeds)
+        while model.winner is None:
+            model.advance(FINISH_X, 5)
+        wins[model.winner - 1] += 1
+    for quote, won in zip(quoted, wins):
+        assert quote == pytest.approx(won / runs, abs=0.05)
+
+
+def test_classic_forecast_is_a_plain_random_walk():
+    kernel = FieldKernel(PROFILES["classic"], 2)
+    means, variances = kernel.forecast([1.5, 2.5], [10, 20])
+    assert means == [[15.0, 30.0], [25.0, 50.0]]
+    step_variance = 0.2 ** 2 / 3
+    assert variances[0] == pytest.approx([step_variance * 385, step_variance * 2870])
+
+
+def test_probabilities_sum_to_one_and_favour_the_leader():
+    probabilities = win_probabilities([100, 200, 200], [2.0, 2.0, 2.0])
+    assert sum(probabilities) == pytest.approx(1.0)
+    assert probabilities[0] > probabilities[1] == pytest.approx(probabilities[2])
+
+
+def test_finished_horse_wins_outright():
+    assert win_probabilities([-1, 0, 50], [2, 2, 2]) == [1.0, 0.0, 0.0]
+
+
+def test_cash_out_value_applies_the_margin():
+    model = GameState(balance=100)
+    model.place_bet(2, 10)
+    quoter = OddsQuoter(model, margin=0.05)
+    probabilities = [0.1, 0.5, 0.1, 0.1, 0.1, 0.1]
+    # A winning bet returns the stake times seven
+    assert quoter.cash_out_value(probabilities) == round(0.5 * 70 * 0.95, 2)
+    model.bet.cash_out = 30.0
+    assert quoter.cash_out_value(probabilities) is None
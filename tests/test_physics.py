@@ -0,0 +1,99 @@
+"""
+File: tests/test_physics.py
+
+Description:
+    Tests of the physics profiles: loading them from JSON, passing them to
+    a worker process, and running a field of horses with them.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+import json
+import math
+import random
+
+import pytest
+
+from physics import PROFILES, FieldKernel, HorseProfile, load_profiles, profile_from_json
+
+
+def write(tmp_path, rows) -> str:
+    path = tmp_path / "profiles.json"
+    path.write_text(json.dumps(rows), encoding="utf-8")
+    return str(path)
+
+
+def test_profiles_load_from_json(tmp_path):
+    path = write(tmp_path, [
+        {"name": "mile", "distance": 1.5, "horses": [
+            {"rating": 0.1, "acceleration": 0.02, "stamina": None},
+            {"acceleration": 0.05, "stamina": 300, "fade": 0.002},
+        ]},
+    ])
+    profile = load_profiles(path)["mile"]
+    assert profile.distance == 1.5
+    assert profile.jitter == PROFILES["classic"].jitter
+    assert profile.horses == (HorseProfile(0.1, 0.02, math.inf, 0.0), HorseProfile(0.0, 0.05, 300, 0.002))
+
+
+@pytest.mark.parametrize("rows, message", [
+    ({"name": "mile"}, "list of profiles"),
+    (["mile"], "#1"),
+    ([{"name": "mile", "distance": "far"}], "'mile'"),
+    ([{"name": "mile", "speed": 2}], "'mile'"),
+    ([{"name": "mile", "horses": {"rating": 1}}], "'mile'"),
+    ([{"name": "mile", "horses": [1]}], "'mile'"),
+    ([{"name": "mile", "horses": [{"pace": 1}]}], "'mile'"),
+    ([{"name": "mile", "horses": [{"acceleration": 2}]}], "'mile'"),
+    ([{"name": "mile", "horses": [{"rating": 0.1}]}], "need an acceleration"),
+    ([{"name": "mile", "horses": [{"stamina": 300, "fade": 0.01}]}], "need an acceleration"),
+    ([{"name": "mile", "min_speed": 5}], "'mile'"),
+    ([{"name": "mile", "distance": 0}], "'mile'"),
+    ([{"distance": 1}], "#1"),
+])
+def test_invalid_profiles_are_rejected_by_name(tmp_path, rows, message):
+    with pytest.raises(ValueError, match=message):
+        load_profiles(write(tmp_path, rows))
+
+
+def test_profiles_survive_json_round_trip():
+    for profile in PROFILES.values():
+        assert profile_from_json(json.dumps(profile)) == profile
+
+
+def run(profile: str, seed: int, batches) -> tuple:
+    kernel = FieldKernel(PROFILES[profile], 6)
+    rng = random.Random(seed)
+    speeds = [rng.uniform(1, 3) for _ in range(6)]
+    kernel.begin(speeds)
+    positions, finished = [0.0] * 6, [False] * 6
+    crossings, tick = [], 0
+    for ticks in batches:
+        crossings += kernel.run(positions, speeds, tick, ticks, 500.0, finished, rng.random)
+        tick += ticks
+    return positions, speeds, crossings
+
+
+@pytest.mark.parametrize("profile", sorted(PROFILES))
+def test_batches_do_not_change_the_race(profile):
+    # A race runs the same whether it is advanced tick by tick or in batches
+    assert run(profile, 7, [1] * 600) == run(profile, 7, [250, 1, 349])
+
+
+def test_classic_profile_is_a_bounded_random_walk():
+    kernel = FieldKernel(PROFILES["classic"], 2)
+    kernel.begin([0.6, 3.9])
+    positions, speeds = [0.0, 0.0], [0.6, 3.9]
+    draws = iter([0.0, 1.0, 0.75, 0.25])
+    kernel.run(positions, speeds, 0, 2, 100.0, [False, False], lambda: next(draws))
+    assert speeds == [pytest.approx(0.6), pytest.approx(3.9)]
+    assert positions == [pytest.approx(0.5 + 0.6), pytest.approx(4.0 + 3.9)]
+
+
+def test_long_races_advance_by_the_distance():
+    positions, _, _ = run("staying", 3, [100])
+    kernel = FieldKernel(PROFILES["staying"], 6)
+    assert kernel.distance == 2.0
+    # Staying horses never exceed the top speed over the scaled track
+    assert max(positions) <= 100 * PROFILES["staying"].max_speed / 2.0
@@ -0,0 +1,103 @@
+"""
+File: tests/test_race_history.py
+
+Description:
+    Tests of the columnar race archive: every finished race is archived,
+    and the columns stay aligned when an append fails or was cut short.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+import os
+from datetime import datetime
+
+import pytest
+
+from events import RaceFinished
+from model import GameState
+from race_history import RaceHistory
+
+SPEEDS = (1.0, 1.5, 2.0, 2.5, 3.0, 1.25)
+
+
+def finished(winner: int, stake: float = 0.0, payout: float = 0.0) -> RaceFinished:
+    order = (winner,) + tuple(n for n in range(1, 7) if n != winner)
+    return RaceFinished(winner, order, 400, SPEEDS, stake, payout)
+
+
+@pytest.fixture
+def history(tmp_path):
+    history = RaceHistory(str(tmp_path))
+    yield history
+    history.close()
+
+
+def decide(model: GameState, winner: int) -> None:
+    model.start_speeds = list(SPEEDS)
+    model.winner = winner
+    model.winning_tick = 400
+    model.resolve_race()
+    model.reset()
+
+
+def test_races_with_and_without_bets_are_archived(history):
+    model = GameState(balance=100)
+    history.attach(model.events)
+    decide(model, 2)
+    model.place_bet(3, 10)
+    decide(model, 3)
+    history.flush()
+
+    assert len(history) == 2
+    assert list(history.column("winner")) == [2, 3]
+    assert list(history.column("stake")) == [0.0, 10.0]
+    assert list(history.column("payout")) == [0.0, 70.0]
+    assert history.win_rate_by_horse() == {1: 0, 2: 0.5, 3: 0.5, 4: 0, 5: 0, 6: 0}
+
+
+def test_failed_append_keeps_columns_aligned(history):
+    history.append(finished(1), 1.0)
+    # One speed short: the race is refused rather than shifting the column
+    history.append(finished(2)._replace(start_speeds=SPEEDS[:5]), 2.0)
+    history.append(finished(3), 3.0)
+    history.flush()
+
+    assert len(history) == 2
+    assert list(history.column("winner")) == [1, 3]
+    assert list(history.column("speeds"))[6:] == pytest.approx(SPEEDS)
+    assert list(history.column("time")) == [1.0, 3.0]
+
+
+def test_opening_cuts_races_missing_from_some_columns(tmp_path):
+    history = RaceHistory(str(tmp_path))
+    history.append(finished(4, 5.0, 0.0), 1.0)
+    history.close()
+    # A crash after writing some of the columns of a second race
+    for name in ("time", "winner", "order"):
+        with open(tmp_path / f"{name}.col", "ab") as f:
+            f.write(b"\1" * 3)
+
+    history = RaceHistory(str(tmp_path))
+    try:
+        history.append(finished(5, 5.0, 30.0), 2.0)
+        history.flush()
+        assert len(history) == 2
+        assert list(history.column("winner")) == [4, 5]
+        assert list(history.column("order"))[6:] == [5, 1, 2, 3, 4, 6]
+        assert list(history.column("payout")) == [0.0, 30.0]
+        sizes = {name: os.path.getsize(tmp_path / f"{name}.col") for name in ("time", "ticks")}
+        assert sizes == {"time": 16, "ticks": 8}
+    finally:
+        history.close()
+
+
+def test_house_return_per_day(history):
+    day = datetime(2026, 3, 14, 12).timestamp()
+    history.append(finished(1, 10.0, 0.0), day)
+    history.append(finished(2, 10.0, 60.0), day + 60)
+    history.append(finished(3, 20.0, 0.0), day + 86400)
+    history.flush()
+    returns = history.house_return_per_day()
+    assert list(returns.values()) == [-40.0, 20.0]
+    assert len(history.column("stake", day + 30)) == 2
@@ -0,0 +1,42 @@
+"""
+File: tests/test_render_scale.py
+
+Description:
+    Tests of the render-scale container's framebuffer size and child geometry.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+from kivy.core.window import Window  # noqa: F401
+from kivy.uix.widget import Widget
+
+from render_scale import RenderScaleContainer
+
+
+def test_buffer_follows_the_container_at_the_scale():
+    child = Widget()
+    container = RenderScaleContainer(child, 0.5)
+    container.pos = (10, 20)
+    container.size = (400, 300)
+
+    assert tuple(container.fbo.size) == (200, 150)
+    assert tuple(child.pos) == (10, 20)
+    assert tuple(child.size) == (400, 300)
+    assert child.parent is container
+
+
+def test_child_is_drawn_into_the_buffer():
+    child = Widget()
+    container = RenderScaleContainer(child, 0.5, smooth=False)
+    container.size = (100, 100)
+
+    assert child.canvas not in container.canvas.children
+    assert child.canvas in container.fbo.children
+    assert container.fbo.texture.mag_filter == "nearest"
+
+
+def test_tiny_containers_keep_a_buffer():
+    container = RenderScaleContainer(Widget(), 0.25)
+    container.size = (2, 2)
+    assert tuple(container.fbo.size) == (1, 1)
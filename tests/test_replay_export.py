@@ -0,0 +1,82 @@
+"""
+File: tests/test_replay_export.py
+
+Description:
+    Tests of the offscreen replay exporter: replayed races end like the game's
+    races with the same seed, and one track is reused for every replay.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+import json
+import os
+
+import pytest
+
+from model import GameState
+from physics import PROFILES
+from replay_export import ReplayExporter, main, seeded_replay
+
+
+def game_winner(seed: int, physics: str) -> int:
+    replay = seeded_replay(seed, physics)
+    model = GameState(balance=0, physics=PROFILES[physics])
+    model.positions[:] = replay.positions
+    model.speeds[:] = replay.start_speeds
+    model.start_speeds = list(replay.start_speeds)
+    model.resume_race(replay.seed, 0)
+    while model.winner is None:
+        model.advance(replay.finish_x)
+    return model.winner
+
+
+@pytest.fixture
+def exporter():
+    return ReplayExporter(1000, 120, fps=4, hold=0.5)
+
+
+@pytest.mark.parametrize("seed, physics", [(1, "classic"), (3, "staying")])
+def test_seeded_export_matches_the_game(exporter, tmp_path, seed, physics):
+    frames, winner = exporter.export(seeded_replay(seed, physics), str(tmp_path))
+    assert winner == game_winner(seed, physics)
+    assert len(os.listdir(tmp_path)) == frames
+
+
+def test_reused_track_keeps_images_on_their_sprites(exporter, tmp_path):
+    exporter.export(seeded_replay(1), str(tmp_path / "first"))
+    exporter.export(seeded_replay(3), str(tmp_path / "second"))
+    for sprite in exporter.track.horses:
+        assert sprite.image.x == sprite.x
+
+
+def test_frames_move_smoothly_in_long_races(monkeypatch, tmp_path):
+    exporter = ReplayExporter(1000, 120, fps=120, hold=0)
+    frames = []
+    monkeypatch.setattr(exporter, "_draw", lambda: frames.append(
+        [sprite.x for sprite in exporter.track.horses]) or b"")
+    monkeypatch.setattr("replay_export.write_png", lambda *args: None)
+    exporter.export(seeded_replay(3, "staying"), str(tmp_path))
+
+    # Between ticks the horses move on at their speeds, so they never jump
+    # back when the next tick arrives
+    for before, now, after in zip(frames, frames[1:], frames[2:]):
+        for a, b, c in zip(before, now, after):
+            assert abs(b - (a + c) / 2) < 0.1
+
+
+def test_races_that_never_finish_are_exported_up_to_the_cap(monkeypatch, tmp_path, capsys):
+    # Far too slow to reach the finish line within the cap
+    profiles = tmp_path / "physics.json"
+    profiles.write_text(json.dumps([
+        {"name": "crawl", "distance": 1000, "jitter": 0, "min_speed": 0.5, "max_speed": 0.5}
+    ]))
+    monkeypatch.setattr(ReplayExporter, "MAX_RACE_SECONDS", 1)
+    main([
+        "--seed", "1", "2", "--physics", "crawl", "--physics-file", str(profiles),
+        "--out", str(tmp_path / "out"), "--size", "200x60", "--fps", "4",
+    ])
+
+    rows = capsys.readouterr().out.splitlines()[1:]
+    assert [row.split()[:3] for row in rows] == [["seed-1", "5", "-"], ["seed-2", "5", "-"]]
+    assert len(os.listdir(tmp_path / "out" / "seed-2")) == 5
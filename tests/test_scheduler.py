@@ -0,0 +1,61 @@
+"""
+File: tests/test_scheduler.py
+
+Description:
+    Tests of the timed race mode: betting windows, races and results follow
+    each other, bets are only taken while betting is open and the next race
+    is prepared while the current one runs.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+import time
+
+import pytest
+from kivy.clock import Clock
+
+from controller import GameController
+from events import RaceFinished
+from language_manager import LanguageManager
+from model import GameState
+from scheduler import RaceScheduler
+from view import GameView
+
+
+def test_races_run_back_to_back():
+    model = GameState(balance=100)
+    view = GameView(LanguageManager())
+    controller = GameController(model, view)
+    scheduler = RaceScheduler(controller, betting_window=0.1, result_hold=0.1)
+    finished = []
+    model.events.subscribe(RaceFinished, finished.append)
+    phases, prepared_while_off = [], False
+
+    def record_phase():
+        if not phases or phases[-1] != scheduler.phase:
+            phases.append(scheduler.phase)
+
+    scheduler.start()
+    record_phase()
+    controller.place_bet(3, 10)
+
+    deadline = time.monotonic() + 10
+    while len(finished) < 2 and time.monotonic() < deadline:
+        Clock.tick()
+        record_phase()
+        if scheduler.phase == "off":
+            prepared_while_off |= model.next_speeds is not None
+            with pytest.raises(ValueError, match="closed"):
+                controller.place_bet(1, 10)
+            # Run the race faster than the animation would
+            controller.advance_race(5)
+            record_phase()
+        time.sleep(0.01)
+    scheduler.stop()
+    view.close()
+
+    assert phases == ["betting", "off", "hold", "betting", "off", "hold", "betting"]
+    assert prepared_while_off
+    assert [f.stake for f in finished] == [10, 0]
+    assert scheduler.phase == "idle"
@@ -0,0 +1,66 @@
+"""
+File: tests/test_simulation.py
+
+Description:
+    Tests of the worker process simulating races.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+import time
+
+import pytest
+
+from model import GameState
+from physics import PROFILES
+from simulation import SimulationProcess
+
+FINISH_X = 100000.0
+SPEEDS = [1.2, 2.9, 2.0, 1.7, 2.4, 1.1]
+
+
+def start_race(seed: int) -> GameState:
+    model = GameState(balance=0, physics=PROFILES["staying"])
+    model.positions[:] = [100.0] * 6
+    model.speeds[:] = SPEEDS
+    model.start_speeds = list(SPEEDS)
+    model.resume_race(seed, 0)
+    return model
+
+
+@pytest.fixture
+def worker():
+    simulation = SimulationProcess(6, PROFILES["staying"])
+    yield simulation
+    simulation.close()
+
+
+def test_resumed_worker_race_continues_exactly(worker):
+    seed, resumed_at = 1234, 30
+    reference = start_race(seed)
+    trajectory = []
+    for _ in range(resumed_at + 60):
+        reference.advance(FINISH_X)
+        trajectory.append(tuple(reference.positions))
+
+    resumed = start_race(seed)
+    resumed.advance(FINISH_X, resumed_at)
+    worker.start(resumed.horses, FINISH_X, resumed.start_speeds, seed, resumed_at)
+
+    checked = 0
+    deadline = time.monotonic() + 10
+    while checked < 20 and time.monotonic() < deadline:
+        frame = worker.latest()
+        if frame is None:
+            time.sleep(0.005)
+            continue
+        ticks = worker.race_ticks(frame)
+        positions = tuple(frame[1:7])
+        frame.release()
+        assert ticks > resumed_at
+        if ticks <= len(trajectory):
+            assert positions == trajectory[ticks - 1]
+            checked += 1
+        time.sleep(0.02)
+    assert checked == 20
@@ -0,0 +1,65 @@
+"""
+File: tests/test_startup_profiler.py
+
+Description:
+    Tests of the startup profiler's phase recording, report and log file.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+import json
+
+from startup_profiler import StartupProfiler
+
+
+def test_disabled_profiler_records_nothing(tmp_path):
+    log = tmp_path / "startup.jsonl"
+    profiler = StartupProfiler(enabled=False, log_path=str(log))
+    profiler.start()
+    with profiler.phase("build"):
+        pass
+    profiler.record("fonts", 0.2)
+    profiler.finish()
+
+    assert profiler.phases == []
+    assert profiler.total is None
+    assert not log.exists()
+
+
+def test_phases_are_recorded_in_order():
+    profiler = StartupProfiler(enabled=True)
+    with profiler.phase("build"):
+        pass
+    profiler.record("fonts", 0.25)
+
+    assert [name for name, _ in profiler.phases] == ["build", "fonts"]
+    assert profiler.phases[1][1] == 0.25
+    assert "fonts" in profiler.report() and "250.0 ms" in profiler.report()
+
+
+def test_a_failing_phase_is_still_timed():
+    profiler = StartupProfiler(enabled=True)
+    try:
+        with profiler.phase("load"):
+            raise RuntimeError
+    except RuntimeError:
+        pass
+    assert [name for name, _ in profiler.phases] == ["load"]
+
+
+def test_finish_appends_one_log_line_per_start(tmp_path):
+    log = tmp_path / "startup.jsonl"
+    profiler = StartupProfiler(enabled=True, log_path=str(log))
+    profiler.start()
+    profiler.record("fonts", 0.1)
+    profiler.finish()
+    # Later frames do not log again
+    profiler.finish()
+
+    lines = log.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1
+    entry = json.loads(lines[0])
+    assert entry["phases_ms"] == {"fonts": 100.0}
+    assert entry["total_ms"] >= 0
+    assert "first frame (total)" in profiler.report()
@@ -0,0 +1,58 @@
+"""
+File: tests/test_text_cache.py
+
+Description:
+    Tests of the text texture cache and the labels using it.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+from text_cache import CachedButton, CachedLabel, TextTextureCache
+
+
+def test_least_recently_used_texture_is_evicted():
+    cache = TextTextureCache(max_entries=2)
+    cache.put("a", "A")
+    cache.put("b", "B")
+    assert cache.get("a") == "A"
+    cache.put("c", "C")
+    assert cache.get("b") is None
+    assert cache.get("a") == "A" and cache.get("c") == "C"
+    assert cache.stats() == {"entries": 2, "max_entries": 2, "hits": 3, "misses": 1}
+
+
+def test_same_text_and_style_share_a_texture():
+    cache = TextTextureCache()
+    first = CachedLabel(text="BALANCE", font_size=20)
+    second = CachedLabel(text="BALANCE", font_size=20)
+    first.text_cache = second.text_cache = cache
+    first.texture_update()
+    second.texture_update()
+    assert second.texture is first.texture
+    assert cache.hits == 1
+
+
+def test_disabled_state_is_part_of_the_key():
+    cache = TextTextureCache()
+    enabled = CachedButton(text="PREVIOUS")
+    disabled = CachedButton(text="PREVIOUS", disabled=True)
+    enabled.text_cache = disabled.text_cache = cache
+    enabled.texture_update()
+    disabled.texture_update()
+    assert disabled.texture is not enabled.texture
+    assert enabled._text_cache_key() != disabled._text_cache_key()
+
+
+def test_render_properties_change_the_key():
+    label = CachedLabel(text="6")
+    key = label._text_cache_key()
+    label.line_height = 1.5
+    assert label._text_cache_key() != key
+    label.max_lines = 1
+    assert label._text_cache_key() != key
+
+
+def test_markup_and_shortened_labels_are_not_cached():
+    assert CachedLabel(text="[b]6[/b]", markup=True)._text_cache_key() is None
+    assert CachedLabel(text="a long name", shorten=True)._text_cache_key() is None
@@ -0,0 +1,73 @@
+"""
+File: tests/test_texture_cache.py
+
+Description:
+    Tests of the budgeted texture cache: least recently used assets are
+    evicted once over budget, pinned assets stay, and evicted assets are
+    reloaded on demand.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+import pytest
+# Textures are created in the window's GL context
+from kivy.core.window import Window  # noqa: F401
+
+from texture_cache import TextureCache
+
+A, B, C = (f"assets/images/texture{i}.png" for i in (1, 2, 3))
+
+
+def footprint(path: str) -> int:
+    cache = TextureCache()
+    cache.get(path)
+    return cache.used_bytes
+
+
+@pytest.fixture
+def cache():
+    # Room for any two of the three textures, not for all of them
+    sizes = sorted(footprint(p) for p in (A, B, C))
+    return TextureCache(budget_bytes=sizes[1] + sizes[2])
+
+
+def test_least_recently_used_asset_is_evicted(cache):
+    evicted = []
+    cache.bind_evict(evicted.append)
+    cache.get(A)
+    cache.get(B)
+    cache.get(A)
+    cache.get(C)
+
+    assert evicted == [B]
+    assert A in cache and C in cache and B not in cache
+    assert cache.used_bytes <= cache.budget_bytes
+    assert cache.stats()["assets"] == 2
+
+
+def test_pinned_assets_are_not_evicted(cache):
+    cache.acquire(A)
+    cache.acquire(B)
+    cache.get(C)
+    # The requested asset is kept although the pinned ones fill the budget
+    assert A in cache and B in cache
+    assert not cache.evict(A)
+
+    cache.release(A)
+    assert A not in cache
+    assert cache.stats()["pinned"] == 1
+
+
+def test_evicted_asset_is_reloaded(cache):
+    texture = cache.get(A)
+    assert cache.evict(A)
+    assert A not in cache and cache.used_bytes == 0
+    reloaded = cache.get(A)
+    assert reloaded is not None and reloaded.size == texture.size
+    assert A in cache
+
+
+def test_missing_asset_is_not_cached(cache):
+    assert cache.get("assets/images/missing.png") is None
+    assert len(cache) == 0
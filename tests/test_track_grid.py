@@ -0,0 +1,59 @@
+"""
+File: tests/test_track_grid.py
+
+Description:
+    Tests of the venue races shown on the track grid.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+from model import GameState
+from physics import PROFILES
+from track_grid import VenueRace
+from view import RaceTrack
+
+
+def test_venue_races_run_back_to_back_on_one_track():
+    track = RaceTrack(show_odds=False)
+    track.size_hint = (None, None)
+    track.size = (1000, 600)
+    track.reset_horses()
+    race = VenueRace(GameState(balance=0), track, hold=0.5)
+
+    finished = 0
+    for _ in range(10000):
+        was_running = race._running
+        race.step(5, 1 / 12)
+        race.draw(0.5)
+        if was_running and not race._running:
+            finished += 1
+            if finished == 2:
+                break
+    assert finished == 2
+
+    # The next race starts from the line; every image follows its sprite
+    race.step(0, 1)
+    race.step(5, 1 / 12)
+    race.draw(0.0)
+    for sprite in track.horses:
+        assert tuple(sprite.image.pos) == tuple(sprite.pos)
+        assert sprite._highlight_group is None
+
+
+def test_extrapolation_follows_the_race_distance():
+    track = RaceTrack(show_odds=False)
+    track.size_hint = (None, None)
+    track.size = (1000, 600)
+    track.reset_horses()
+    race = VenueRace(GameState(balance=0, physics=PROFILES["staying"]), track, hold=0.5)
+    race.step(0, 1)
+    race.step(30, 1 / 60)
+
+    race.draw(1.0)
+    predicted = [sprite.x for sprite in track.horses]
+    race.step(1, 1 / 60)
+    # One tick later the horses are where the extrapolation put them, up to
+    # the change of speed in that tick
+    for x, position in zip(predicted, race.model.positions):
+        assert abs(x - position) < 0.2
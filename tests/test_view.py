@@ -0,0 +1,116 @@
+"""
+File: tests/test_view.py
+
+Description:
+    Tests of the race track widgets and the game view's reusable popups.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+import time
+
+import pytest
+from kivy.clock import Clock
+from kivy.core.window import Window
+from kivy.uix.widget import Widget
+
+from language_manager import LanguageManager
+from view import GameView, RaceTrack
+
+
+def make_track() -> RaceTrack:
+    track = RaceTrack(show_odds=False)
+    track.size_hint = (None, None)
+    track.size = (1000, 600)
+    track.reset_horses()
+    return track
+
+
+def test_reused_track_keeps_images_on_their_sprites():
+    track = make_track()
+    for winner in (2, 5):
+        for sprite in track.horses:
+            sprite.set_running(True)
+            sprite.x += 400 + 10 * sprite.number
+        track.horses[winner - 1].highlight()
+        track.reset_horses()
+        for sprite in track.horses:
+            sprite.x += 66
+            assert tuple(sprite.image.pos) == tuple(sprite.pos)
+
+
+def test_highlight_follows_sprite():
+    track = make_track()
+    sprite = track.horses[0]
+    sprite.highlight()
+    sprite.x = 300
+    assert tuple(sprite._highlight_ellipse.pos) == pytest.approx((sprite.x - 8, sprite.y - 8))
+    sprite.unhighlight()
+    sprite.x = 350
+    assert tuple(sprite.image.pos) == tuple(sprite.pos)
+
+
+def run_clock(until, seconds: float = 2.0) -> None:
+    deadline = time.monotonic() + seconds
+    while not until() and time.monotonic() < deadline:
+        Clock.tick()
+        time.sleep(0.01)
+
+
+@pytest.fixture(scope="module")
+def view():
+    view = GameView(LanguageManager())
+    yield view
+    view.close()
+
+
+def test_popup_reopened_while_fading_out_opens_again(view):
+    popup = view._make_popup("", Widget(), (100, 100))
+    view._open_popup(popup)
+    assert view._is_popup_open(popup)
+
+    popup.dismiss()
+    assert not view._is_popup_open(popup)
+    # Reopened before the fade-out has removed it from the window
+    view._open_popup(popup)
+    assert view._is_popup_open(popup)
+    run_clock(lambda: popup.parent is None)
+    run_clock(lambda: popup.parent is not None)
+    assert popup.parent is Window
+    assert view._is_popup_open(popup)
+
+    popup.dismiss(animation=False)
+    assert popup.parent is None and not view._is_popup_open(popup)
+
+
+def test_popup_dismissed_before_its_reopen_stays_closed(view):
+    popup = view._make_popup("", Widget(), (100, 100))
+    view._open_popup(popup)
+    popup.dismiss()
+    view._open_popup(popup)
+    popup.dismiss()
+    assert not view._is_popup_open(popup)
+    run_clock(lambda: popup.parent is None)
+    run_clock(lambda: False, 0.3)
+    assert popup.parent is None
+
+
+def test_dismissing_twice_keeps_the_other_popups_pins(view):
+    path = view.POPUP_ASSETS[0]
+    assert path not in view.PINNED_ASSETS
+    first = view._make_popup("", Widget(), (100, 100))
+    second = view._make_popup("", Widget(), (100, 100))
+    view._pin_popup_assets(first)
+    view._pin_popup_assets(second)
+    view._open_popup(first)
+    view._open_popup(second)
+
+    # Dismissed again while still fading out
+    first.dismiss()
+    first.dismiss()
+    assert not view.textures.evict(path)
+
+    second.dismiss(animation=False)
+    run_clock(lambda: first.parent is None)
+    assert view.textures.evict(path)
@@ -0,0 +1,185 @@
+"""
+File: text_cache.py
+
+Description:
+    Provides a bounded cache of rendered text textures for the Horse Race
+    Betting Game, together with Label and Button variants that use it.
+    Rasterizing strings in the Arcade font is one of the most frequent costs
+    of the interface; labels that show a value they have shown before reuse
+    the cached texture instead of rendering it again.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional
+
+from kivy.uix.button import Button
+from kivy.uix.label import Label
+
+
+class TextTextureCache:
+    """
+    Least-recently-used cache of text textures keyed by text and style.
+
+    Attributes:
+        max_entries (int): Maximum number of textures kept before eviction.
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups that required rendering.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries (int): Maximum number of cached textures.
+        """
+        self.max_entries: int = max_entries
+        self.hits: int = 0
+        self.misses: int = 0
+        self._textures: "OrderedDict[Hashable, object]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._textures)
+
+    def get(self, key: Hashable):
+        """
+        Look up a texture and mark it as most recently used.
+
+        Args:
+            key (Hashable): Text and style key.
+
+        Returns:
+            Texture: The cached texture, or None on a miss.
+        """
+        texture = self._textures.get(key)
+        if texture is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._textures.move_to_end(key)
+        return texture
+
+    def put(self, key: Hashable, texture) -> None:
+        """
+        Store a rendered texture, evicting the least recently used ones when full.
+
+        Args:
+            key (Hashable): Text and style key.
+            texture (Texture): The rendered texture.
+        """
+        self._textures[key] = texture
+        self._textures.move_to_end(key)
+        while len(self._textures) > self.max_entries:
+            self._textures.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Drop every cached texture.
+        """
+        self._textures.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Summarize the cache for diagnostics.
+
+        Returns:
+            Dict[str, int]: Entry count, capacity, hits and misses.
+        """
+        return {
+            "entries": len(self._textures),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+# Cache shared by every CachedLabel and CachedButton
+TEXT_CACHE = TextTextureCache()
+
+# Label properties that change the rendered texture; with `disabled`, they
+# make up a texture's cache key
+RENDER_PROPERTIES = (
+    "text", "font_size", "font_name", "font_script_name", "font_direction",
+    "font_family", "font_context", "font_features", "font_hinting",
+    "font_kerning", "font_blended", "bold", "italic", "underline",
+    "strikethrough", "color", "disabled_color", "outline_width",
+    "outline_color", "disabled_outline_color", "halign", "valign",
+    "text_size", "padding", "line_height", "max_lines", "strip",
+    "split_str", "mipmap", "base_direction", "text_language",
+    "unicode_errors", "limit_render_to_text_bbox",
+)
+
+
+class CachedTextMixin:
+    """
+    Mixin for Label subclasses that serves their texture from a TextTextureCache.
+
+    Only plain (non-markup), unshortened text is cached, because markup
+    labels also expose reference zones and shortened ones whether they were
+    cut, both computed during rendering.
+    """
+
+    text_cache: TextTextureCache = TEXT_CACHE
+
+    def _text_cache_key(self) -> Optional[Hashable]:
+        """
+        Build the cache key for the label's current text and style.
+
+        Returns:
+            Optional[Hashable]: The key, or None if the label must not be cached.
+        """
+        # Shortened labels also report whether they were cut during rendering
+        if self.markup or self.shorten or not self.text:
+            return None
+        key = [self.disabled]
+        for name in RENDER_PROPERTIES:
+            value = getattr(self, name)
+            if isinstance(value, dict):
+                value = tuple(sorted(value.items()))
+            elif isinstance(value, list):
+                value = tuple(value)
+            key.append(value)
+        return tuple(key)
+
+    def texture_update(self, *largs) -> None:
+        """
+        Use a cached texture when available, otherwise render and cache it.
+        """
+        key = self._text_cache_key()
+        if key is None:
+            super().texture_update(*largs)
+            return
+
+        texture = self.text_cache.get(key)
+        if texture is not None:
+            self.texture = texture
+            self.texture_size = list(texture.size)
+            self.is_shortened = False
+            return
+
+        super().texture_update(*largs)
+        texture = self.texture
+        if texture is None or texture is self._label.texture_1px:
+            return
+        # Render now: the fill callback would otherwise read whatever text the
+        # core label holds when the texture is first drawn.
+        texture.bind()
+        self.text_cache.put(key, texture)
+        # Make the core label allocate a fresh texture on its next render
+        # instead of overwriting the cached one in place.
+        self._label.texture = None
+
+
+class CachedLabel(CachedTextMixin, Label):
+    """
+    Label whose text textures are shared through the text texture cache.
+    """
+
+
+class CachedButton(CachedTextMixin, Button):
+    """
+    Button whose caption textures are shared through the text texture cache.
+    """
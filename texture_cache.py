@@ -0,0 +1,278 @@
+"""
+File: texture_cache.py
+
+Description:
+    Provides a budgeted texture cache for the Horse Race Betting Game.
+    Tracks the GPU and CPU memory used by every image asset, keeps assets that
+    are currently on screen pinned, and evicts the least recently used
+    off-screen assets once the configured budget is exceeded. Evicted assets
+    are reloaded lazily the next time they are requested.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+
+from kivy.cache import Cache
+from kivy.core.image import Image as CoreImage
+from kivy.logger import Logger
+from kivy.resources import resource_find
+
+
+class TextureEntry:
+    """
+    Bookkeeping for a single cached image asset.
+
+    Attributes:
+        path (str): Source path of the asset, as used by widgets.
+        image (CoreImage): Loaded core image holding the texture(s).
+        gpu_bytes (int): Estimated GPU memory of all textures of the asset.
+        cpu_bytes (int): Pixel data still held in CPU memory for the asset.
+        refcount (int): Number of on-screen users currently pinning the asset.
+    """
+
+    def __init__(self, path: str, image: CoreImage) -> None:
+        """
+        Initialize a TextureEntry and measure its memory footprint.
+
+        Args:
+            path (str): Source path of the asset.
+            image (CoreImage): The loaded core image.
+        """
+        self.path: str = path
+        self.image: CoreImage = image
+        self.refcount: int = 0
+
+        textures = image.image.textures if image.image else [image.texture]
+        self.gpu_bytes: int = sum(
+            tex.width * tex.height * (3 if tex.colorfmt == "rgb" else 4)
+            for tex in textures if tex is not None
+        )
+        data = getattr(image.image, "_data", None) or []
+        self.cpu_bytes: int = sum(len(d.data) for d in data if d.data)
+
+
+class TextureCache:
+    """
+    Least-recently-used texture cache with a memory budget.
+
+    Assets are looked up by the same path widgets use as their ``source``, so
+    the cache also keeps Kivy's own texture cache in sync: a texture returned
+    here is the one any widget loading that path by name will receive, and an
+    evicted asset is dropped from Kivy's caches as well so its memory can be
+    released once no widget displays it anymore.
+
+    Attributes:
+        budget_bytes (int): Combined GPU and CPU memory above which unpinned
+            assets are evicted.
+        gpu_bytes (int): GPU memory currently accounted for.
+        cpu_bytes (int): CPU memory currently accounted for.
+    """
+
+    def __init__(self, budget_bytes: int = 96 * 1024 * 1024) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            budget_bytes (int): Memory budget in bytes.
+        """
+        self.budget_bytes: int = budget_bytes
+        self.gpu_bytes: int = 0
+        self.cpu_bytes: int = 0
+        self._entries: "OrderedDict[str, TextureEntry]" = OrderedDict()
+        self._evict_listeners: List[Callable[[str], None]] = []
+
+    @property
+    def used_bytes(self) -> int:
+        """
+        Total memory currently accounted for by the cache.
+
+        Returns:
+            int: Sum of GPU and CPU bytes.
+        """
+        return self.gpu_bytes + self.cpu_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._entries
+
+    def get(self, path: str):
+        """
+        Return the texture for an asset, loading it if needed, and mark it as
+        most recently used.
+
+        Args:
+            path (str): Source path of the asset.
+
+        Returns:
+            Texture: The asset's (first) texture, or None if it cannot be loaded.
+        """
+        entry = self._touch(path)
+        return entry.image.texture if entry else None
+
+    def get_textures(self, path: str) -> list:
+        """
+        Return all frames of an asset, e.g. for animated images.
+
+        Args:
+            path (str): Source path of the asset.
+
+        Returns:
+            list: The asset's textures, in frame order.
+        """
+        entry = self._touch(path)
+        if entry is None:
+            return []
+        if entry.image.image:
+            return list(entry.image.image.textures)
+        return [entry.image.texture]
+
+    def acquire(self, path: str):
+        """
+        Pin an asset because it is about to be shown on screen.
+
+        Pinned assets are never evicted. Every call must be balanced by a
+        call to `release` once the asset leaves the screen.
+
+        Args:
+            path (str): Source path of the asset.
+
+        Returns:
+            Texture: The asset's (first) texture, or None if it cannot be loaded.
+        """
+        entry = self._touch(path)
+        if entry is None:
+            return None
+        entry.refcount += 1
+        return entry.image.texture
+
+    def release(self, path: str) -> None:
+        """
+        Unpin an asset that is no longer on screen, making it evictable.
+
+        Args:
+            path (str): Source path of the asset.
+        """
+        entry = self._entries.get(path)
+        if entry is None or entry.refcount == 0:
+            return
+        entry.refcount -= 1
+        if entry.refcount == 0:
+            self._enforce_budget()
+
+    def bind_evict(self, callback: Callable[[str], None]) -> None:
+        """
+        Register a callback invoked with the path of every evicted asset, so
+        widgets that keep hidden references can drop them.
+
+        Args:
+            callback (Callable[[str], None]): Function receiving the evicted path.
+        """
+        self._evict_listeners.append(callback)
+
+    def evict(self, path: str) -> bool:
+        """
+        Evict an asset now, unless it is pinned.
+
+        Args:
+            path (str): Source path of the asset.
+
+        Returns:
+            bool: True if the asset was evicted.
+        """
+        entry = self._entries.get(path)
+        if entry is None or entry.refcount:
+            return False
+        self._drop(entry)
+        return True
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Summarize the cache for diagnostics.
+
+        Returns:
+            Dict[str, int]: Asset count, pinned count and memory figures.
+        """
+        return {
+            "assets": len(self._entries),
+            "pinned": sum(1 for e in self._entries.values() if e.refcount),
+            "gpu_bytes": self.gpu_bytes,
+            "cpu_bytes": self.cpu_bytes,
+            "budget_bytes": self.budget_bytes,
+        }
+
+    def _touch(self, path: str) -> Optional[TextureEntry]:
+        """
+        Look up or load an entry and move it to the most recently used end.
+        """
+        entry = self._entries.get(path)
+        if entry is None:
+            try:
+                image = CoreImage(path)
+            except Exception as e:
+                Logger.warning(f"TextureCache: unable to load {path}: {e}")
+                return None
+            entry = TextureEntry(path, image)
+            self._entries[path] = entry
+            self.gpu_bytes += entry.gpu_bytes
+            self.cpu_bytes += entry.cpu_bytes
+            self._enforce_budget(keep=path)
+        else:
+            self._entries.move_to_end(path)
+        self._share_with_kivy(entry)
+        return entry
+
+    def _enforce_budget(self, keep: Optional[str] = None) -> None:
+        """
+        Evict least recently used, unpinned assets until within budget,
+        never evicting the asset named by `keep`.
+        """
+        if self.used_bytes <= self.budget_bytes:
+            return
+        for entry in list(self._entries.values()):
+            if self.used_bytes <= self.budget_bytes:
+                break
+            if entry.refcount == 0 and entry.path != keep:
+                self._drop(entry)
+
+    def _drop(self, entry: TextureEntry) -> None:
+        """
+        Remove an entry from this cache and from Kivy's image caches.
+        """
+        del self._entries[entry.path]
+        self.gpu_bytes -= entry.gpu_bytes
+        self.cpu_bytes -= entry.cpu_bytes
+
+        resolved = resource_find(entry.path) or entry.path
+        for name in {entry.path, resolved}:
+            Cache.remove("kv.image", f"{name}|0|0")
+            count = 0
+            while Cache.get("kv.texture", f"{name}|0|{count}") is not None:
+                Cache.remove("kv.texture", f"{name}|0|{count}")
+                count += 1
+        entry.image = None
+
+        for callback in self._evict_listeners:
+            callback(entry.path)
+
+    @staticmethod
+    def _share_with_kivy(entry: TextureEntry) -> None:
+        """
+        Make sure widgets loading the asset by name receive the cached texture
+        rather than decoding a duplicate after Kivy's own cache timed out.
+        """
+        resolved = resource_find(entry.path) or entry.path
+        loader = entry.image.image
+        if loader is not None and Cache.get("kv.image", f"{resolved}|0|0") is None:
+            # Sharing the loader keeps every frame of animated images available
+            Cache.append("kv.image", f"{resolved}|0|0", loader)
+        textures = loader.textures if loader else [entry.image.texture]
+        for count, tex in enumerate(textures):
+            uid = f"{resolved}|0|{count}"
+            if Cache.get("kv.texture", uid) is None:
+                Cache.append("kv.texture", uid, tex)
+
@@ -0,0 +1,262 @@
+"""
+File: track_grid.py
+
+Description:
+    Split-screen display of several simultaneous races for venue screens.
+    The player's track and one extra track per venue race are laid out in a
+    grid inside a single GameView. Every track is built at the view's full
+    size and shrunk into its cell by a matrix transform on the canvas, so the
+    tracks lay out exactly like the single track and their sprites keep the
+    texture sizes of the shared texture cache. All tracks are drawn in the
+    window's one canvas tree and stepped from a single clock event; venue
+    races run back to back, each driven by its own GameState.
+
+Version: 1.0
+Author: Robbe de Guytenaer, Bernardo José Willis Lozano
+"""
+
+import math
+from typing import Callable, List, Optional
+
+from kivy.clock import Clock
+from kivy.graphics import PopMatrix, PushMatrix, Scale, Translate
+from kivy.uix.widget import Widget
+
+from frame_pacer import FramePacer
+from model import GameState
+from texture_cache import TextureCache
+from view import RaceTrack
+
+
+class TrackCell(Widget):
+    """
+    Grid cell drawing a full-size track scaled down to the cell.
+    """
+
+    def __init__(self, track: RaceTrack, **kwargs):
+        """
+        Wrap a track in a cell.
+
+        Args:
+            track (RaceTrack): The track; its position becomes (0, 0) in the cell.
+        """
+        super().__init__(**kwargs)
+        self.track = track
+        with self.canvas.before:
+            PushMatrix()
+            self._translate = Translate()
+            self._scale = Scale()
+        with self.canvas.after:
+            PopMatrix()
+        track.size_hint = (None, None)
+        track.pos = (0, 0)
+        self.add_widget(track)
+
+    def place(self, x: float, y: float, scale: float, size) -> None:
+        """
+        Move the cell and size its track.
+
+        Args:
+            x (float): Left edge of the scaled track in window coordinates.
+            y (float): Bottom edge of the scaled track in window coordinates.
+            scale (float): Scale factor from the track's size to the cell.
+            size: Full size (width, height) the track is laid out at.
+        """
+        self._translate.xy = (x, y)
+        self._scale.xyz = (scale, scale, 1)
+        self.track.size = size
+
+
+class VenueRace:
+    """
+    A race shown on the grid that runs back to back on its own game state.
+
+    Attributes:
+        model (GameState): The race's game state.
+        track (RaceTrack): The track showing the race.
+        hold (float): Seconds the finished race stays on screen.
+    """
+
+    def __init__(self, model: GameState, track: RaceTrack, hold: float) -> None:
+        """
+        Pair a game state with its track.
+
+        Args:
+            model (GameState): The race's game state.
+            track (RaceTrack): The track showing the race.
+            hold (float): Seconds the finished race stays on screen.
+        """
+        self.model = model
+        self.track = track
+        self.hold = hold
+        self._running = False
+        self._held = 0.0
+
+    def step(self, ticks: int, dt: float) -> None:
+        """
+        Advance the race by simulation ticks, or count down its result hold.
+
+        Args:
+            ticks (int): Simulation ticks to run.
+            dt (float): Time since the last frame.
+        """
+        if not self._running:
+            self._held -= dt
+            if self._held <= 0:
+                self._start()
+            return
+        self.model.advance(self.track.width * 0.9, ticks)
+        if self.model.winner is not None:
+            self._running = False
+            self._held = self.hold
+            for sprite in self.track.horses:
+                if sprite.number == self.model.winner:
+                    sprite.highlight()
+
+    def draw(self, alpha: float) -> None:
+        """
+        Move the sprites to the race's positions.
+
+        Args:
+            alpha (float): Fraction of the next tick already elapsed.
+        """
+        if not self._running:
+            return
+        # Positions advance by the speed scaled down by the race distance
+        step = alpha / self.model.physics.distance
+        for sprite, horse in zip(self.track.horses, self.model.horses):
+            sprite.x = horse.position + horse.speed * step
+
+    def _start(self) -> None:
+        """
+        Return the horses to the start line and start the next race.
+        """
+        # The track lays out its sprites one frame after being sized
+        if not self.track.horses:
+            return
+        self.model.reset()
+        self.track.reset_horses()
+        for sprite in self.track.horses:
+            self.model.horses[sprite.number - 1].position = sprite.x
+            sprite.set_running(True)
+        self.model.setup_race_speeds(self.track.width * 0.9)
+        self._running = True
+
+
+class TrackGrid(Widget):
+    """
+    Grid of the player's track and the venue races' tracks, stepped by one
+    shared clock event.
+
+    Attributes:
+        primary (RaceTrack): The player's track, in the first cell.
+        races (List[VenueRace]): The venue races, in cell order.
+        on_frame (Optional[Callable[[float], None]]): Called on every tick
+            with the frame time while the player's race is animated.
+    """
+
+    # Duration of one race simulation tick; matches GameView.RACE_TICK
+    RACE_TICK = 1 / 60
+
+    # Most ticks simulated in a single frame
+    MAX_RACE_TICKS = 5
+
+    def __init__(self, primary: RaceTrack, textures: TextureCache,
+                 pacer: FramePacer, hold: float = 3, **kwargs):
+        """
+        Initialize a grid holding only the player's track.
+
+        Args:
+            primary (RaceTrack): The player's track.
+            textures (TextureCache): Texture cache shared by every track.
+            pacer (FramePacer): Main loop pacer, kept at the race rate while
+                venue races run.
+            hold (float): Seconds a finished venue race stays on screen.
+        """
+        super().__init__(**kwargs)
+        self.primary = primary
+        self.races: List[VenueRace] = []
+        self.on_frame: Optional[Callable[[float], None]] = None
+        self.textures = textures
+        self.pacer = pacer
+        self.hold = hold
+        self._cells = [TrackCell(primary)]
+        self.add_widget(self._cells[0])
+        self._sim_time = 0.0
+        self._event = None
+        self.bind(pos=self._layout, size=self._layout)
+
+    def add_race(self, model: GameState) -> VenueRace:
+        """
+        Show a venue race in the next cell.
+
+        Args:
+            model (GameState): The race's own game state.
+
+        Returns:
+            VenueRace: The race, started on the next tick.
+        """
+        # Venue races show no odds, so their horses skip the odds label
+        track = RaceTrack(textures=self.textures, show_odds=False)
+        race = VenueRace(model, track, self.hold)
+        self.races.append(race)
+        cell = TrackCell(track)
+        self._cells.append(cell)
+        self.add_widget(cell)
+        self._layout()
+        return race
+
+    def start(self) -> None:
+        """
+        Start the shared tick; venue races keep the loop at the race rate.
+        """
+        if self._event is not None:
+            return
+        self._sim_time = 0.0
+        if self.races:
+            self.pacer.set_racing(True)
+        self._event = Clock.schedule_interval(self._tick, 0)
+
+    def stop(self) -> None:
+        """
+        Stop the shared tick.
+        """
+        if self._event is not None:
+            self._event.cancel()
+            self._event = None
+
+    def _tick(self, dt: float) -> None:
+        """
+        Step every venue race by the elapsed time in fixed ticks, move their
+        sprites and animate the player's race.
+        """
+        self._sim_time += dt
+        steps = min(int(self._sim_time / self.RACE_TICK), self.MAX_RACE_TICKS)
+        self._sim_time = min(self._sim_time - steps * self.RACE_TICK, self.RACE_TICK)
+        alpha = self._sim_time / self.RACE_TICK
+        for race in self.races:
+            race.step(steps, dt)
+            race.draw(alpha)
+        if self.on_frame is not None:
+            self.on_frame(dt)
+
+    def _layout(self, *args) -> None:
+        """
+        Arrange the cells in a near-square grid, filled row by row from the top.
+        """
+        count = len(self._cells)
+        cols = math.ceil(math.sqrt(count))
+        rows = math.ceil(count / cols)
+        cell_w, cell_h = self.width / cols, self.height / rows
+        scale = min(1 / cols, 1 / rows)
+        # Center each scaled track within its cell
+        pad_x = (cell_w - self.width * scale) / 2
+        pad_y = (cell_h - self.height * scale) / 2
+        for i, cell in enumerate(self._cells):
+            row, col = divmod(i, cols)
+            cell.place(
+                self.x + col * cell_w + pad_x,
+                self.top - (row + 1) * cell_h + pad_y,
+                scale,
+                self.size,
+            )
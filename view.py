@@ -11,20 +11,27 @@ Version: 1.0
 Author: Robbe de Guytenaer, Bernardo José Willis Lozano
 """
 
+from functools import partial
+
 from kivy.uix.widget import Widget
 from kivy.uix.floatlayout import FloatLayout
 from kivy.uix.boxlayout import BoxLayout
-from kivy.uix.label import Label
 from kivy.uix.button import Button
 from kivy.uix.textinput import TextInput
 from kivy.uix.popup import Popup
 from kivy.uix.image import Image
 from kivy.graphics import Color, Rectangle, Line, Ellipse, InstructionGroup
 from kivy.clock import Clock
-from kivy.core.audio import SoundLoader
 from kivy.core.window import Window
 from kivy.core.text import LabelBase
 
+from audio import AudioLoader, EffectMixer
+from events import LeaderChanged, OddsUpdated, PositionsTick
+from texture_cache import TextureCache
+from frame_pacer import FramePacer
+from text_cache import CachedLabel, CachedButton
+from startup_profiler import PROFILER
+
 LabelBase.register(name="Arcade", fn_regular="assets/fonts/arcade.ttf")
 
 
@@ -34,11 +41,29 @@ class RaceTrack(Widget):
     and positions HorseSprite instances.
     """
 
-    def __init__(self, **kwargs):
+    # Assets that stay on screen for the whole lifetime of the track
+    PINNED_ASSETS = (
+        "assets/images/grass1.png",
+        "assets/images/grass2.png",
+        "assets/images/racetrack.png",
+        "assets/images/finish_line_1.png",
+    ) + tuple(f"assets/images/horses/horse{n}.png" for n in range(1, 7))
+
+    def __init__(self, textures: TextureCache = None, show_odds: bool = True, **kwargs):
         """
         Initialize the RaceTrack, load background images and prepare the finish line widget.
+
+        Args:
+            textures (TextureCache): Shared texture cache; a private one is created if omitted.
+            show_odds (bool): Whether the horses can show live odds; tracks
+                without them draw one label less per horse.
         """
         super().__init__(**kwargs)
+        self.textures = textures if textures is not None else TextureCache()
+        self.show_odds = show_odds
+        for path in self.PINNED_ASSETS:
+            self.textures.acquire(path)
+
         with self.canvas.before:
             Color(1, 1, 1, 1)
             self.grass_top = Rectangle(source="assets/images/grass1.png")
@@ -91,23 +116,50 @@ class RaceTrack(Widget):
         and add them as children of this widget.
         """
         for child in self.horses:
+            child.detach()
             self.remove_widget(child)
         self.horses = []
 
-        num_horses = 6
-        sample = HorseSprite(1)
-        horse_h = sample.height
+        for i, pos in enumerate(self._start_positions(6)):
+            sprite = HorseSprite(i + 1, self.textures, show_odds=self.show_odds)
+            sprite.pos = pos
+            self.horses.append(sprite)
+            self.add_widget(sprite)
+
+    def reset_horses(self) -> None:
+        """
+        Return the existing sprites to the start line in their idle state.
+        Reusing them avoids rebuilding every sprite's widgets and labels
+        between races.
+        """
+        if not self.horses:
+            self._setup()
+            return
+        for sprite, pos in zip(self.horses, self._start_positions(len(self.horses))):
+            sprite.set_running(False)
+            sprite.unhighlight()
+            sprite.clear_odds()
+            sprite.pos = pos
+
+    def _start_positions(self, num_horses: int) -> list:
+        """
+        Compute the starting position of each lane, evenly spaced along the track.
+
+        Args:
+            num_horses (int): Number of lanes.
+
+        Returns:
+            list: (x, y) per horse, in horse order.
+        """
+        horse_h = HorseSprite.SIZE[1]
         bottom_margin = self.height * 0.22
         visible_h = self.height - bottom_margin
         spacing = (visible_h - num_horses * horse_h) / (num_horses + 1)
         start_x = self.width * 0.1
-
-        for i in range(num_horses):
-            y = bottom_margin + spacing * (i + 1) + horse_h * i
-            sprite = HorseSprite(i + 1)
-            sprite.pos = (start_x, y)
-            self.horses.append(sprite)
-            self.add_widget(sprite)
+        return [
+            (start_x, bottom_margin + spacing * (i + 1) + horse_h * i)
+            for i in range(num_horses)
+        ]
 
 
 class HorseSprite(Widget):
@@ -116,14 +168,22 @@ class HorseSprite(Widget):
     a numeric label, and optional highlight overlay.
     """
 
-    def __init__(self, number: int, **kwargs):
+    SIZE = (100, 100)
+
+    def __init__(self, number: int, textures: TextureCache = None, show_odds: bool = True, **kwargs):
         """
         Initialize the HorseSprite with a horse number, size, image sources,
         and label.
+
+        Args:
+            number (int): The horse's number.
+            textures (TextureCache): Shared texture cache used to pin the running animation.
+            show_odds (bool): Whether to create the label for live odds.
         """
         super().__init__(**kwargs)
         self.number = number
-        self.size = (100, 100)
+        self.textures = textures
+        self.size = self.SIZE
         self.static_source = f"assets/images/horses/horse{number}.png"
         self.animated_source = f"assets/images/horses/horserun{number}.gif"
         self.running = False
@@ -138,7 +198,7 @@ class HorseSprite(Widget):
         self.image.anim_delay = -1
         self.add_widget(self.image)
 
-        self.label = Label(
+        self.label = CachedLabel(
             text=str(number),
             size_hint=(None, None),
             size=self.size,
@@ -148,6 +208,20 @@ class HorseSprite(Widget):
             bold=True
         )
         self.add_widget(self.label)
+
+        # Live win probability, only shown during a race
+        self.odds_label = None
+        if show_odds:
+            self.odds_label = CachedLabel(
+                text="",
+                size_hint=(None, None),
+                size=(self.width, 20),
+                color=(1, 1, 0.6, 1),
+                font_size="16sp",
+                font_name="Arcade",
+                opacity=0
+            )
+            self.add_widget(self.odds_label)
         self.bind(pos=self._sync, size=self._sync)
 
     def _sync(self, *args) -> None:
@@ -159,11 +233,17 @@ class HorseSprite(Widget):
         self.image.size = self.size
         self.label.center_x = self.center_x - 18
         self.label.center_y = self.center_y
+        if self.odds_label is not None:
+            self.odds_label.center_x = self.center_x
+            self.odds_label.y = self.top - 10
 
-        if self._highlight_group:
-            padding = 8
-            self._highlight_ellipse.pos = (self.x - padding, self.y - padding)
-            self._highlight_ellipse.size = (self.width + padding*2, self.height + padding*2)
+    def _sync_highlight(self, *args) -> None:
+        """
+        Keep the highlight overlay around the sprite while it is shown.
+        """
+        padding = 8
+        self._highlight_ellipse.pos = (self.x - padding, self.y - padding)
+        self._highlight_ellipse.size = (self.width + padding*2, self.height + padding*2)
 
     def set_running(self, running: bool) -> None:
         """
@@ -176,12 +256,45 @@ class HorseSprite(Widget):
             return
         self.running = running
         if running:
+            if self.textures:
+                self.textures.acquire(self.animated_source)
             self.image.source = self.animated_source
             self.image.anim_delay = 0.05
         else:
             self.image.source = self.static_source
             self.image.anim_delay = -1
-        self.image.reload()
+            if self.textures:
+                self.textures.release(self.animated_source)
+        if not self.textures:
+            # Without the shared cache Kivy may only have the first GIF frame cached
+            self.image.reload()
+
+    def set_odds(self, probability: float) -> None:
+        """
+        Show the horse's live win probability above it.
+
+        Args:
+            probability (float): Win probability between 0 and 1.
+        """
+        if self.odds_label is None:
+            return
+        self.odds_label.text = f"{probability * 100:.0f}%"
+        self.odds_label.opacity = 1
+
+    def clear_odds(self) -> None:
+        """
+        Hide the horse's win probability.
+        """
+        if self.odds_label is not None:
+            self.odds_label.opacity = 0
+
+    def detach(self) -> None:
+        """
+        Release textures pinned by this sprite before it is removed from the track.
+        """
+        if self.running and self.textures:
+            self.textures.release(self.animated_source)
+        self.running = False
 
     def highlight(self) -> None:
         """
@@ -200,7 +313,8 @@ class HorseSprite(Widget):
         self._highlight_group = group
         self._highlight_ellipse = ellipse
         self.canvas.before.add(group)
-        self.bind(pos=self._sync, size=self._sync)
+        # A callback of its own: unbinding _sync would detach the image and labels
+        self.bind(pos=self._sync_highlight, size=self._sync_highlight)
 
     def unhighlight(self) -> None:
         """
@@ -212,7 +326,7 @@ class HorseSprite(Widget):
             self.canvas.before.remove(self._highlight_group)
         except Exception:
             pass
-        self.unbind(pos=self._sync, size=self._sync)
+        self.unbind(pos=self._sync_highlight, size=self._sync_highlight)
         self._highlight_group = None
         self._highlight_ellipse = None
 
@@ -223,16 +337,85 @@ class GameView(FloatLayout):
     tutorial, popups, and manages all user interactions and animations.
     """
 
-    def __init__(self, lang_mgr, **kwargs):
+    # Backgrounds shared by every popup dialog
+    POPUP_ASSETS = (
+        "assets/images/texture5.png",
+        "assets/images/texture10.png",
+        "assets/images/texture12.png",
+    )
+
+    # Assets of the control panel and side buttons, which are always on screen
+    PINNED_ASSETS = (
+        "assets/images/texture1.png",
+        "assets/images/texture3.png",
+        "assets/images/texture9.png",
+        "assets/images/texture11.png",
+        "assets/images/settings.png",
+        "assets/images/settings2.png",
+    )
+
+    # Toggle button backgrounds shown in the settings popup when muted
+    MUTED_ASSETS = (
+        "assets/images/texture13.png",
+        "assets/images/texture14.png",
+    )
+
+    # (name, path, volume, voices) of the sound effects played through the mixer,
+    # loaded first so the interface sounds right away
+    EFFECT_ASSETS = (
+        ("click", "assets/sounds/click.mp3", 0.8, 4),
+        ("pop", "assets/sounds/popup.mp3", 1.0, 2),
+        ("pistol", "assets/sounds/starterpistol.mp3", 0.8, 2),
+        ("whip", "assets/sounds/whip.mp3", 1.0, 4),
+        ("win", "assets/sounds/win.mp3", 0.9, 1),
+        ("disappointed", "assets/sounds/disappointed.mp3", 0.5, 1),
+    )
+
+    # (attribute, path, volume) of the looping music tracks, which are streamed
+    MUSIC_ASSETS = (
+        ("bg_music", "assets/sounds/music.mp3", 0.2),
+        ("bg_horse", "assets/sounds/horsebackground.mp3", 0.5),
+        ("gallop_snd", "assets/sounds/horsegallop.mp3", 0.4),
+    )
+
+    # Duration of one race simulation tick; horse speeds are in pixels per tick
+    RACE_TICK = 1 / 60
+
+    # Most ticks simulated in a single frame
+    MAX_RACE_TICKS = 5
+
+    # Colors of the result popup's payout line
+    WIN_COLOR = (0, 0.35, 0, 1)
+    LOSS_COLOR = (0.55, 0, 0, 1)
+
+    # Number of tutorial steps, with texts under the "tutorial_step<n>" keys
+    TUTORIAL_STEPS = 5
+
+    # Tutorial button images, hidden while a race is running
+    TUTORIAL_ASSETS = (
+        "assets/images/tutorial1.png",
+        "assets/images/tutorial2.png",
+    )
+
+    def __init__(self, lang_mgr, textures: TextureCache = None, pacer: FramePacer = None, **kwargs):
         """
         Initialize GameView with language manager for localization,
         load audio assets, create track and controls, and schedule initial text updates.
 
         Args:
             lang_mgr (LanguageManager): Manager for localized strings.
+            textures (TextureCache): Budgeted texture cache; a default one is created if omitted.
+            pacer (FramePacer): Main loop pacer; a default one is created if omitted.
         """
         super().__init__(**kwargs)
         self.lang = lang_mgr
+        self.textures = textures if textures is not None else TextureCache()
+        # A pacer created here is stopped by close; a passed one by its owner
+        self._own_pacer = pacer is None
+        self.pacer = pacer if pacer is not None else FramePacer()
+        with PROFILER.phase("GameView textures"):
+            for path in self.PINNED_ASSETS + self.TUTORIAL_ASSETS:
+                self.textures.acquire(path)
 
         # References to dynamic UI elements
         self.bet_amount_label = None
@@ -241,66 +424,58 @@ class GameView(FloatLayout):
         self.lang_popup = None
         self._deposit_popup = None
         self.result_popup = None
+        self.cash_out_btn = None
+        self.countdown_label = None
         self._tutorial_popup = None
         self._tutorial_overlay = None
         self.highlight_widget = None
 
-        # Load audio assets
-        def _load(path, *, loop=False, vol=1.0):
-            snd = SoundLoader.load(path)
-            if snd:
-                snd.loop = loop
-                snd.volume = vol
-                snd._orig_vol = vol
-            return snd
-
-        self.click_snd = _load("assets/sounds/click.mp3", vol=0.8)
-        self.pop_snd = _load("assets/sounds/popup.mp3", vol=1.0)
-        self.pistol_snd = _load("assets/sounds/starterpistol.mp3", vol=0.8)
-        self.win_snd = _load("assets/sounds/win.mp3", vol=0.9)
-        self.disappointed_snd = _load("assets/sounds/disappointed.mp3", vol=0.5)
-        self.whip_snd = _load("assets/sounds/whip.mp3", vol=1.0)
-        self.bg_music = _load("assets/sounds/music.mp3", loop=True, vol=0.2)
-        self.bg_horse = _load("assets/sounds/horsebackground.mp3", loop=True, vol=0.5)
-        self.gallop_snd = _load("assets/sounds/horsegallop.mp3", loop=True, vol=0.4)
-
-        if self.bg_music:
-            self.bg_music.play()
-        if self.bg_horse:
-            self.bg_horse.play()
-
         self._gallop_event = None
-        self._pistol_event = None
         self.music_muted = False
         self.sounds_muted = False
+
+        # Load audio assets in the background; each sound becomes playable
+        # as soon as it is delivered, until then music attributes stay None
+        with PROFILER.phase("GameView audio"):
+            self.audio = AudioLoader()
+            self.effects = EffectMixer(self.audio)
+            for name, path, vol, voices in self.EFFECT_ASSETS:
+                self.effects.add(name, path, vol=vol, voices=voices)
+            for attr, path, vol in self.MUSIC_ASSETS:
+                setattr(self, attr, None)
+                self.audio.request(
+                    path, partial(self._on_music_loaded, attr),
+                    loop=True, vol=vol, stream=True
+                )
         self._race_active = False
         self._selected_horse = None
-
-        # Create and add the track
-        self.track = RaceTrack(size_hint=(1, 1))
-        self.add_widget(self.track)
-
-        # Build control panels and auxiliary UI
-        self._build_controls()
-        self._build_settings_button()
-        self._build_tutorial_button()
-
-        # Error and status labels
-        self.bet_error_label = Label(
-            text="", color=(1, 0, 0, 1), font_size="18sp",
-            font_name="Arcade", size_hint=(None, None), size=(400, 30),
-            opacity=0, halign="center", valign="middle"
-        )
-        self._bet_error_added = False
+        # Reusable popups that are shown, or will be once a fade-out ends
+        self._shown_popups = set()
+        self._race_frame = None
+        self._frame_shown = False
+        # Receives race frame durations when metrics are exported
+        self.frame_times = None
+
+        # Create and add the track; with several races it moves into a grid
+        with PROFILER.phase("GameView track"):
+            self.track = RaceTrack(textures=self.textures, size_hint=(1, 1))
+            self.add_widget(self.track)
+        self.grid = None
+
+        # Build control panels and the side buttons; their popups are
+        # built the first time they are opened
+        with PROFILER.phase("GameView controls"):
+            self._build_controls()
+            self._build_settings_button()
+            self._build_tutorial_button()
+
+        # Error labels are created the first time an error is shown
+        self.bet_error_label = None
+        self.deposit_error_label = None
         self._bet_error_timer = None
+        self._deposit_error_timer = None
 
-        self.deposit_error_label = Label(
-            text="", color=(1, 0, 0, 1), font_size="18sp",
-            font_name="Arcade", size_hint=(None, None), size=(500, 30),
-            opacity=0, halign="center", valign="middle"
-        )
-
-        self.leading_label = Label(
+        self.leading_label = CachedLabel(
             text="", color=(1, 1, 1, 1), font_size="20sp",
             font_name="Arcade", size_hint=(0.5, None), height=30,
             opacity=0, halign="center", valign="middle",
@@ -308,15 +483,28 @@ class GameView(FloatLayout):
         )
         self.add_widget(self.leading_label)
 
-        Clock.schedule_once(lambda dt: self.update_ui_texts(), 0)
+    def _on_music_loaded(self, attr: str, snd) -> None:
+        """
+        Store a music track delivered by the background loader, apply the
+        current mute state and start the background loops.
+
+        Args:
+            attr (str): Attribute name the track is stored under.
+            snd: The loaded sound, or None if it could not be loaded.
+        """
+        setattr(self, attr, snd)
+        if not snd:
+            return
+        if self.music_muted:
+            snd.volume = 0
+        if attr in ("bg_music", "bg_horse"):
+            snd.play()
 
     def _play_click(self) -> None:
         """
         Play click sound if sounds are enabled.
         """
-        if self.click_snd and not self.sounds_muted:
-            self.click_snd.stop()
-            self.click_snd.play()
+        self.effects.play("click")
 
     def on_touch_down(self, touch) -> bool:
         """
@@ -328,9 +516,8 @@ class GameView(FloatLayout):
         Returns:
             bool: Result of super().on_touch_down.
         """
-        if self._race_active and self.whip_snd and not self.sounds_muted:
-            self.whip_snd.stop()
-            self.whip_snd.play()
+        if self._race_active:
+            self.effects.play("whip")
         return super().on_touch_down(touch)
 
     def _add_border(self, widget, rgba=(0, 0, 0, 1), width=2) -> None:
@@ -364,6 +551,119 @@ class GameView(FloatLayout):
         """
         line.rectangle = (w.x, w.y, w.width, w.height)
 
+    def _make_popup(self, title: str, content, size, title_size: str = "26sp", **kwargs) -> Popup:
+        """
+        Create a popup in the game's style with a black outline.
+
+        Popups are built once and reused, so their widget tree, outline and
+        geometry bindings are only created here.
+
+        Args:
+            title (str): Initial popup title.
+            content: Root widget of the popup.
+            size (tuple): Fixed popup size.
+            title_size (str): Font size of the title.
+            **kwargs: Additional Popup properties (e.g. overlay_color).
+
+        Returns:
+            Popup: The new popup, not yet opened.
+        """
+        popup = Popup(
+            title=title,
+            title_font="assets/fonts/arcade.ttf",
+            title_size=title_size,
+            title_align="center",
+            title_color=(1, 1, 1, 1),
+            content=content,
+            size_hint=(None, None),
+            size=size,
+            background="assets/images/texture5.png",
+            border=(0, 0, 0, 0),
+            separator_height=0,
+            auto_dismiss=False,
+            **kwargs
+        )
+        self._add_border(popup)
+        popup.bind(
+            on_pre_open=lambda *_: self._shown_popups.add(popup),
+            on_dismiss=lambda *_: self._shown_popups.discard(popup),
+        )
+        return popup
+
+    def _open_popup(self, popup: Popup) -> None:
+        """
+        Open a reusable popup. A popup still fading out after a dismiss is
+        opened again once the fade-out has removed it, so a quick reopen is
+        not swallowed.
+
+        Args:
+            popup (Popup): The popup to open.
+        """
+        if popup in self._shown_popups:
+            return
+        if popup.parent is None:
+            popup.open()
+            return
+
+        def reopen(dt):
+            # Unless it was dismissed again in the meantime
+            if popup in self._shown_popups:
+                self._shown_popups.discard(popup)
+                popup.open()
+
+        def removed(instance, parent):
+            # The popup only counts as closed once removal has finished
+            if parent is None:
+                popup.unbind(parent=removed)
+                Clock.schedule_once(reopen, 0)
+
+        self._shown_popups.add(popup)
+        popup.bind(parent=removed)
+
+    def _is_popup_open(self, popup) -> bool:
+        """
+        Check whether a reusable popup is currently shown.
+
+        Args:
+            popup: The popup, or None if it was never built.
+
+        Returns:
+            bool: True if the popup is open.
+        """
+        return popup is not None and popup in self._shown_popups
+
+    def _pin_popup_assets(self, popup: Popup, extra=()) -> None:
+        """
+        Pin a popup's background textures whenever it opens and release them
+        when it is dismissed, so they become evictable from the texture cache.
+
+        Args:
+            popup (Popup): The reusable popup.
+            extra (tuple): Additional asset paths shown by the popup.
+        """
+        paths = self.POPUP_ASSETS + tuple(extra)
+        # on_dismiss fires again if the popup is dismissed while fading out,
+        # which must not release pins other popups hold on the shared assets
+        pinned = False
+
+        def _acquire(*_):
+            nonlocal pinned
+            if pinned:
+                return
+            pinned = True
+            for p in paths:
+                self.textures.acquire(p)
+
+        def _release(*_):
+            nonlocal pinned
+            if not pinned:
+                return
+            pinned = False
+            for p in paths:
+                self.textures.release(p)
+
+        popup.bind(on_pre_open=_acquire, on_dismiss=_release)
+
     def _build_settings_button(self) -> None:
         """
         Create and position the settings gear button.
@@ -386,10 +686,7 @@ class GameView(FloatLayout):
             btn (Button): The toggle button instance.
         """
         self.music_muted = not self.music_muted
-        btn.text = (
-            self.lang.get("unmute_music") if self.music_muted
-            else self.lang.get("mute_music")
-        )
+        self.lang.bind(btn, "unmute_music" if self.music_muted else "mute_music")
         if self.music_muted:
             btn.background_normal = "assets/images/texture13.png"
             btn.background_down = "assets/images/texture14.png"
@@ -399,6 +696,7 @@ class GameView(FloatLayout):
         for snd in (self.bg_music, self.bg_horse, self.gallop_snd):
             if snd:
                 snd.volume = 0 if self.music_muted else snd._orig_vol
+        self.controller.setting_changed("music_muted", self.music_muted)
 
     def _toggle_sounds(self, btn: Button) -> None:
         """
@@ -408,108 +706,61 @@ class GameView(FloatLayout):
             btn (Button): The toggle button instance.
         """
         self.sounds_muted = not self.sounds_muted
-        btn.text = (
-            self.lang.get("unmute_sounds") if self.sounds_muted
-            else self.lang.get("mute_sounds")
-        )
+        self.lang.bind(btn, "unmute_sounds" if self.sounds_muted else "mute_sounds")
         if self.sounds_muted:
             btn.background_normal = "assets/images/texture13.png"
             btn.background_down = "assets/images/texture14.png"
         else:
             btn.background_normal = "assets/images/texture10.png"
             btn.background_down = "assets/images/texture12.png"
-        for snd in (self.click_snd, self.pop_snd, self.pistol_snd, self.win_snd):
-            if snd:
-                snd.volume = 0 if self.sounds_muted else snd._orig_vol
+        self.effects.set_muted(self.sounds_muted)
+        self.controller.setting_changed("sounds_muted", self.sounds_muted)
 
-    def _show_settings_popup(self) -> None:
+    def _build_settings_popup(self) -> None:
         """
-        Display the settings popup allowing toggling music, sounds, and language.
+        Build the settings popup once; later opens only refresh its texts.
         """
-        if self.pop_snd and not self.sounds_muted:
-            self.pop_snd.stop(); self.pop_snd.play()
-
         root = FloatLayout()
-
-        music_btn = Button(
-            text=(self.lang.get("unmute_music") if self.music_muted else self.lang.get("mute_music")),
-            font_size="22sp", font_name="Arcade",
-            size_hint=(0.8, 0.18), pos_hint={"center_x": 0.5, "center_y": 0.85},
-            background_normal="assets/images/texture10.png",
-            background_down="assets/images/texture12.png",
-            border=(0, 0, 0, 0)
-        )
-        sounds_btn = Button(
-            text=(self.lang.get("unmute_sounds") if self.sounds_muted else self.lang.get("mute_sounds")),
-            font_size="22sp", font_name="Arcade",
-            size_hint=(0.8, 0.18), pos_hint={"center_x": 0.5, "center_y": 0.62},
-            background_normal="assets/images/texture10.png",
-            background_down="assets/images/texture12.png",
-            border=(0, 0, 0, 0)
-        )
-        language_btn = Button(
-            text=self.lang.get("language"),
-            font_size="22sp", font_name="Arcade",
-            size_hint=(0.8, 0.18), pos_hint={"center_x": 0.5, "center_y": 0.39},
-            background_normal="assets/images/texture10.png",
-            background_down="assets/images/texture12.png",
-            border=(0, 0, 0, 0)
-        )
-        close_btn = Button(
-            text=self.lang.get("close"),
+        btn_kwargs = dict(
             font_size="22sp", font_name="Arcade",
-            size_hint=(0.8, 0.18), pos_hint={"center_x": 0.5, "center_y": 0.16},
+            size_hint=(0.8, 0.18),
             background_normal="assets/images/texture10.png",
             background_down="assets/images/texture12.png",
             border=(0, 0, 0, 0)
         )
 
-        for btn in (music_btn, sounds_btn, language_btn, close_btn):
+        self._music_btn = CachedButton(pos_hint={"center_x": 0.5, "center_y": 0.85}, **btn_kwargs)
+        self._sounds_btn = CachedButton(pos_hint={"center_x": 0.5, "center_y": 0.62}, **btn_kwargs)
+        self._language_btn = CachedButton(pos_hint={"center_x": 0.5, "center_y": 0.39}, **btn_kwargs)
+        self._close_btn = CachedButton(pos_hint={"center_x": 0.5, "center_y": 0.16}, **btn_kwargs)
+
+        for btn in (self._music_btn, self._sounds_btn, self._language_btn, self._close_btn):
             self._add_border(btn)
             root.add_widget(btn)
 
-        music_btn.bind(on_release=lambda *_: (self._play_click(), self._toggle_music(music_btn)))
-        sounds_btn.bind(on_release=lambda *_: (self._play_click(), self._toggle_sounds(sounds_btn)))
-        language_btn.bind(on_release=lambda *_: (self._play_click(), self._change_language()))
-        close_btn.bind(on_release=lambda *_: (self._play_click(), self.settings_popup.dismiss()))
+        self._music_btn.bind(on_release=lambda btn: (self._play_click(), self._toggle_music(btn)))
+        self._sounds_btn.bind(on_release=lambda btn: (self._play_click(), self._toggle_sounds(btn)))
+        self._language_btn.bind(on_release=lambda *_: (self._play_click(), self._change_language()))
+        self._close_btn.bind(on_release=lambda *_: (self._play_click(), self.settings_popup.dismiss()))
 
-        self.settings_popup = Popup(
-            title=self.lang.get("settings_title"),
-            title_font="assets/fonts/arcade.ttf",
-            title_size="26sp",
-            title_align="center",
-            title_color=(1, 1, 1, 1),
-            content=root,
-            size_hint=(None, None),
-            size=(500, 450),
-            background="assets/images/texture5.png",
-            border=(0, 0, 0, 0),
-            separator_height=0,
-            auto_dismiss=False,
-        )
+        self.lang.bind(self._music_btn, "unmute_music" if self.music_muted else "mute_music")
+        self.lang.bind(self._sounds_btn, "unmute_sounds" if self.sounds_muted else "mute_sounds")
+        self.lang.bind(self._language_btn, "language")
+        self.lang.bind(self._close_btn, "close")
 
-        with self.settings_popup.canvas.after:
-            Color(0, 0, 0, 1)
-            outline = Line(
-                rectangle=(
-                    self.settings_popup.x,
-                    self.settings_popup.y,
-                    self.settings_popup.width,
-                    self.settings_popup.height
-                ),
-                width=2
-            )
+        self.settings_popup = self._make_popup("", root, (500, 450))
+        self.lang.bind(self.settings_popup, "settings_title", attr="title")
+        self._pin_popup_assets(self.settings_popup, self.MUTED_ASSETS)
 
-        def _upd_sp(*_):
-            outline.rectangle = (
-                self.settings_popup.x,
-                self.settings_popup.y,
-                self.settings_popup.width,
-                self.settings_popup.height
-            )
+    def _show_settings_popup(self) -> None:
+        """
+        Display the settings popup allowing toggling music, sounds, and language.
+        """
+        self.effects.play("pop")
 
-        self.settings_popup.bind(pos=_upd_sp, size=_upd_sp)
-        self.settings_popup.open()
+        if self.settings_popup is None:
+            self._build_settings_popup()
+        self._open_popup(self.settings_popup)
 
     def _change_language(self) -> None:
         """
@@ -519,13 +770,10 @@ class GameView(FloatLayout):
             self.settings_popup.dismiss()
         self._show_language_popup()
 
-    def _show_language_popup(self) -> None:
+    def _build_language_popup(self) -> None:
         """
-        Display a popup to select the application's language.
+        Build the language selection popup once; later opens only refresh its texts.
         """
-        if self.pop_snd and not self.sounds_muted:
-            self.pop_snd.stop(); self.pop_snd.play()
-
         root = FloatLayout()
         btn_kwargs = dict(
             font_size="22sp", font_name="Arcade",
@@ -537,12 +785,12 @@ class GameView(FloatLayout):
         )
 
         def make_lang_btn(code, label, pos_y):
-            btn = Button(text=label, pos_hint={"center_x": 0.5, "center_y": pos_y}, **btn_kwargs)
+            btn = CachedButton(text=label, pos_hint={"center_x": 0.5, "center_y": pos_y}, **btn_kwargs)
             self._add_border(btn)
             btn.bind(on_release=lambda *_: (
                 self._play_click(),
-                self.lang.load(code),
-                self.update_ui_texts(),
+                self.lang.set_language(code),
+                self.controller.setting_changed("language", code),
                 self.lang_popup.dismiss(),
                 self._show_settings_popup()
             ))
@@ -552,52 +800,29 @@ class GameView(FloatLayout):
         make_lang_btn("es", "Español", 0.55)
         make_lang_btn("sv", "Svenska", 0.35)
 
-        cancel_btn = Button(text=self.lang.get("cancel"), pos_hint={"center_x": 0.5, "center_y": 0.15}, **btn_kwargs)
-        self._add_border(cancel_btn)
-        cancel_btn.bind(on_release=lambda *_: (
+        self._lang_cancel_btn = CachedButton(pos_hint={"center_x": 0.5, "center_y": 0.15}, **btn_kwargs)
+        self._add_border(self._lang_cancel_btn)
+        self._lang_cancel_btn.bind(on_release=lambda *_: (
             self._play_click(),
             self.lang_popup.dismiss(),
             self._show_settings_popup()
         ))
-        root.add_widget(cancel_btn)
+        root.add_widget(self._lang_cancel_btn)
+        self.lang.bind(self._lang_cancel_btn, "cancel")
 
-        self.lang_popup = Popup(
-            title=self.lang.get("language"),
-            title_font="assets/fonts/arcade.ttf",
-            title_size="26sp",
-            title_align="center",
-            title_color=(1, 1, 1, 1),
-            content=root,
-            size_hint=(None, None),
-            size=(500, 450),
-            background="assets/images/texture5.png",
-            border=(0, 0, 0, 0),
-            separator_height=0,
-            auto_dismiss=False,
-        )
+        self.lang_popup = self._make_popup("", root, (500, 450))
+        self.lang.bind(self.lang_popup, "language", attr="title")
+        self._pin_popup_assets(self.lang_popup)
 
-        with self.lang_popup.canvas.after:
-            Color(0, 0, 0, 1)
-            outline = Line(
-                rectangle=(
-                    self.lang_popup.x,
-                    self.lang_popup.y,
-                    self.lang_popup.width,
-                    self.lang_popup.height
-                ),
-                width=2
-            )
-
-        def _upd_lp(*_):
-            outline.rectangle = (
-                self.lang_popup.x,
-                self.lang_popup.y,
-                self.lang_popup.width,
-                self.lang_popup.height
-            )
+    def _show_language_popup(self) -> None:
+        """
+        Display a popup to select the application's language.
+        """
+        self.effects.play("pop")
 
-        self.lang_popup.bind(pos=_upd_lp, size=_upd_lp)
-        self.lang_popup.open()
+        if self.lang_popup is None:
+            self._build_language_popup()
+        self._open_popup(self.lang_popup)
 
     def _build_controls(self) -> None:
         """
@@ -614,12 +839,12 @@ class GameView(FloatLayout):
         self._add_border(self.control_panel, (0, 0, 0, 1), 2)
 
         top_row = BoxLayout(size_hint=(1, 0.4))
-        self.bet_amount_label = Label(
-            text=self.lang.get("bet_amount"),
+        self.bet_amount_label = CachedLabel(
             color=(0, 0, 0, 1),
             font_size="25sp",
             font_name="Arcade"
         )
+        self.lang.bind(self.bet_amount_label, "bet_amount")
         top_row.add_widget(self.bet_amount_label)
 
         self.bet_input = TextInput(
@@ -643,11 +868,10 @@ class GameView(FloatLayout):
         top_row.add_widget(self.bet_input)
         self._add_border(self.bet_input, (0, 0, 0, 1), 2)
 
-        self.balance_label = Label(text="", color=(0, 0, 0, 1), font_size="25sp", font_name="Arcade")
+        self.balance_label = CachedLabel(text="", color=(0, 0, 0, 1), font_size="25sp", font_name="Arcade")
         top_row.add_widget(self.balance_label)
 
-        self.deposit_btn = Button(
-            text=self.lang.get("deposit"),
+        self.deposit_btn = CachedButton(
             color=(0, 0, 0, 1),
             background_normal="",
             background_down="",
@@ -655,6 +879,7 @@ class GameView(FloatLayout):
             font_size="24sp",
             font_name="Arcade"
         )
+        self.lang.bind(self.deposit_btn, "deposit")
         self.deposit_btn.bind(on_release=lambda *_: self.show_deposit_popup())
         top_row.add_widget(self.deposit_btn)
         self._add_border(self.deposit_btn, (0, 0, 0, 1), 2)
@@ -664,7 +889,7 @@ class GameView(FloatLayout):
         horse_row = BoxLayout(size_hint=(1, 0.5))
         self.horse_buttons = []
         for i in range(6):
-            btn = Button(
+            btn = CachedButton(
                 text=str(i + 1),
                 color=(1, 1, 1, 1),
                 background_normal="assets/images/texture9.png",
@@ -688,30 +913,32 @@ class GameView(FloatLayout):
         Args:
             instance (Button): The horse button that was pressed.
         """
-        if self.click_snd and not self.sounds_muted:
-            self.click_snd.stop(); self.click_snd.play()
-        if self.pistol_snd and not self.sounds_muted:
-            if self._pistol_event:
-                Clock.unschedule(self._pistol_event)
-            self._pistol_event = Clock.schedule_once(
-                lambda _dt: (self.pistol_snd.stop(), self.pistol_snd.play()), 0.01
-            )
+        # The click itself is played by the button binding
+        self.effects.play("pistol")
 
         horse_number = int(instance.text)
         amount = int(self.bet_input.text)
-        self._selected_horse = horse_number
+        self.show_selected_horse(horse_number)
 
+        try:
+            self.controller.place_bet(horse_number, amount)
+        except Exception:
+            pass
+
+    def show_selected_horse(self, horse_number: int) -> None:
+        """
+        Highlight the horse the player bets on.
+
+        Args:
+            horse_number (int): Number of the selected horse.
+        """
+        self._selected_horse = horse_number
         for sprite in self.track.horses:
             if sprite.number == horse_number:
                 sprite.highlight()
             else:
                 sprite.unhighlight()
 
-        try:
-            self.controller.place_bet(horse_number, amount)
-        except Exception:
-            pass
-
     def update_balance(self, balance: float) -> None:
         """
         Update the balance display label.
@@ -719,7 +946,7 @@ class GameView(FloatLayout):
         Args:
             balance (float): The new balance to display.
         """
-        self.balance_label.text = f"{self.lang.get('balance')}: ${balance}"
+        self.lang.bind(self.balance_label, "balance", compose=lambda s: f"{s}: ${balance}")
 
     def start_race_animation(self, horse_speeds, finish_x: float) -> None:
         """
@@ -732,8 +959,18 @@ class GameView(FloatLayout):
         if hasattr(self, "tutorial_btn"):
             self.tutorial_btn.opacity = 0
             self.tutorial_btn.disabled = True
+            # Drop the button's texture references so the images can be evicted
+            self.tutorial_btn.background_normal = ""
+            self.tutorial_btn.background_down = ""
+            for path in self.TUTORIAL_ASSETS:
+                self.textures.release(path)
 
         self._race_active = True
+
+        # Build the result popup now rather than on the frame the winner finishes
+        if self.result_popup is None:
+            self._build_result_popup()
+
         if self.gallop_snd and not self.music_muted:
             if self._gallop_event:
                 Clock.unschedule(self._gallop_event)
@@ -746,25 +983,180 @@ class GameView(FloatLayout):
 
         self.leading_label.opacity = 1
         self.finish_x = finish_x
-        self.event = Clock.schedule_interval(self._animate, 1 / 60)
+        # Animate on every frame the pacer allows and step the race in fixed
+        # ticks, so its speed does not depend on the display's frame rate
+        self._sim_time = 0.0
+        self.pacer.set_racing(True)
+        if self.grid is not None:
+            # The grid's tick steps every track; it animates this race too
+            self.grid.on_frame = self._animate
+        else:
+            self.event = Clock.schedule_interval(self._animate, 0)
+
+    def stop_race_animation(self) -> None:
+        """
+        Stop the race animation loop.
+        """
+        if self.grid is not None:
+            self.grid.on_frame = None
+        else:
+            Clock.unschedule(self.event)
+
+    def close(self) -> None:
+        """
+        Stop the frame pacer, if the view created it.
+        """
+        if self._own_pacer:
+            self.pacer.stop()
+
+    def set_render_scale(self, scale: float, smooth: bool = True) -> None:
+        """
+        Draw the race track, or the grid of tracks, at a fraction of the
+        window's resolution and upscale it; the controls stay sharp.
+
+        Args:
+            scale (float): Internal resolution as a fraction of the window's.
+            smooth (bool): Upscale with linear rather than nearest filtering.
+        """
+        # Imported here because only render-scale mode needs an offscreen buffer
+        from render_scale import RenderScaleContainer
+
+        stage = self.grid if self.grid is not None else self.track
+        index = self.children.index(stage)
+        self.remove_widget(stage)
+        self.add_widget(
+            RenderScaleContainer(stage, scale, smooth=smooth, size_hint=(1, 1)), index=index
+        )
+
+    def show_tracks(self, models, hold: float = 3) -> None:
+        """
+        Show venue races next to the player's race, in a grid of tracks
+        sharing this view's textures, sounds and animation tick.
+
+        Args:
+            models (Sequence[GameState]): One game state per venue race.
+            hold (float): Seconds a finished venue race stays on screen.
+        """
+        # Imported here because track_grid builds on this module's widgets
+        from track_grid import TrackGrid
+
+        index = self.children.index(self.track)
+        self.remove_widget(self.track)
+        self.grid = TrackGrid(self.track, self.textures, self.pacer, hold=hold, size_hint=(1, 1))
+        for model in models:
+            self.grid.add_race(model)
+        self.add_widget(self.grid, index=index)
+        self.grid.start()
 
     def _animate(self, dt) -> None:
         """
-        Called on each frame: update model, move sprites, and update leading label.
+        Called on each frame: advance the race and move the sprites to the
+        latest positions published by the model.
 
         Args:
             dt: Time since last frame.
         """
-        self.controller.update_speeds_and_positions()
-        for sprite in self.track.horses:
-            pos = self.controller.model.horses[sprite.number - 1].position
-            sprite.x = self.track.x + pos
+        if self.frame_times is not None:
+            self.frame_times.record(dt)
+        if self.controller.simulation is not None:
+            # The worker process simulates in real time; show its latest tick
+            self.controller.sync_simulation()
+            alpha = 0.0
+        else:
+            alpha = self._step_race(dt)
 
-        leader = max(
-            self.track.horses,
-            key=lambda spr: self.controller.model.horses[spr.number - 1].position
-        ).number
-        self.leading_label.text = f"{self.lang.get('leading_horse')} {leader}"
+        frame = self._race_frame
+        if frame is None or (self._frame_shown and not alpha):
+            return
+        self._frame_shown = True
+        x0 = self.track.x
+        # Positions advance by the speed scaled down by the race distance
+        step = alpha / self.controller.model.physics.distance
+        for sprite, pos, speed in zip(self.track.horses, frame.positions, frame.speeds):
+            sprite.x = x0 + pos + speed * step
+
+    def _step_race(self, dt: float) -> float:
+        """
+        Advance the in-process race simulation by the elapsed time in fixed ticks.
+
+        Args:
+            dt (float): Time since last frame.
+
+        Returns:
+            float: Fraction of the next tick already elapsed, used to
+            extrapolate sprite positions so displays faster than the tick
+            rate still see motion on every frame.
+        """
+        self._sim_time += dt
+        steps = min(int(self._sim_time / self.RACE_TICK), self.MAX_RACE_TICKS)
+        # After a long stall, drop the backlog instead of fast-forwarding it
+        self._sim_time = min(self._sim_time - steps * self.RACE_TICK, self.RACE_TICK)
+        self.controller.advance_race(steps)
+        return self._sim_time / self.RACE_TICK
+
+    def on_positions(self, event: PositionsTick) -> None:
+        """
+        Remember the latest horse positions; sprites are moved on the next frame.
+
+        Args:
+            event (PositionsTick): The model's position batch.
+        """
+        self._race_frame = event
+        self._frame_shown = False
+
+    def on_leader_changed(self, event: LeaderChanged) -> None:
+        """
+        Show the new leader in the banner.
+
+        Args:
+            event (LeaderChanged): The model's leader event.
+        """
+        leader = event.horse_number
+        self.lang.bind(self.leading_label, "leading_horse", compose=lambda s: f"{s} {leader}")
+
+    def on_odds(self, event: OddsUpdated) -> None:
+        """
+        Show live win probabilities and the current cash-out offer.
+
+        Args:
+            event (OddsUpdated): The latest quote.
+        """
+        if not self._race_active:
+            return
+        for sprite, probability in zip(self.track.horses, event.probabilities):
+            sprite.set_odds(probability)
+
+        if event.cash_out is None:
+            if self.cash_out_btn is not None:
+                self.cash_out_btn.opacity = 0
+                self.cash_out_btn.disabled = True
+            return
+        if self.cash_out_btn is None:
+            self._build_cash_out_button()
+        self.lang.bind(self.cash_out_btn, "cash_out", f"{event.cash_out:.2f}")
+        self.cash_out_btn.opacity = 1
+        self.cash_out_btn.disabled = False
+
+    def _build_cash_out_button(self) -> None:
+        """
+        Build the cash-out button shown during races while the bet is open.
+        """
+        self.cash_out_btn = CachedButton(
+            color=(1, 1, 1, 1),
+            background_normal="assets/images/texture9.png",
+            background_down="assets/images/texture11.png",
+            border=(0, 0, 0, 0),
+            font_size="22sp",
+            font_name="Arcade",
+            size_hint=(None, None),
+            size=(280, 50),
+            pos_hint={"right": 0.98, "y": 0.02},
+            opacity=0,
+            disabled=True
+        )
+        self._add_border(self.cash_out_btn, (0, 0, 0, 1), 2)
+        self.cash_out_btn.bind(on_release=lambda *_: (self._play_click(), self.controller.cash_out()))
+        self.add_widget(self.cash_out_btn)
 
     def reset_track(self) -> None:
         """
@@ -776,86 +1168,152 @@ class GameView(FloatLayout):
             Clock.unschedule(self._gallop_event)
             self._gallop_event = None
 
-        self.track._setup()
+        self.track.reset_horses()
         self.control_panel.opacity = 1
         self.control_panel.disabled = False
         self.leading_label.opacity = 0
+        self.lang.unbind(self.leading_label)
         self.leading_label.text = ""
+        self._race_frame = None
+        if self.cash_out_btn is not None:
+            self.cash_out_btn.opacity = 0
+            self.cash_out_btn.disabled = True
         if hasattr(self, "tutorial_btn"):
             self.tutorial_btn.opacity = 1
             self.tutorial_btn.disabled = False
+            for path in self.TUTORIAL_ASSETS:
+                self.textures.acquire(path)
+            self.tutorial_btn.background_normal, self.tutorial_btn.background_down = self.TUTORIAL_ASSETS
 
         self._race_active = False
+        # Venue races keep running between the player's races
+        if self.grid is None or not self.grid.races:
+            self.pacer.set_racing(False)
         for sprite in self.track.horses:
             sprite.unhighlight()
         self._selected_horse = None
 
-    def show_result(self, winner: int, player_won: bool, payout: float) -> None:
+    def _build_result_popup(self) -> None:
+        """
+        Build the race result popup once. It is prepared when a race starts so
+        that showing the result on the finishing frame only swaps texts.
+        """
+        content = BoxLayout(orientation="vertical", padding=10, spacing=10)
+        self._result_line1 = CachedLabel(font_size="22sp", font_name="Arcade", color=(0, 0, 0, 1))
+        self._result_line2 = CachedLabel(font_size="18sp", font_name="Arcade")
+        content.add_widget(self._result_line1)
+        content.add_widget(self._result_line2)
+
+        self.result_popup = self._make_popup("", content, (580, 240), title_size="28sp")
+        self.lang.bind(self.result_popup, "race_result", attr="title")
+        self._pin_popup_assets(self.result_popup)
+
+    def prepare_result_texts(self, num_horses: int, amount=None) -> None:
+        """
+        Render every result text the running race can end with, one per frame,
+        so that showing the result does not rasterize any text.
+
+        Args:
+            num_horses (int): Number of horses in the race.
+            amount: Amount wagered, or None if there is no bet.
+        """
+        if self.result_popup is None:
+            self._build_result_popup()
+        pending = [(self._result_line1, "horse_wins", n, None) for n in range(1, num_horses + 1)]
+        if amount is not None:
+            pending.append((self._result_line2, "you_won", amount * num_horses, self.WIN_COLOR))
+            pending.append((self._result_line2, "you_lost", amount, self.LOSS_COLOR))
+
+        def render(dt):
+            # Stop once the result is on screen; its text is final by then
+            if not pending or self._is_popup_open(self.result_popup):
+                return
+            label, key, value, color = pending.pop()
+            if color is not None:
+                label.color = color
+            self.lang.bind(label, key, value)
+            label.texture_update()
+            Clock.schedule_once(render, 0)
+
+        Clock.schedule_once(render, 0)
+
+    def show_result(self, winner: int, player_won, payout: float) -> None:
         """
         Display a popup showing race results and payout or loss.
 
         Args:
             winner (int): Winning horse number.
-            player_won (bool): True if player's horse won.
+            player_won (Optional[bool]): True if player's horse won, None if
+                the player did not bet on the race.
             payout (float): Amount won or lost.
         """
-        title = self.lang.get("race_result")
-        line1 = self.lang.get("horse_wins").format(winner)
         if player_won:
-            if self.win_snd and not self.sounds_muted:
-                self.win_snd.stop(); self.win_snd.play()
-            line2 = self.lang.get("you_won").format(payout)
+            self.effects.play("win")
+        elif player_won is not None:
+            self.effects.play("disappointed")
+
+        if self.result_popup is None:
+            self._build_result_popup()
+        self.lang.bind(self._result_line1, "horse_wins", winner)
+        if player_won is None:
+            self.lang.unbind(self._result_line2)
+            self._result_line2.text = ""
         else:
-            if self.disappointed_snd and not self.sounds_muted:
-                self.disappointed_snd.stop(); self.disappointed_snd.play()
-            line2 = self.lang.get("you_lost").format(payout)
+            self.lang.bind(self._result_line2, "you_won" if player_won else "you_lost", payout)
+            self._result_line2.color = self.WIN_COLOR if player_won else self.LOSS_COLOR
+        self._open_popup(self.result_popup)
 
-        content = BoxLayout(orientation="vertical", padding=10, spacing=10)
-        content.add_widget(Label(text=line1, font_size="22sp", font_name="Arcade", color=(0, 0, 0, 1)))
-        content.add_widget(Label(
-            text=line2,
-            font_size="18sp",
-            font_name="Arcade",
-            color=(0, 0.35, 0, 1) if player_won else (0.55, 0, 0, 1)
-        ))
+    def show_opening_odds(self, probabilities) -> None:
+        """
+        Show each horse's win probability before the race starts.
 
-        self.result_popup = Popup(
-            title=title,
-            title_font="assets/fonts/arcade.ttf",
-            title_size="28sp",
-            title_align="center",
-            title_color=(1, 1, 1, 1),
-            content=content,
-            size_hint=(None, None),
-            size=(580, 240),
-            background="assets/images/texture5.png",
-            border=(0, 0, 0, 0),
-            separator_height=0,
-            auto_dismiss=False
-        )
+        Args:
+            probabilities (Sequence[float]): Win probability per horse, in horse order.
+        """
+        for sprite, probability in zip(self.track.horses, probabilities):
+            sprite.set_odds(probability)
 
-        with self.result_popup.canvas.after:
-            Color(0, 0, 0, 1)
-            outline = Line(
-                rectangle=(
-                    self.result_popup.x,
-                    self.result_popup.y,
-                    self.result_popup.width,
-                    self.result_popup.height
-                ),
-                width=2
-            )
+    def show_countdown(self, seconds: int) -> None:
+        """
+        Show the time left until the next scheduled race.
 
-        def _upd_res(*_):
-            outline.rectangle = (
-                self.result_popup.x,
-                self.result_popup.y,
-                self.result_popup.width,
-                self.result_popup.height
+        Args:
+            seconds (int): Seconds until the race starts.
+        """
+        if self.countdown_label is None:
+            self.countdown_label = CachedLabel(
+                text="", color=(1, 1, 1, 1), font_size="24sp",
+                font_name="Arcade", size_hint=(0.5, None), height=30,
+                halign="center", valign="middle",
+                pos_hint={"center_x": 0.5, "top": 0.99}
             )
+            self.add_widget(self.countdown_label)
+        self.lang.bind(self.countdown_label, "next_race", seconds)
+        self.countdown_label.opacity = 1
 
-        self.result_popup.bind(pos=_upd_res, size=_upd_res)
-        self.result_popup.open()
+    def hide_countdown(self) -> None:
+        """
+        Hide the countdown to the next scheduled race.
+        """
+        if self.countdown_label is not None:
+            self.countdown_label.opacity = 0
+
+    @staticmethod
+    def _make_error_label(width: float) -> CachedLabel:
+        """
+        Create a hidden red error label.
+
+        Args:
+            width (float): Label width in pixels.
+
+        Returns:
+            CachedLabel: The new label.
+        """
+        return CachedLabel(
+            text="", color=(1, 0, 0, 1), font_size="18sp",
+            font_name="Arcade", size_hint=(None, None), size=(width, 30),
+            opacity=0, halign="center", valign="middle"
+        )
 
     def show_bet_error(self, msg: str) -> None:
         """
@@ -864,9 +1322,9 @@ class GameView(FloatLayout):
         Args:
             msg (str): Error message to display.
         """
-        if not self._bet_error_added:
+        if self.bet_error_label is None:
+            self.bet_error_label = self._make_error_label(400)
             Window.add_widget(self.bet_error_label)
-            self._bet_error_added = True
 
         self.bet_error_label.text = msg
         self.bet_error_label.opacity = 1
@@ -886,23 +1344,20 @@ class GameView(FloatLayout):
         self.bet_error_label.opacity = 0
         self.bet_error_label.text = ""
 
-    def show_deposit_popup(self) -> None:
+    def _build_deposit_popup(self) -> None:
         """
-        Display a popup allowing the user to enter an amount to deposit.
+        Build the deposit popup once; later opens only reset the input and texts.
         """
-        if self.pop_snd and not self.sounds_muted:
-            self.pop_snd.stop(); self.pop_snd.play()
-
         content = BoxLayout(orientation="vertical", padding=15, spacing=15)
-        content.add_widget(Label(
-            text=self.lang.get("enter_deposit"),
+        self._deposit_prompt = CachedLabel(
             color=(0, 0, 0, 1),
             font_size="20sp",
             font_name="Arcade",
             size_hint=(1, 0.2),
             halign="center",
             valign="middle"
-        ))
+        )
+        content.add_widget(self._deposit_prompt)
 
         self.deposit_input = TextInput(
             text="10",
@@ -928,26 +1383,7 @@ class GameView(FloatLayout):
         content.add_widget(self.deposit_input)
 
         row = BoxLayout(size_hint=(1, 0.3), spacing=20)
-        add_btn = Button(
-            text=self.lang.get("add"),
-            color=(1, 1, 1, 1),
-            background_normal="assets/images/texture10.png",
-            background_down="assets/images/texture12.png",
-            font_size="20sp",
-            font_name="Arcade",
-            size_hint=(0.45, 1)
-        )
-        with add_btn.canvas.after:
-            Color(0, 0, 0, 1)
-            ao = Line(rectangle=(0, 0, 0, 0), width=2)
-
-        def _ua(*_):
-            ao.rectangle = (*add_btn.pos, *add_btn.size)
-
-        add_btn.bind(pos=_ua, size=_ua)
-
-        cancel_btn = Button(
-            text=self.lang.get("cancel"),
+        btn_kwargs = dict(
             color=(1, 1, 1, 1),
             background_normal="assets/images/texture10.png",
             background_down="assets/images/texture12.png",
@@ -955,59 +1391,34 @@ class GameView(FloatLayout):
             font_name="Arcade",
             size_hint=(0.45, 1)
         )
-        with cancel_btn.canvas.after:
-            Color(0, 0, 0, 1)
-            co = Line(rectangle=(0, 0, 0, 0), width=2)
-
-        def _uc(*_):
-            co.rectangle = (*cancel_btn.pos, *cancel_btn.size)
-
-        cancel_btn.bind(pos=_uc, size=_uc)
-
-        row.add_widget(add_btn)
-        row.add_widget(cancel_btn)
+        self._deposit_add_btn = CachedButton(**btn_kwargs)
+        self._deposit_cancel_btn = CachedButton(**btn_kwargs)
+        for btn in (self._deposit_add_btn, self._deposit_cancel_btn):
+            self._add_border(btn)
+            row.add_widget(btn)
         content.add_widget(row)
 
-        self._deposit_popup = Popup(
-            title=self.lang.get("deposit"),
-            title_font="assets/fonts/arcade.ttf",
-            title_size="26sp",
-            title_align="center",
-            title_color=(1, 1, 1, 1),
-            content=content,
-            size_hint=(None, None),
-            size=(550, 350),
-            background="assets/images/texture5.png",
-            border=(0, 0, 0, 0),
-            separator_height=0,
-            auto_dismiss=False
-        )
+        self._deposit_add_btn.bind(on_release=lambda *_: (self._play_click(), self._on_deposit_add()))
+        self._deposit_cancel_btn.bind(on_release=lambda *_: (self._play_click(), self._on_deposit_cancel()))
 
-        add_btn.bind(on_release=lambda *_: (self._play_click(), self._on_deposit_add()))
-        cancel_btn.bind(on_release=lambda *_: (self._play_click(), self._on_deposit_cancel()))
-
-        with self._deposit_popup.canvas.after:
-            Color(0, 0, 0, 1)
-            outline = Line(
-                rectangle=(
-                    self._deposit_popup.x,
-                    self._deposit_popup.y,
-                    self._deposit_popup.width,
-                    self._deposit_popup.height
-                ),
-                width=2
-            )
+        self.lang.bind(self._deposit_prompt, "enter_deposit")
+        self.lang.bind(self._deposit_add_btn, "add")
+        self.lang.bind(self._deposit_cancel_btn, "cancel")
 
-        def _ud(*_):
-            outline.rectangle = (
-                self._deposit_popup.x,
-                self._deposit_popup.y,
-                self._deposit_popup.width,
-                self._deposit_popup.height
-            )
+        self._deposit_popup = self._make_popup("", content, (550, 350))
+        self.lang.bind(self._deposit_popup, "deposit", attr="title")
+        self._pin_popup_assets(self._deposit_popup)
+
+    def show_deposit_popup(self) -> None:
+        """
+        Display a popup allowing the user to enter an amount to deposit.
+        """
+        self.effects.play("pop")
 
-        self._deposit_popup.bind(pos=_ud, size=_ud)
-        self._deposit_popup.open()
+        if self._deposit_popup is None:
+            self._build_deposit_popup()
+        self.deposit_input.text = "10"
+        self._open_popup(self._deposit_popup)
 
     def _on_deposit_add(self) -> None:
         """
@@ -1026,7 +1437,6 @@ class GameView(FloatLayout):
         """
         if self._deposit_popup:
             self._deposit_popup.dismiss()
-            self._deposit_popup = None
 
     def dismiss_deposit_popup(self) -> None:
         """
@@ -1034,7 +1444,6 @@ class GameView(FloatLayout):
         """
         if self._deposit_popup:
             self._deposit_popup.dismiss()
-            self._deposit_popup = None
 
     def show_deposit_error(self, msg: str) -> None:
         """
@@ -1043,20 +1452,20 @@ class GameView(FloatLayout):
         Args:
             msg (str): Error message to display.
         """
-        if not hasattr(self, "_error_added"):
+        if self.deposit_error_label is None:
+            self.deposit_error_label = self._make_error_label(500)
             Window.add_widget(self.deposit_error_label)
-            self._error_added = True
 
         self.deposit_error_label.text = msg
         self.deposit_error_label.opacity = 1
 
-        if self._deposit_popup:
+        if self._is_popup_open(self._deposit_popup):
             px, py = self._deposit_popup.pos
             pw, ph = self._deposit_popup.size
             lw, lh = self.deposit_error_label.size
             self.deposit_error_label.pos = (px + (pw - lw)/2, py - (lh + 15))
 
-        if hasattr(self, "_deposit_error_timer") and self._deposit_error_timer:
+        if self._deposit_error_timer:
             Clock.unschedule(self._deposit_error_timer)
         self._deposit_error_timer = Clock.schedule_once(self._hide_deposit_error, 2)
 
@@ -1080,8 +1489,7 @@ class GameView(FloatLayout):
         )
 
         def _on_tut(*_):
-            if self.pop_snd and not self.sounds_muted:
-                self.pop_snd.stop(); self.pop_snd.play()
+            self.effects.play("pop")
             self._start_tutorial()
 
         self.tutorial_btn.bind(on_release=_on_tut)
@@ -1093,177 +1501,121 @@ class GameView(FloatLayout):
         """
         self._tutorial_step = 1
         self._show_tutorial_step()
+        self._open_popup(self._tutorial_popup)
 
-    def _show_tutorial_step(self) -> None:
+    def _build_tutorial_popup(self) -> None:
         """
-        Display the current tutorial popup and highlight relevant widgets.
+        Build the tutorial popup, background overlay and highlight frame once;
+        stepping through the tutorial only updates them.
         """
-        # Dismiss previous overlays
-        if self._tutorial_popup:
-            self._tutorial_popup.dismiss()
-            self._tutorial_popup = None
-        if self.highlight_widget:
-            self.remove_widget(self.highlight_widget)
-            self.highlight_widget = None
-
-        # Create or update overlay darkening the background
-        if not self._tutorial_overlay:
-            overlay = Widget()
-            with overlay.canvas:
-                Color(0, 0, 0, 0.7)
-                self._tutorial_rect = Rectangle(
-                    pos=(0, self.control_panel.height),
-                    size=(Window.width, Window.height - self.control_panel.height)
-                )
-            def _ro(*_):
-                self._tutorial_rect.pos = (0, self.control_panel.height)
-                self._tutorial_rect.size = (Window.width, Window.height - self.control_panel.height)
-            Window.bind(size=_ro)
-            self.control_panel.bind(size=_ro)
-            self.add_widget(overlay)
-            self._tutorial_overlay = overlay
-        else:
-            self._tutorial_rect.pos = (0, self.control_panel.height)
-            self._tutorial_rect.size = (Window.width, Window.height - self.control_panel.height)
-
-        # Define tutorial texts
-        steps = {
-            1: self.lang.get("tutorial_step1"),
-            2: self.lang.get("tutorial_step2"),
-            3: self.lang.get("tutorial_step3"),
-            4: self.lang.get("tutorial_step4"),
-            5: self.lang.get("tutorial_step5"),
-        }
-        text = steps.get(self._tutorial_step, "")
-
-        # Optionally highlight controls
-        highlight_map = {
-            2: [self.balance_label],
-            3: [self.bet_input],
-            4: [self.deposit_btn],
-            5: self.horse_buttons
-        }
-        if self._tutorial_step in highlight_map:
-            targets = highlight_map[self._tutorial_step]
-            min_x = min(w.x for w in targets)
-            min_y = min(w.y for w in targets)
-            max_x = max(w.x + w.width for w in targets)
-            max_y = max(w.y + w.height for w in targets)
-            hw = Widget()
-            with hw.canvas.after:
-                Color(1, 0, 0, 1)
-                ln = Line(rectangle=(min_x, min_y, max_x-min_x, max_y-min_y), width=2)
-            def _sr(*_):
-                nx = min(w.x for w in targets)
-                ny = min(w.y for w in targets)
-                mx = max(w.x + w.width for w in targets)
-                my = max(w.y + w.height for w in targets)
-                ln.rectangle = (nx, ny, mx-nx, my-ny)
-            for w in targets:
-                w.bind(pos=_sr, size=_sr)
-            self.highlight_widget = hw
-            self.add_widget(self.highlight_widget)
-
-        # Build popup content
         content = BoxLayout(orientation="vertical", padding=15, spacing=10)
-        content.add_widget(Label(
-            text=text, color=(0, 0, 0, 1),
+        self._tutorial_label = CachedLabel(
+            color=(0, 0, 0, 1),
             font_size="16sp", font_name="Arcade",
             size_hint=(1, 0.6), halign="left", valign="middle"
-        ))
+        )
+        content.add_widget(self._tutorial_label)
 
         btn_row = BoxLayout(size_hint=(1, 0.4), spacing=20)
-        prev_btn = Button(
-            text=self.lang.get("previous"),
-            size_hint=(0.1,1),
-            font_size="18sp", font_name="Arcade",
-            background_normal="assets/images/texture10.png",
-            background_down="assets/images/texture12.png",
-            color=(1,1,1,1)
-        )
-        with prev_btn.canvas.after:
-            Color(0,0,0,1)
-            po = Line(rectangle=(0,0,0,0), width=2)
-        def _up(*_):
-            po.rectangle = (*prev_btn.pos, *prev_btn.size)
-        prev_btn.bind(pos=_up, size=_up)
-        prev_btn.disabled = (self._tutorial_step == 1)
-        prev_btn.bind(on_release=lambda *_: (self._play_click(), self._step_previous()))
-
-        next_btn = Button(
-            text=self.lang.get("next"),
-            size_hint=(0.1,1),
-            font_size="18sp", font_name="Arcade",
-            background_normal="assets/images/texture10.png",
-            background_down="assets/images/texture12.png",
-            color=(1,1,1,1)
-        )
-        with next_btn.canvas.after:
-            Color(0,0,0,1)
-            no = Line(rectangle=(0,0,0,0), width=2)
-        def _un(*_):
-            no.rectangle = (*next_btn.pos, *next_btn.size)
-        next_btn.bind(pos=_un, size=_un)
-        next_btn.disabled = (self._tutorial_step == len(steps))
-        next_btn.bind(on_release=lambda *_: (self._play_click(), self._step_next()))
-
-        cancel_btn = Button(
-            text=self.lang.get("cancel"),
-            size_hint=(0.1,1),
+        btn_kwargs = dict(
+            size_hint=(0.1, 1),
             font_size="18sp", font_name="Arcade",
             background_normal="assets/images/texture10.png",
             background_down="assets/images/texture12.png",
-            color=(1,1,1,1)
+            color=(1, 1, 1, 1)
         )
-        with cancel_btn.canvas.after:
-            Color(0,0,0,1)
-            co = Line(rectangle=(0,0,0,0), width=2)
-        def _uc(*_):
-            co.rectangle = (*cancel_btn.pos, *cancel_btn.size)
-        cancel_btn.bind(pos=_uc, size=_uc)
-        cancel_btn.bind(on_release=lambda *_: (self._play_click(), self._end_tutorial()))
-
-        btn_row.add_widget(prev_btn)
-        btn_row.add_widget(next_btn)
-        btn_row.add_widget(cancel_btn)
+        self._tutorial_prev_btn = CachedButton(**btn_kwargs)
+        self._tutorial_next_btn = CachedButton(**btn_kwargs)
+        self._tutorial_cancel_btn = CachedButton(**btn_kwargs)
+        for btn in (self._tutorial_prev_btn, self._tutorial_next_btn, self._tutorial_cancel_btn):
+            self._add_border(btn)
+            btn_row.add_widget(btn)
         content.add_widget(btn_row)
 
-        self._tutorial_popup = Popup(
-            title=f"{self.lang.get('tutorial')} - {self._tutorial_step}/{len(steps)}",
-            title_font="assets/fonts/arcade.ttf",
-            title_size="24sp",
-            title_align="center",
-            title_color=(1,1,1,1),
-            content=content,
-            size_hint=(None,None),
-            size=(670,350),
-            background="assets/images/texture5.png",
-            overlay_color=(0,0,0,0),
-            border=(0,0,0,0),
-            separator_height=0,
-            auto_dismiss=False
+        self._tutorial_prev_btn.bind(on_release=lambda *_: (self._play_click(), self._step_previous()))
+        self._tutorial_next_btn.bind(on_release=lambda *_: (self._play_click(), self._step_next()))
+        self._tutorial_cancel_btn.bind(on_release=lambda *_: (self._play_click(), self._end_tutorial()))
+        self.lang.bind(self._tutorial_prev_btn, "previous")
+        self.lang.bind(self._tutorial_next_btn, "next")
+        self.lang.bind(self._tutorial_cancel_btn, "cancel")
+
+        self._tutorial_popup = self._make_popup(
+            "", content, (670, 350), title_size="24sp", overlay_color=(0, 0, 0, 0)
         )
+        self._pin_popup_assets(self._tutorial_popup)
 
-        with self._tutorial_popup.canvas.after:
-            Color(0,0,0,1)
-            outline = Line(
-                rectangle=(
-                    self._tutorial_popup.x,
-                    self._tutorial_popup.y,
-                    self._tutorial_popup.width,
-                    self._tutorial_popup.height
-                ),
-                width=2
-            )
-        self._tutorial_popup.bind(
-            pos=lambda *_: setattr(outline, 'rectangle', 
-                                   (self._tutorial_popup.x, self._tutorial_popup.y,
-                                    self._tutorial_popup.width, self._tutorial_popup.height)),
-            size=lambda *_: setattr(outline, 'rectangle', 
-                                    (self._tutorial_popup.x, self._tutorial_popup.y,
-                                     self._tutorial_popup.width, self._tutorial_popup.height))
+        # Overlay darkening the background above the control panel
+        self._tutorial_overlay = Widget()
+        with self._tutorial_overlay.canvas:
+            Color(0, 0, 0, 0.7)
+            self._tutorial_rect = Rectangle()
+        Window.bind(size=self._sync_tutorial_overlay)
+        self.control_panel.bind(size=self._sync_tutorial_overlay)
+
+        # Red frame around the controls explained by the current step
+        self.highlight_widget = Widget()
+        with self.highlight_widget.canvas.after:
+            Color(1, 0, 0, 1)
+            self._highlight_line = Line(rectangle=(0, 0, 0, 0), width=2)
+        self._highlight_targets = []
+        for w in [self.balance_label, self.bet_input, self.deposit_btn] + self.horse_buttons:
+            w.bind(pos=self._sync_tutorial_highlight, size=self._sync_tutorial_highlight)
+
+    def _sync_tutorial_overlay(self, *_) -> None:
+        """
+        Resize the tutorial overlay to cover everything above the control panel.
+        """
+        self._tutorial_rect.pos = (0, self.control_panel.height)
+        self._tutorial_rect.size = (Window.width, Window.height - self.control_panel.height)
+
+    def _sync_tutorial_highlight(self, *_) -> None:
+        """
+        Fit the tutorial highlight frame around the current step's targets.
+        """
+        targets = self._highlight_targets
+        if not targets:
+            return
+        min_x = min(w.x for w in targets)
+        min_y = min(w.y for w in targets)
+        max_x = max(w.x + w.width for w in targets)
+        max_y = max(w.y + w.height for w in targets)
+        self._highlight_line.rectangle = (min_x, min_y, max_x - min_x, max_y - min_y)
+
+    def _show_tutorial_step(self) -> None:
+        """
+        Update the tutorial popup for the current step and highlight relevant widgets.
+        """
+        if self._tutorial_popup is None:
+            self._build_tutorial_popup()
+
+        if self._tutorial_overlay.parent is None:
+            self.add_widget(self._tutorial_overlay)
+        self._sync_tutorial_overlay()
+
+        step, steps = self._tutorial_step, self.TUTORIAL_STEPS
+
+        # Optionally highlight controls
+        highlight_map = {
+            2: [self.balance_label],
+            3: [self.bet_input],
+            4: [self.deposit_btn],
+            5: self.horse_buttons
+        }
+        self._highlight_targets = highlight_map.get(step, [])
+        if self._highlight_targets:
+            self._sync_tutorial_highlight()
+            if self.highlight_widget.parent is None:
+                self.add_widget(self.highlight_widget)
+        elif self.highlight_widget.parent is not None:
+            self.remove_widget(self.highlight_widget)
+
+        self.lang.bind(self._tutorial_label, f"tutorial_step{step}")
+        self.lang.bind(
+            self._tutorial_popup, "tutorial", attr="title",
+            compose=lambda s: f"{s} - {step}/{steps}"
         )
-        self._tutorial_popup.open()
+        self._tutorial_prev_btn.disabled = (step == 1)
+        self._tutorial_next_btn.disabled = (step == steps)
 
     def _step_previous(self) -> None:
         """
@@ -1277,8 +1629,7 @@ class GameView(FloatLayout):
         """
         Move to the next tutorial step.
         """
-        steps = 5
-        if self._tutorial_step < steps:
+        if self._tutorial_step < self.TUTORIAL_STEPS:
             self._tutorial_step += 1
             self._show_tutorial_step()
 
@@ -1288,30 +1639,8 @@ class GameView(FloatLayout):
         """
         if self._tutorial_popup:
             self._tutorial_popup.dismiss()
-            self._tutorial_popup = None
-        if self._tutorial_overlay:
+        if self._tutorial_overlay and self._tutorial_overlay.parent is not None:
             self.remove_widget(self._tutorial_overlay)
-            self._tutorial_overlay = None
-            self._tutorial_rect = None
-        if self.highlight_widget:
+        if self.highlight_widget and self.highlight_widget.parent is not None:
             self.remove_widget(self.highlight_widget)
-            self.highlight_widget = None
-
-    def update_ui_texts(self) -> None:
-        """
-        Refresh all UI text elements when the language changes.
-        """
-        self.bet_amount_label.text = self.lang.get("bet_amount")
-        self.deposit_btn.text = self.lang.get("deposit")
-        try:
-            bal = self.controller.model.balance
-        except Exception:
-            bal = 0
-        self.update_balance(bal)
-
-        if self._deposit_popup:
-            self._deposit_popup.dismiss()
-            self.show_deposit_popup()
-
-        if self._tutorial_popup:
-            self._show_tutorial_step()
+        self._highlight_targets = []